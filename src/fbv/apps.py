@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class Config(AppConfig):
+    name = "fbv"
+
+    def ready(self):
+        import fbv.checks  # noqa: F401, PLC0415
@@ -0,0 +1,64 @@
+from django.core import checks
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+
+from fbv.decorators import _template_views, get_default_template_name
+from fbv.utils import iter_url_patterns
+
+
+@checks.register(checks.Tags.templates)
+def check_render_view_templates(app_configs, **kwargs):  # noqa: ARG001
+    """
+    Checks that the templates for views decorated with `render_view` (or `render_html`) exist.
+
+    A missing template that was passed into the decorator is an error. A missing default template
+    is only a warning because the view might always return a `TEMPLATE` key instead.
+    """
+
+    from fbv.views import html_view  # noqa: PLC0415
+
+    try:
+        # Import the URLconf so that all views decorated with `render_view` are registered
+        list(iter_url_patterns())
+    except Exception:  # noqa: S110
+        # Problems with the URLconf are reported by Django's own URL checks
+        pass
+
+    errors = []
+
+    for func, template_name in list(_template_views.items()):
+        # `html_view` always gets its template name from `urls.py`
+        if func is html_view.__wrapped__:
+            continue
+
+        view_name = f"{func.__module__}.{func.__qualname__}"
+
+        if template_name is not None:
+            try:
+                get_template(template_name)
+            except TemplateDoesNotExist:
+                errors.append(
+                    checks.Error(
+                        f"The template '{template_name}' for '{view_name}' does not exist.",
+                        obj=func,
+                        id="fbv.E001",
+                    )
+                )
+
+            continue
+
+        default_template_name = get_default_template_name(func)
+
+        try:
+            get_template(default_template_name)
+        except TemplateDoesNotExist:
+            errors.append(
+                checks.Warning(
+                    f"The default template '{default_template_name}' for '{view_name}' does not exist.",
+                    hint="Add the template or return a `TEMPLATE` key from the view.",
+                    obj=func,
+                    id="fbv.W001",
+                )
+            )
+
+    return errors
@@ -0,0 +1,139 @@
+import datetime as dt
+from collections.abc import Callable
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.http import HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, set_response_etag
+from django.utils.http import http_date, quote_etag
+
+__all__ = [
+    "aget_validators",
+    "get_validators",
+    "not_modified_response",
+    "set_validators",
+]
+
+
+def _to_validators(etag: str | None, last_modified: dt.datetime | None) -> tuple[str | None, int | None]:
+    # Follows `django.views.decorators.http.condition`: unquoted ETags become strong ETags and naive
+    # datetimes are assumed to be UTC
+    if etag is not None:
+        etag = quote_etag(etag)
+
+    timestamp = None
+
+    if last_modified is not None:
+        if not timezone.is_aware(last_modified):
+            last_modified = timezone.make_aware(last_modified, dt.timezone.utc)
+
+        timestamp = int(last_modified.timestamp())
+
+    return (etag, timestamp)
+
+
+def get_validators(
+    request,
+    context,
+    *,
+    etag: bool | Callable | None,
+    last_modified: Callable | None,
+) -> tuple[str | None, int | None]:
+    """
+    Returns the ETag and Last-Modified timestamp from the functions that get passed the request and the
+    output of the view. These run before the response body is built.
+
+    Args:
+        etag: function that returns an ETag (or `None`); `True` (i.e. an ETag from the response body) is ignored
+        last_modified: function that returns a `datetime` (or `None`)
+    """
+
+    return _to_validators(
+        etag(request, context) if callable(etag) else None,
+        last_modified(request, context) if last_modified is not None else None,
+    )
+
+
+async def aget_validators(
+    request,
+    context,
+    *,
+    etag: bool | Callable | None,
+    last_modified: Callable | None,
+) -> tuple[str | None, int | None]:
+    """
+    Same as `get_validators`, but `async` functions are awaited and sync functions are run in a thread
+    because they will usually query the database.
+    """
+
+    async def call(func):
+        if iscoroutinefunction(func):
+            return await func(request, context)
+
+        return await sync_to_async(func)(request, context)
+
+    return _to_validators(
+        await call(etag) if callable(etag) else None,
+        await call(last_modified) if last_modified is not None else None,
+    )
+
+
+def not_modified_response(request, etag: str | None, last_modified: int | None) -> HttpResponse | None:
+    """
+    Returns a 304 (or 412) response if the request's conditional headers match the validators, otherwise `None`.
+    """
+
+    if etag is None and last_modified is None:
+        return None
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    if response is not None:
+        _add_headers(request, response, etag, last_modified)
+
+    return response
+
+
+def set_validators(
+    request,
+    response: HttpResponseBase,
+    etag: str | None,
+    last_modified: int | None,
+    *,
+    content_etag: bool = False,
+) -> HttpResponseBase:
+    """
+    Adds the ETag and Last-Modified headers to the response.
+
+    When `content_etag` is `True` and there isn't an ETag yet, a strong ETag is computed from the body
+    of the response (unless it is streamed) and the request's conditional headers are checked against it,
+    which can still turn the response into a 304.
+    """
+
+    if not (200 <= response.status_code < 300):  # noqa: PLR2004
+        return response
+
+    if content_etag and etag is None and isinstance(response, HttpResponse) and not response.has_header("ETag"):
+        set_response_etag(response)
+        etag = response.get("ETag")
+
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified, response=response)
+
+        if not_modified is not None:
+            response = not_modified
+
+    _add_headers(request, response, etag, last_modified)
+
+    return response
+
+
+def _add_headers(request, response, etag: str | None, last_modified: int | None) -> None:
+    if request.method not in ("GET", "HEAD"):
+        return
+
+    if last_modified and not response.has_header("Last-Modified"):
+        response.headers["Last-Modified"] = http_date(last_modified)
+
+    if etag:
+        response.headers.setdefault("ETag", etag)
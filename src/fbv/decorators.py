@@ -1,25 +1,220 @@
+import hashlib
 import json
-from collections.abc import Callable
-from functools import partial, wraps
+from collections.abc import AsyncIterator, Callable, Iterator
+from functools import cache, partial, wraps
+from itertools import islice
 from os.path import join
-
-from django.core import serializers
+from typing import Any
+from weakref import WeakKeyDictionary
+
+import django
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
 from django.db import models
-from django.http import JsonResponse
+from django.db.models import prefetch_related_objects
+from django.db.models.query import ModelIterable
+from django.dispatch import receiver
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import render
+from django.template.loader import get_template
+from django.utils.module_loading import import_string
+from django.utils.translation import get_language
+
+from fbv.conditional import aget_validators, get_validators, not_modified_response, set_validators
+from fbv.encoders import (  # noqa: F401 (the separators used to be defined here)
+    DEFAULT_JSON_SEPARATORS,
+    MINIFIED_JSON_SEPARATORS,
+    get_json_encoder,
+)
+from fbv.pagination import DEFAULT_CURSOR_PARAM, KeysetPagination
+from fbv.queries import MAX_QUERIES_ACTIONS, get_query_budget
+from fbv.serializers import (
+    get_field_plan,
+    get_row_serializer,
+    get_values_names,
+    is_values_list_queryset,
+    optimize_queryset,
+    serialize_model,
+    serialize_queryset,
+)
+from fbv.streaming import astream_template, stream_template
+from fbv.timing import NULL_TIMER, Timer, get_timer
 
 __all__ = [
+    "get_default_template_name",
+    "module_template_name",
     "render_html",
     "render_json",
     "render_view",
 ]
 
 
-DEFAULT_JSON_SEPARATORS = (", ", ": ")
-MINIFIED_JSON_SEPARATORS = (",", ":")
+DEFAULT_STREAM_CHUNK_SIZE = 2000
+CACHE_VARY_ON = ("user", "language")
+JSON_RENDERABLE_TYPES = (models.Model, models.QuerySet, dict, list)
+
+
+# The views decorated with `render_view` mapped to the template name passed into the decorator
+_template_views: WeakKeyDictionary[Callable, str | None] = WeakKeyDictionary()
+
+
+def _add_template_extension(template_name: str) -> str:
+    # If there does not appear to be an extension for the template name, ".html" gets appended
+    if "." not in template_name:
+        return f"{template_name}.html"
+
+    return template_name
+
+
+def module_template_name(func: Callable) -> str:
+    """
+    Returns the template name for a view based on its module and function name.
+
+    For example, `sample_app.views.derived_template` would be `sample_app/derived_template`
+    and `sample_app.views.example.derived_template` would be `sample_app/example/derived_template`.
+    """
+
+    module_name = func.__module__
+    template_dir = module_name
+
+    module_names = module_name.split(".")
+
+    if len(module_names) > 2:  # noqa: PLR2004
+        template_dir = join(*[m for m in module_names if m != "views"])
+    elif len(module_names) > 1:
+        template_dir = join(*module_names[:-1])
+
+    function_name = func.__name__
+
+    return join(template_dir, f"{function_name}")
+
+
+@cache
+def get_default_template_name(func: Callable) -> str:
+    """
+    Returns the template name for a view that doesn't specify one.
+
+    The template name is built with the function set in the `FBV_TEMPLATE_NAME_RESOLVER` setting
+    (either a callable or its dotted import path), which gets passed the view function.
+    Defaults to `module_template_name`. The template name is cached for each view.
+    """
+
+    resolver = getattr(settings, "FBV_TEMPLATE_NAME_RESOLVER", None) or module_template_name
+
+    if isinstance(resolver, str):
+        resolver = import_string(resolver)
+
+    return _add_template_extension(resolver(func))
+
+
+@receiver(setting_changed)
+def _clear_default_template_names_on_setting_changed(sender, setting, **kwargs):  # noqa: ARG001
+    if setting == "FBV_TEMPLATE_NAME_RESOLVER":
+        get_default_template_name.cache_clear()
+
+
+def _get_hash_rows(queryset: models.QuerySet) -> list:
+    # The rows are cached on the `QuerySet`, so the template doesn't query them again, and many-to-many
+    # fields are prefetched on them so hashing doesn't run a query for every row
+    rows = list(queryset)
+
+    if rows and issubclass(queryset._iterable_class, ModelIterable):  # type: ignore[attr-defined]
+        m2m_fields = get_field_plan(queryset.model).m2m_fields
+        prefetch_related_objects(rows, *[field.name for field in m2m_fields])
+
+    return rows
+
+
+class _ContextHashEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        if isinstance(o, models.Model):
+            return serialize_model(o)
+
+        if isinstance(o, models.QuerySet):
+            return serialize_queryset(o, rows=_get_hash_rows(o))
+
+        return super().default(o)
+
+
+def _get_render_cache_key(
+    request,
+    template_name: str,
+    context: dict,
+    vary_on: tuple[str, ...],
+) -> str:
+    """
+    Returns the default cache key for a rendered template: the template name, a hash of the context,
+    and the values it varies on.
+
+    `Model` and `QuerySet` objects in the context are hashed with their serialized fields. Any other objects
+    that can't be encoded as JSON can't be hashed by their content, so a `cache_key` function is required.
+    """
+
+    try:
+        context_json = json.dumps(context, cls=_ContextHashEncoder, sort_keys=True, separators=(",", ":"))
+    except TypeError as e:
+        raise AssertionError(
+            f"The context for {template_name} can't be hashed for the cache key ({e}); pass a `cache_key` function."
+        ) from e
+    context_hash = hashlib.md5(context_json.encode(), usedforsecurity=False).hexdigest()
+
+    key = f"fbv.render_view:{template_name}:{context_hash}"
+
+    for vary in vary_on:
+        if vary == "user":
+            user = getattr(request, "user", None)
+            key += f":user={user.pk if user is not None and user.is_authenticated else ''}"
+        elif vary == "language":
+            key += f":language={get_language()}"
+
+    return key
+
+
+def _render_template(request, template_name: str, context: dict, content_type: str | None, timer: Timer):
+    """
+    Renders the template like `django.shortcuts.render`, but times finding the template and rendering it
+    separately when timing is turned on.
+    """
+
+    if not timer.enabled:
+        return render(request, template_name, context, content_type=content_type)
+
+    template = get_template(template_name)
+    timer.mark("template")
+
+    content = template.render(context, request)
+    timer.mark("render")
+
+    return HttpResponse(content, content_type=content_type)
+
+
+def _stream_template(
+    request,
+    template_name: str,
+    context: dict,
+    content_type: str | None,
+    timer: Timer,
+    *,
+    is_async: bool = False,
+):
+    """
+    Returns a `StreamingHttpResponse` that renders the template one top-level node or block at a time.
+
+    The template is found before the response is returned, so a missing template still raises in the view.
+    """
+
+    template = get_template(template_name)
+    timer.mark("template")
+
+    streaming_content = (astream_template if is_async else stream_template)(template, context, request)
 
+    return StreamingHttpResponse(streaming_content, content_type=content_type)
 
-def render_html(template_name: str | None = None) -> Callable:
+
+def render_html(template_name: str | None = None, **options) -> Callable:
     """
     Decorator for function-based views that renders the passed-in template
     with the returned dictionary.
@@ -31,17 +226,29 @@ def render_html(template_name: str | None = None) -> Callable:
 
     Args:
         template_name: template name to use
-        content_type: content type to send in response headers
+        options: any other kwargs for `render_view`, e.g. `cache`
 
     Returns:
         A `HttpResponse` or the output of the function if the output
         of the function is not a `dictionary`.
     """
 
-    return render_view(template_name=template_name, content_type=None)
+    return render_view(template_name=template_name, content_type=None, **options)
 
 
-def render_view(template_name: str | None = None, content_type: str | None = None) -> Callable:
+def render_view(
+    template_name: str | None = None,
+    content_type: str | None = None,
+    *,
+    cache: int | None = None,
+    cache_key: Callable | None = None,
+    cache_alias: str = DEFAULT_CACHE_ALIAS,
+    cache_vary_on: tuple[str, ...] = (),
+    etag: bool | Callable | None = None,
+    last_modified: Callable | None = None,
+    timing: bool | None = None,
+    stream: bool = False,
+) -> Callable:
     """
     Decorator for function-based views that renders the passed-in template
     with the returned dictionary.
@@ -51,11 +258,27 @@ def render_view(template_name: str | None = None, content_type: str | None = Non
 
     If there does not appear to be an extension for the template name, ".html" will be appended.
 
+    If there is no template name, `get_default_template_name` is used to derive one from the view.
+
     If view doesn't return a `dictionary` then the function output is returned.
 
+    `async` views are supported.
+
     Args:
         template_name: template name to use
         content_type: content type to send in response headers
+        cache: cache the rendered content for this many seconds
+        cache_key: function that gets passed the request, template name and context and returns the cache key;
+            defaults to the template name and a hash of the context
+        cache_alias: the Django cache to store the rendered content in
+        cache_vary_on: tuple of "user" and/or "language" to also vary the default cache key on
+        etag: `True` to compute a strong ETag from the rendered content or a function that gets passed the request
+            and context and returns an ETag before the template is rendered
+        last_modified: function that gets passed the request and context and returns the `datetime` the content
+            was last modified before the template is rendered
+        timing: record how long each phase takes; defaults to the `FBV_TIMING` setting
+        stream: send each top-level node and block of the template as soon as it is rendered in a
+            `StreamingHttpResponse`; can't be used with `cache` or `etag=True`
 
     Returns:
         A `HttpResponse` or the output of the function if the output
@@ -68,58 +291,462 @@ def render_view(template_name: str | None = None, content_type: str | None = Non
         template_name = None
         return render_view()(func)
 
+    if template_name is not None:
+        template_name = _add_template_extension(template_name)
+
+    for vary in cache_vary_on:
+        if vary not in CACHE_VARY_ON:
+            raise ValueError(f"Unknown cache_vary_on value: {vary}")
+
+    if stream and (cache is not None or etag is True):
+        raise AssertionError("`stream=True` can't be used with `cache` or `etag=True`.")
+
+    def render_cached(request, _template_name, context, timer):
+        if cache_key is None:
+            key = _get_render_cache_key(request, _template_name, context, cache_vary_on)
+        else:
+            key = cache_key(request, _template_name, context)
+
+        response_cache = caches[cache_alias]
+        cached = response_cache.get(key)
+        timer.mark("cache")
+
+        if cached is not None:
+            (content, cached_content_type) = cached
+
+            return HttpResponse(content, content_type=cached_content_type)
+
+        response = _render_template(request, _template_name, context, content_type, timer)
+        response_cache.set(key, (response.content, response["Content-Type"]), cache)
+        timer.mark("cache")
+
+        return response
+
+    is_conditional = bool(etag or last_modified)
+
     def decorator(func):
+        def get_template_name(context):
+            _template_name = context.pop("TEMPLATE", None)
+
+            if _template_name is not None:
+                return _add_template_extension(_template_name)
+
+            if template_name is not None:
+                return template_name
+
+            return get_default_template_name(func)
+
+        def render_context(request, _template_name, context, validators, timer, *, is_async=False):
+            if validators is not None:
+                timer.mark("validators")
+                not_modified = not_modified_response(request, *validators)
+
+                if not_modified is not None:
+                    return not_modified
+
+            if stream:
+                response = _stream_template(request, _template_name, context, content_type, timer, is_async=is_async)
+            elif cache is not None:
+                response = render_cached(request, _template_name, context, timer)
+            else:
+                response = _render_template(request, _template_name, context, content_type, timer)
+
+            if validators is not None:
+                response = set_validators(request, response, *validators, content_etag=etag is True)
+
+            return response
+
+        _template_views[func] = template_name
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(request, *args, **kwargs):
+                timer = get_timer(timing=timing)
+                context = await func(request, *args, **kwargs)
+                timer.mark("view")
+
+                if not isinstance(context, dict):
+                    return timer.finish(func, request, context)
+
+                _template_name = get_template_name(context)
+                validators = None
+
+                if is_conditional:
+                    validators = await aget_validators(request, context, etag=etag, last_modified=last_modified)
+
+                # Rendering the template (and hashing the context for the cache key) can evaluate lazy `QuerySet`s
+                response = await sync_to_async(render_context)(
+                    request, _template_name, context, validators, timer, is_async=True
+                )
+
+                return timer.finish(func, request, response)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(request, *args, **kwargs):
+            timer = get_timer(timing=timing)
             context = func(request, *args, **kwargs)
+            timer.mark("view")
 
             if not isinstance(context, dict):
-                return context
+                return timer.finish(func, request, context)
 
-            _template_name = context.pop("TEMPLATE", template_name)
+            _template_name = get_template_name(context)
+            validators = None
 
-            if _template_name is None:
-                # Use a default template based on the current module and function name
-                module_name = func.__module__
-                template_dir = module_name
+            if is_conditional:
+                validators = get_validators(request, context, etag=etag, last_modified=last_modified)
 
-                module_names = module_name.split(".")
+            response = render_context(request, _template_name, context, validators, timer)
 
-                if len(module_names) > 2:  # noqa: PLR2004
-                    template_dir = join(*[m for m in module_names if m != "views"])
-                elif len(module_names) > 1:
-                    template_dir = join(*module_names[:-1])
+            return timer.finish(func, request, response)
 
-                function_name = func.__name__
-                _template_name = join(template_dir, f"{function_name}")
+        return wrapper
 
-            if "." not in _template_name:
-                _template_name = f"{_template_name}.html"
+    return decorator
 
-            return render(request, _template_name, context, content_type=content_type)
 
-        return wrapper
+def _get_stream_wrapping(
+    queryset: models.QuerySet,
+    *,
+    values_list_format: str,
+    separators: tuple[str, str],
+    encode: Callable,
+) -> tuple[list, list]:
+    """
+    Returns the chunks that go before and after the streamed rows of the `QuerySet`.
+    """
 
-    return decorator
+    if values_list_format == "columns" and is_values_list_queryset(queryset):
+        (item_separator, key_separator) = separators
 
+        prefix = [
+            '{"columns"' + key_separator,
+            encode(get_values_names(queryset), separators),
+            item_separator + '"rows"' + key_separator + "[",
+        ]
 
-def _convert_serialized_model(data: dict, fields: tuple[str] | None = None) -> dict:
+        return (prefix, ["]}"])
+
+    return (["["], ["]"])
+
+
+def _stream_queryset(
+    queryset: models.QuerySet,
+    *,
+    fields: tuple[str] | None,
+    values_list_format: str,
+    separators: tuple[str, str],
+    chunk_size: int,
+    encode: Callable,
+) -> Iterator[str | bytes]:
     """
-    Converts the Django model dictionary that gets serialized into something
-    more reasonable for external use.
+    Encodes each row of the `QuerySet` one at a time as part of a JSON array.
     """
 
-    model_data = {}
+    row_serializer = get_row_serializer(queryset, fields=fields, values_list_format=values_list_format)
+    (prefix, suffix) = _get_stream_wrapping(
+        queryset,
+        values_list_format=values_list_format,
+        separators=separators,
+        encode=encode,
+    )
 
-    if fields is None or "pk" in fields:
-        model_data["pk"] = data["pk"]
+    yield from prefix
 
-    if fields is not None and "id" in fields:
-        model_data["id"] = data["pk"]
+    for idx, row in enumerate(queryset.iterator(chunk_size=chunk_size)):
+        if idx:
+            yield separators[0]
 
-    model_data.update(data["fields"])
+        yield encode(row if row_serializer is None else row_serializer(row), separators)
 
-    return model_data
+    yield from suffix
+
+
+async def _aiterate_queryset(queryset: models.QuerySet, chunk_size: int) -> AsyncIterator:
+    """
+    Iterates over the rows of the `QuerySet` with the async ORM.
+    """
+
+    if not is_values_list_queryset(queryset):
+        async for row in queryset.aiterator(chunk_size=chunk_size):
+            yield row
+
+        return
+
+    # `ValuesListIterable.__iter__` isn't a generator, so `aiterator()` would run the query on the event loop
+    rows = queryset.iterator(chunk_size=chunk_size)
+
+    try:
+        while chunk := await sync_to_async(lambda: list(islice(rows, chunk_size)))():
+            for row in chunk:
+                yield row
+    finally:
+        await sync_to_async(rows.close)()  # type: ignore[attr-defined]
+
+
+async def _astream_queryset(
+    queryset: models.QuerySet,
+    *,
+    fields: tuple[str] | None,
+    values_list_format: str,
+    separators: tuple[str, str],
+    chunk_size: int,
+    encode: Callable,
+) -> AsyncIterator[str | bytes]:
+    """
+    Encodes each row of the `QuerySet` one at a time as part of a JSON array with the async ORM.
+    """
+
+    row_serializer = get_row_serializer(queryset, fields=fields, values_list_format=values_list_format)
+    (prefix, suffix) = _get_stream_wrapping(
+        queryset,
+        values_list_format=values_list_format,
+        separators=separators,
+        encode=encode,
+    )
+
+    for chunk in prefix:
+        yield chunk
+
+    is_first = True
+
+    async for row in _aiterate_queryset(queryset, chunk_size):
+        if not is_first:
+            yield separators[0]
+
+        is_first = False
+
+        if row_serializer is None:
+            data = row
+        elif isinstance(row, models.Model) and get_field_plan(type(row), fields).requires_queries(row):
+            # Many-to-many fields that weren't prefetched and deferred fields have to be queried with the sync ORM
+            data = await sync_to_async(row_serializer)(row)
+        else:
+            data = row_serializer(row)
+
+        yield encode(data, separators)
+
+    for chunk in suffix:
+        yield chunk
+
+
+def _get_json_separators(
+    separators: tuple[str, str] | None,
+    item_separator: str | None,
+    key_separator: str | None,
+) -> tuple[str, str]:
+    if separators is None:
+        separators = MINIFIED_JSON_SEPARATORS
+
+    if item_separator:
+        separators = (item_separator, separators[1])
+
+    if key_separator:
+        separators = (separators[0], key_separator)
+
+    return separators
+
+
+def _serialize_page(
+    queryset: models.QuerySet,
+    pagination: KeysetPagination,
+    *,
+    fields: tuple[str] | None,
+    values_list_format: str,
+):
+    """
+    Serializes one page of a paginated `QuerySet` and wraps it with the cursor for the next page.
+    """
+
+    (rows, next_cursor) = pagination.get_page(queryset)
+    results = serialize_queryset(queryset, fields=fields, values_list_format=values_list_format, rows=rows)
+
+    return pagination.envelope(results, next_cursor)
+
+
+def _render_json(
+    request,
+    context,
+    *,
+    etag: bool | Callable | None,
+    last_modified: Callable | None,
+    validators: tuple[str | None, int | None] | None = None,
+    timer: Timer = NULL_TIMER,
+    pagination: KeysetPagination | None = None,
+    **options,
+):
+    """
+    Converts the output of a view into a JSON response and handles conditional requests.
+
+    The ETag and Last-Modified functions run before the output is serialized, so a 304 response
+    skips querying and serializing entirely.
+    """
+
+    is_conditional = bool(etag or last_modified) and isinstance(context, JSON_RENDERABLE_TYPES)
+
+    if is_conditional:
+        if etag is True and options["stream"] and isinstance(context, models.QuerySet):
+            raise AssertionError("`etag=True` can't be used when streaming; pass a function instead.")
+
+        if validators is None:
+            validators = get_validators(request, context, etag=etag, last_modified=last_modified)
+
+        timer.mark("validators")
+        not_modified = not_modified_response(request, *validators)
+
+        if not_modified is not None:
+            return not_modified
+
+    if pagination is not None and isinstance(context, models.QuerySet):
+        if options["optimize"]:
+            context = optimize_queryset(context, fields=options["fields"])
+
+        context = _serialize_page(
+            pagination.paginate(request, context),
+            pagination,
+            fields=options["fields"],
+            values_list_format=options["values_list_format"],
+        )
+        options["fields"] = None
+
+    response = _build_json_response(context, timer=timer, **options)
+
+    if is_conditional:
+        response = set_validators(request, response, *validators, content_etag=etag is True)  # type: ignore[misc]
+
+    return response
+
+
+def _build_json_response(
+    context,
+    *,
+    fields: tuple[str] | None,
+    separators: tuple[str, str] | None,
+    item_separator: str | None,
+    key_separator: str | None,
+    stream: bool,
+    chunk_size: int,
+    encoder: str | Callable | None,
+    values_list_format: str,
+    optimize: bool,
+    is_async: bool = False,
+    timer: Timer = NULL_TIMER,
+):
+    """
+    Converts the output of a view into a JSON response.
+
+    Returns the output as-is if it isn't a Django `Model`, `QuerySet`, `dictionary`, or `list`.
+    """
+
+    separators = _get_json_separators(separators, item_separator, key_separator)
+
+    if optimize and isinstance(context, models.QuerySet):
+        # `QuerySet.aiterator()` doesn't support `prefetch_related()` before Django 5.0
+        prefetch = not (stream and is_async and django.VERSION < (5, 0))
+        context = optimize_queryset(context, fields=fields, prefetch=prefetch)
+
+    if stream and isinstance(context, models.QuerySet):
+        stream_queryset = _astream_queryset if is_async else _stream_queryset
+
+        return StreamingHttpResponse(
+            stream_queryset(
+                context,
+                fields=fields,
+                values_list_format=values_list_format,
+                separators=separators,
+                chunk_size=chunk_size,
+                encode=get_json_encoder(encoder),
+            ),
+            content_type="application/json",
+        )
+
+    if isinstance(context, models.Model):
+        context = serialize_model(context, fields=fields)
+    elif isinstance(context, models.QuerySet):
+        context = serialize_queryset(context, fields=fields, values_list_format=values_list_format)
+    elif fields is not None:
+        raise AssertionError("The `fields` kwarg should only be used when serializing Django models.")
+
+    if not isinstance(context, dict) and not isinstance(context, list):
+        return context
+
+    timer.mark("serialize")
+
+    # Lists are always allowed (i.e. like `JsonResponse(safe=False)`) because returning a list
+    # should be fine with modern browsers
+    content = get_json_encoder(encoder)(context, separators)
+    timer.mark("encode")
+
+    return HttpResponse(content, content_type="application/json")
+
+
+async def _arender_json(
+    request,
+    context,
+    *,
+    timer: Timer = NULL_TIMER,
+    pagination: KeysetPagination | None = None,
+    **options,
+):
+    """
+    Converts the output of an async view into a JSON response.
+
+    `QuerySet`s are evaluated with the async ORM first. Serializing only falls back to running in
+    a thread when it still needs to query the database, i.e. for many-to-many fields that were not
+    prefetched or deferred fields.
+    """
+
+    if (options["etag"] or options["last_modified"]) and isinstance(context, JSON_RENDERABLE_TYPES):
+        options["validators"] = await aget_validators(
+            request, context, etag=options["etag"], last_modified=options["last_modified"]
+        )
+        timer.mark("validators")
+        not_modified = not_modified_response(request, *options["validators"])
+
+        if not_modified is not None:
+            return not_modified
+
+    if options["stream"] and isinstance(context, models.QuerySet):
+        return _render_json(request, context, is_async=True, timer=timer, **options)
+
+    requires_queries = False
+
+    if isinstance(context, models.QuerySet):
+        if options["optimize"]:
+            context = optimize_queryset(context, fields=options["fields"])
+
+        if pagination is not None:
+            context = pagination.paginate(request, context)
+
+        rows = [row async for row in context]
+        timer.mark("serialize")
+
+        if rows and isinstance(rows[0], models.Model):
+            requires_queries = get_field_plan(type(rows[0]), options["fields"]).requires_queries(rows[0])
+
+        if pagination is not None:
+            # The page's rows were already fetched, so only serializing them might still need the sync ORM
+            serialize_page = partial(
+                _serialize_page,
+                context,
+                pagination,
+                fields=options["fields"],
+                values_list_format=options["values_list_format"],
+            )
+            context = await sync_to_async(serialize_page)() if requires_queries else serialize_page()
+            options["fields"] = None
+
+            return _render_json(request, context, timer=timer, **options)
+    elif isinstance(context, models.Model):
+        requires_queries = get_field_plan(type(context), options["fields"]).requires_queries(context)
+
+    if requires_queries:
+        return await sync_to_async(_render_json)(request, context, timer=timer, **options)
+
+    return _render_json(request, context, timer=timer, **options)
 
 
 def render_json(
@@ -129,71 +756,143 @@ def render_json(
     separators: tuple[str] | None = None,
     item_separator: str | None = None,
     key_separator: str | None = None,
+    stream: bool = False,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    encoder: str | Callable | None = None,
+    values_list_format: str = "list",
+    optimize: bool = True,
+    etag: bool | Callable | None = None,
+    last_modified: Callable | None = None,
+    timing: bool | None = None,
+    max_queries: int | None = None,
+    max_queries_action: str | None = None,
+    paginate_by: int | None = None,
+    cursor_field: str = "pk",
+    cursor_param: str = DEFAULT_CURSOR_PARAM,
+    paginate_envelope: Callable | None = None,
 ):
     """
-    Decorator for function-based views that returns `JsonResponse` with a serialized
+    Decorator for function-based views that returns a JSON `HttpResponse` with a serialized
     version of the returned Django `Model`, `QuerySet`, `dictionary`, or `list`.
 
     If the function doesn't return a `dictionary` or `list`, then the function output is returned.
 
+    `async` views are supported and a `QuerySet` they return is evaluated with the async ORM.
+
     Args:
         fields: Tuple of strings to return. Only available when Django `Model` or `QuerySet` is returned.
         separators: Tuple in the form of (), which is passed to `json.dumps` in the `separators` kwarg.
         item_separator: override the default item separator passed to `json.dumps` in the `separators` kwarg.
         key_separator: override the default key separator passed to `json.dumps` in the `separators` kwarg.
+        stream: Return a `StreamingHttpResponse` that encodes one row at a time when a `QuerySet` is returned.
+        chunk_size: The number of rows to fetch from the database at a time when streaming.
+        encoder: The JSON encoder to use: "auto", "json", "orjson", or a function. Defaults to the
+            `FBV_JSON_ENCODER` setting.
+        values_list_format: How `QuerySet.values_list()` rows are returned: "list" for positional arrays,
+            "dict" for objects keyed by column name, or "columns" for `{"columns": [...], "rows": [[...]]}`.
+        optimize: Only query the `fields` that get serialized and prefetch many-to-many fields when a `QuerySet`
+            is returned.
+        etag: `True` to compute a strong ETag from the encoded JSON or a function that gets passed the request
+            and the output of the view and returns an ETag before anything is serialized.
+        last_modified: Function that gets passed the request and the output of the view and returns the
+            `datetime` it was last modified before anything is serialized.
+        timing: Record how long each phase takes. Defaults to the `FBV_TIMING` setting.
+        max_queries: The number of queries the view and serializing its output are allowed to run. Defaults to
+            the `FBV_MAX_QUERIES` setting.
+        max_queries_action: What to do when there are more than `max_queries`: "log", "warn", or "raise". Defaults
+            to the `FBV_MAX_QUERIES_ACTION` setting.
+        paginate_by: Return pages of this many rows when a `QuerySet` is returned, starting after the cursor in
+            the request's querystring.
+        cursor_field: The field to order and paginate by; prefix it with "-" for descending order.
+        cursor_param: The querystring parameter with the cursor.
+        paginate_envelope: Function that gets passed the serialized rows of the page and the cursor for the next
+            page (or `None`) and returns the output; defaults to `{"results": [...], "next": "cursor"}`.
     """
 
+    if max_queries_action is not None and max_queries_action not in MAX_QUERIES_ACTIONS:
+        raise ValueError(f"Unknown max_queries_action value: {max_queries_action}")
+
+    if paginate_by is not None and stream:
+        raise AssertionError("`paginate_by` can't be used when streaming.")
+
+    options: dict[str, Any] = {
+        "fields": fields,
+        "separators": separators,
+        "item_separator": item_separator,
+        "key_separator": key_separator,
+        "stream": stream,
+        "chunk_size": chunk_size,
+        "encoder": encoder,
+        "values_list_format": values_list_format,
+        "optimize": optimize,
+        "etag": etag,
+        "last_modified": last_modified,
+        "timing": timing,
+        "max_queries": max_queries,
+        "max_queries_action": max_queries_action,
+        "paginate_by": paginate_by,
+        "cursor_field": cursor_field,
+        "cursor_param": cursor_param,
+        "paginate_envelope": paginate_envelope,
+    }
+
     if func is None:
-        return partial(
-            render_json,
-            fields=fields,
-            separators=separators,
-            item_separator=item_separator,
-            key_separator=key_separator,
+        return partial(render_json, **options)
+
+    def pop_options(kwargs: dict) -> dict:
+        # Options can be overridden by the view's kwargs, e.g. from `urls.py`
+        return {name: kwargs.pop(name, default) for name, default in options.items()}
+
+    def get_view_query_budget(view_options: dict):
+        return get_query_budget(
+            f"{func.__module__}.{func.__qualname__}",
+            max_queries=view_options.pop("max_queries"),
+            action=view_options.pop("max_queries_action"),
         )
 
+    def get_view_pagination(view_options: dict) -> KeysetPagination | None:
+        paginate_by = view_options.pop("paginate_by")
+        pagination_kwargs = {
+            "cursor_field": view_options.pop("cursor_field"),
+            "cursor_param": view_options.pop("cursor_param"),
+            "envelope": view_options.pop("paginate_envelope"),
+        }
+
+        if paginate_by is None:
+            return None
+
+        return KeysetPagination(paginate_by, **pagination_kwargs)
+
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(request, *args, **kwargs):
+            view_options = pop_options(kwargs)
+            timer = get_timer(timing=view_options.pop("timing"))
+            pagination = get_view_pagination(view_options)
+
+            async with get_view_query_budget(view_options):
+                context = await func(request, *args, **kwargs)
+                timer.mark("view")
+
+                response = await _arender_json(request, context, timer=timer, pagination=pagination, **view_options)
+
+            return timer.finish(func, request, response)
+
+        return async_wrapper
+
     @wraps(func)
-    def wrapper(
-        request,
-        *args,
-        fields=fields,
-        separators=separators,
-        item_separator=item_separator,
-        key_separator=key_separator,
-        **kwargs,
-    ):
-        context = func(request, *args, **kwargs)
-
-        if isinstance(context, models.Model):
-            context = json.loads(serializers.serialize("json", [context], fields=fields)[1:-1])
-
-            context = _convert_serialized_model(context, fields=fields)
-        elif isinstance(context, models.QuerySet):
-            try:
-                context = json.loads(serializers.serialize("json", context, fields=fields))
-
-                context = [_convert_serialized_model(c, fields=fields) for c in context]
-            except AttributeError:
-                # `AttributeError: 'dict' object has no attribute '_meta'` gets thrown
-                # when the `QuerySet` was created with `.values()` or `.values_list()`
-                # which are actually `dictionaries` or `tuples` when iterated over
-                context = list(context)
-        elif fields is not None:
-            raise AssertionError("The `fields` kwarg should only be used when serializing Django models.")
-
-        if not isinstance(context, dict) and not isinstance(context, list):
-            return context
-
-        if separators is None:
-            separators = MINIFIED_JSON_SEPARATORS
-
-        if item_separator:
-            separators = (item_separator, separators[1])
-
-        if key_separator:
-            separators = (separators[0], key_separator)
-
-        # `safe` is always False because returning a list should be fine with modern browsers
-        return JsonResponse(context, json_dumps_params={"separators": separators}, safe=False)
+    def wrapper(request, *args, **kwargs):
+        view_options = pop_options(kwargs)
+        timer = get_timer(timing=view_options.pop("timing"))
+        pagination = get_view_pagination(view_options)
+
+        with get_view_query_budget(view_options):
+            context = func(request, *args, **kwargs)
+            timer.mark("view")
+
+            response = _render_json(request, context, timer=timer, pagination=pagination, **view_options)
+
+        return timer.finish(func, request, response)
 
     return wrapper
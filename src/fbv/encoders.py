@@ -0,0 +1,88 @@
+import json
+from collections.abc import Callable
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+__all__ = [
+    "JSON_ENCODERS",
+    "encode_json",
+    "encode_orjson",
+    "get_json_encoder",
+]
+
+
+DEFAULT_JSON_ENCODER = "auto"
+DEFAULT_JSON_SEPARATORS = (", ", ": ")
+MINIFIED_JSON_SEPARATORS = (",", ":")
+
+
+def encode_json(data, separators: tuple[str, str] = MINIFIED_JSON_SEPARATORS) -> str:
+    """
+    Encodes `data` with the standard library `json` module and `DjangoJSONEncoder`.
+    """
+
+    return json.dumps(data, cls=DjangoJSONEncoder, separators=separators)
+
+
+def encode_orjson(data, separators: tuple[str, str] = MINIFIED_JSON_SEPARATORS) -> bytes | str:
+    """
+    Encodes `data` with `orjson`.
+
+    Dates, times, `Decimal`, and anything else `orjson` doesn't natively support are handed to
+    `DjangoJSONEncoder` so the output matches `encode_json`. `orjson` can only produce minified
+    JSON, so other separators (or data `orjson` can't encode, e.g. integers larger than 64 bits)
+    fall back to `encode_json`.
+    """
+
+    if orjson is None:
+        raise ImportError("orjson must be installed to use the orjson encoder.")
+
+    if tuple(separators) != MINIFIED_JSON_SEPARATORS:
+        return encode_json(data, separators=separators)
+
+    try:
+        return orjson.dumps(
+            data,
+            default=DjangoJSONEncoder().default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+    except orjson.JSONEncodeError:
+        return encode_json(data, separators=separators)
+
+
+JSON_ENCODERS: dict[str, Callable] = {
+    "json": encode_json,
+    "orjson": encode_orjson,
+}
+
+
+def get_json_encoder(encoder: str | Callable | None = None) -> Callable:
+    """
+    Returns the function used to encode data into JSON.
+
+    Args:
+        encoder: The name of the encoder (i.e. "auto", "json", or "orjson") or a function that takes
+            the data and separators and returns a `str` or `bytes`. Defaults to the `FBV_JSON_ENCODER`
+            setting, which defaults to "auto". "auto" uses `orjson` if it is installed and the standard
+            library `json` module otherwise.
+    """
+
+    if encoder is None:
+        encoder = getattr(settings, "FBV_JSON_ENCODER", DEFAULT_JSON_ENCODER)
+
+    if callable(encoder):
+        return encoder
+
+    if encoder == "auto":
+        return encode_orjson if orjson is not None else encode_json
+
+    if encoder not in JSON_ENCODERS:
+        raise ValueError(f"Unknown JSON encoder: {encoder}")
+
+    return JSON_ENCODERS[encoder]
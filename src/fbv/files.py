@@ -0,0 +1,862 @@
+import gzip
+import mimetypes
+import mmap
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Generator
+from contextlib import suppress
+from functools import cache
+from pathlib import Path, PurePosixPath
+from urllib.parse import quote
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.http import parse_http_date_safe
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+__all__ = [
+    "PRECOMPRESSED_EXTENSIONS",
+    "SENDFILE_HEADERS",
+    "FileCache",
+    "aiter_file_parts",
+    "clear_file_validators_cache",
+    "compress_file",
+    "content_response",
+    "get_content_type",
+    "get_file_block_size",
+    "get_file_cache",
+    "get_file_path",
+    "get_file_validators",
+    "get_precompressed_encodings",
+    "get_precompressed_file",
+    "get_precompressed_variants",
+    "get_sendfile_backend",
+    "iter_file_parts",
+    "mmap_response",
+    "parse_accept_encoding",
+    "parse_range_header",
+    "range_response",
+    "read_file",
+    "sendfile_response",
+    "should_mmap",
+    "stat_file",
+]
+
+
+# Requests with more ranges than this get the whole file instead to avoid lots of tiny reads
+MAX_RANGES = 100
+
+# The file extension of the precompressed version of a file for each content coding
+PRECOMPRESSED_EXTENSIONS = {
+    "br": ".br",
+    "zstd": ".zst",
+    "gzip": ".gz",
+}
+DEFAULT_PRECOMPRESSED_ENCODINGS = ("br", "zstd", "gzip")
+
+DEFAULT_FILE_BLOCK_SIZE = 64 * 1024
+DEFAULT_FILE_CACHE_MAX_FILE_SIZE = 64 * 1024
+DEFAULT_FILE_CACHE_CHECK_INTERVAL = 1
+
+# The header each web server uses to serve a file on behalf of the application
+SENDFILE_HEADERS = {
+    "nginx": "X-Accel-Redirect",
+    "apache": "X-Sendfile",
+    "lighttpd": "X-Lighttpd-Send-File",
+}
+
+
+def get_file_path(file_path: str) -> Path:
+    """
+    Returns the absolute path of a file path that is relative to `settings.BASE_DIR`.
+    """
+
+    return Path(settings.BASE_DIR) / file_path
+
+
+# The ETag and Last-Modified timestamp for each file path along with the `os.stat` values they were built from
+_file_validators: dict[Path, tuple[tuple[int, int, int], tuple[str, int]]] = {}
+
+
+def get_file_validators(path: Path, stat: os.stat_result) -> tuple[str, int]:
+    """
+    Returns the strong ETag and the Last-Modified timestamp for a file based on its inode, size, and
+    modified time.
+
+    The validators are cached for each path until the file changes.
+    """
+
+    key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    cached = _file_validators.get(path)
+
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    validators = (f'"{stat.st_ino:x}-{stat.st_size:x}-{stat.st_mtime_ns:x}"', int(stat.st_mtime))
+    _file_validators[path] = (key, validators)
+
+    return validators
+
+
+def clear_file_validators_cache() -> None:
+    """
+    Removes all cached file validators.
+    """
+
+    _file_validators.clear()
+
+
+def get_content_type(path: Path) -> str:
+    """
+    Returns the content type of a file based on its name the same way `FileResponse` does.
+    """
+
+    (content_type, encoding) = mimetypes.guess_type(path.name)
+
+    content_type = {
+        "br": "application/x-brotli",
+        "bzip2": "application/x-bzip",
+        "compress": "application/x-compress",
+        "gzip": "application/gzip",
+        "xz": "application/x-xz",
+    }.get(encoding or "", content_type)
+
+    return content_type or "application/octet-stream"
+
+
+def get_sendfile_backend() -> str | None:
+    """
+    Returns the `FBV_SENDFILE_BACKEND` setting, or `None` if files are sent by Django.
+    """
+
+    backend: str | None = getattr(settings, "FBV_SENDFILE_BACKEND", None)
+
+    if not backend:
+        return None
+
+    if backend not in SENDFILE_HEADERS:
+        raise ImproperlyConfigured(f"Unknown FBV_SENDFILE_BACKEND: {backend}")
+
+    return backend
+
+
+def sendfile_response(path: Path) -> HttpResponse | None:
+    """
+    Returns an empty response that tells the web server to send the file, or `None` if the
+    `FBV_SENDFILE_BACKEND` setting isn't set.
+
+    - "nginx": sets `X-Accel-Redirect` to the file path appended to the `FBV_SENDFILE_ROOT` setting,
+    which is the URL of an `internal` location that serves `settings.BASE_DIR`
+    - "apache": sets `X-Sendfile` to the absolute path of the file
+    - "lighttpd": sets `X-Lighttpd-Send-File` to the absolute path of the file
+
+    For "apache" and "lighttpd", `FBV_SENDFILE_ROOT` can be set to the directory the web server sees
+    `settings.BASE_DIR` as, e.g. when it runs in a different container.
+    """
+
+    backend = get_sendfile_backend()
+
+    if backend is None:
+        return None
+
+    root = getattr(settings, "FBV_SENDFILE_ROOT", None)
+    relative_path = PurePosixPath(path.relative_to(settings.BASE_DIR))
+
+    if backend == "nginx":
+        if not root:
+            raise ImproperlyConfigured("FBV_SENDFILE_ROOT must be set to an internal location for nginx.")
+
+        location = quote(f"{root.rstrip('/')}/{relative_path}")
+    else:
+        location = str(Path(root) / relative_path) if root else str(path.absolute())
+
+    response = HttpResponse(content_type=get_content_type(path))
+    response[SENDFILE_HEADERS[backend]] = location
+
+    return response
+
+
+def parse_range_header(header: str, size: int) -> list[tuple[int, int]] | None:
+    """
+    Returns the inclusive byte ranges from a `Range` header for a file of `size` bytes.
+
+    Overlapping and adjacent ranges are combined. Returns `None` if the header is invalid (i.e. it
+    should be ignored and the whole file sent) and an empty list if none of the ranges can be satisfied.
+    """
+
+    (unit, _, range_set) = header.partition("=")
+
+    if unit.strip().lower() != "bytes" or not range_set.strip():
+        return None
+
+    range_specs = range_set.split(",")
+
+    if len(range_specs) > MAX_RANGES:
+        return None
+
+    ranges = []
+
+    for range_spec in range_specs:
+        (first, separator, last) = (part.strip() for part in range_spec.strip().partition("-"))
+
+        if not separator or (first and not first.isdigit()) or (last and not last.isdigit()):
+            return None
+
+        if not first:
+            # A suffix range, i.e. the last N bytes
+            if not last:
+                return None
+
+            suffix_length = int(last)
+
+            if suffix_length and size:
+                ranges.append((max(size - suffix_length, 0), size - 1))
+
+            continue
+
+        start = int(first)
+        end = int(last) if last else size - 1
+
+        if last and end < start:
+            return None
+
+        if start < size:
+            ranges.append((start, min(end, size - 1)))
+
+    combined: list[tuple[int, int]] = []
+
+    for start, end in sorted(ranges):
+        if combined and start <= combined[-1][1] + 1:
+            combined[-1] = (combined[-1][0], max(end, combined[-1][1]))
+        else:
+            combined.append((start, end))
+
+    return combined
+
+
+def _if_range_passes(request, etag: str, last_modified: int) -> bool:
+    if_range: str = request.META.get("HTTP_IF_RANGE", "")
+
+    if not if_range:
+        return True
+
+    # `If-Range` requires a strong comparison, so weak ETags never match
+    if if_range.startswith(('"', "W/")):
+        return if_range == etag
+
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def get_file_block_size() -> int:
+    """
+    Returns the number of bytes that are sent at a time for ranges and memory-mapped files from the
+    `FBV_FILE_BLOCK_SIZE` setting. Defaults to 64 KiB.
+    """
+
+    return getattr(settings, "FBV_FILE_BLOCK_SIZE", DEFAULT_FILE_BLOCK_SIZE)
+
+
+def should_mmap(stat: os.stat_result) -> bool:
+    """
+    Whether the file is large enough to be memory-mapped based on the `FBV_FILE_MMAP_MIN_SIZE` setting.
+    Files are never memory-mapped if the setting isn't set.
+    """
+
+    min_size = getattr(settings, "FBV_FILE_MMAP_MIN_SIZE", None)
+
+    # Empty files can't be memory-mapped
+    return min_size is not None and stat.st_size >= min_size and stat.st_size > 0
+
+
+def iter_file_parts(
+    path: Path,
+    parts: list[tuple[bytes, int, int]],
+    closing: bytes = b"",
+    *,
+    use_mmap: bool = False,
+) -> Generator[bytes | memoryview, None, None]:
+    """
+    Yields the byte ranges of a file, each one after its headers, and then the closing bytes.
+
+    When `use_mmap` is `True`, the file is memory-mapped and `memoryview` slices of the map are yielded
+    instead of reading each block into a new `bytes` object. The pages are shared with the OS page
+    cache, so every process serving the same file uses the same memory.
+
+    Args:
+        path: The path of the file.
+        parts: The headers and the inclusive start and end bytes of each range.
+        closing: The bytes to yield after the last range.
+        use_mmap: Whether to memory-map the file.
+    """
+
+    block_size = get_file_block_size()
+
+    with path.open("rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if use_mmap else None
+
+        try:
+            for headers, start, end in parts:
+                if headers:
+                    yield headers
+
+                if mapped is not None:
+                    with memoryview(mapped) as view:
+                        for offset in range(start, end + 1, block_size):
+                            yield view[offset : min(offset + block_size, end + 1)]
+
+                    continue
+
+                f.seek(start)
+                remaining = end - start + 1
+
+                while remaining > 0:
+                    chunk = f.read(min(block_size, remaining))
+
+                    if not chunk:
+                        break
+
+                    remaining -= len(chunk)
+
+                    yield chunk
+
+            if closing:
+                yield closing
+        finally:
+            if mapped is not None:
+                # A slice that is still referenced keeps the map open until it is garbage collected
+                with suppress(BufferError):
+                    mapped.close()
+
+
+async def aiter_file_parts(
+    path: Path,
+    parts: list[tuple[bytes, int, int]],
+    closing: bytes = b"",
+    *,
+    use_mmap: bool = False,
+) -> AsyncIterator[bytes | memoryview]:
+    """
+    Same as `iter_file_parts`, but each block is read in a thread.
+
+    `StreamingHttpResponse` reads a sync iterator into a list before sending it under ASGI, so this keeps
+    only one block in memory at a time instead of the whole file.
+    """
+
+    chunks = iter_file_parts(path, parts, closing, use_mmap=use_mmap)
+    get_next_chunk = sync_to_async(lambda: next(chunks, None), thread_sensitive=False)
+
+    try:
+        while (chunk := await get_next_chunk()) is not None:
+            yield chunk
+    finally:
+        chunks.close()
+
+
+def _iter_file_parts(*args, is_async: bool = False, **kwargs):
+    return (aiter_file_parts if is_async else iter_file_parts)(*args, **kwargs)
+
+
+def mmap_response(
+    path: Path,
+    stat: os.stat_result,
+    content_type: str,
+    filename: str,
+    *,
+    is_async: bool = False,
+) -> StreamingHttpResponse:
+    """
+    Returns a response that streams the whole file from a memory map with the same headers that
+    `FileResponse` would set.
+
+    Pass `is_async=True` when serving an ASGI request so the file is streamed with an async iterator.
+    """
+
+    response = StreamingHttpResponse(
+        _iter_file_parts(path, [(b"", 0, stat.st_size - 1)], use_mmap=True, is_async=is_async),
+        content_type=content_type,
+    )
+    response["Content-Length"] = str(stat.st_size)
+    _set_content_disposition(response, filename)
+
+    return response
+
+
+def range_response(
+    request,
+    path: Path,
+    stat: os.stat_result,
+    validators: tuple[str, int],
+    content_type: str | None = None,
+    *,
+    is_async: bool = False,
+) -> HttpResponseBase | None:
+    """
+    Returns a `206 Partial Content` response with the byte ranges of the file from the request's
+    `Range` header, or `None` if the whole file should be sent.
+
+    Only the requested ranges of the file are read (or sliced from a memory map if `should_mmap`).
+    Multiple ranges are sent as `multipart/byteranges`.
+    A `Range` header is ignored when an `If-Range` header doesn't match the file's ETag or modified time.
+
+    Args:
+        request: The request.
+        path: The path of the file.
+        stat: The result of `os.stat` for the file.
+        validators: The ETag and Last-Modified timestamp of the file from `get_file_validators`.
+        content_type: The content type of the file. Guessed from the file name if `None`.
+        is_async: Whether to stream the ranges with an async iterator, i.e. for an ASGI request.
+    """
+
+    range_header = request.META.get("HTTP_RANGE")
+
+    if not range_header:
+        return None
+
+    if not _if_range_passes(request, *validators):
+        return None
+
+    size = stat.st_size
+    ranges = parse_range_header(range_header, size)
+
+    if ranges is None:
+        return None
+
+    if not ranges:
+        response: HttpResponseBase = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+
+        return response
+
+    content_type = content_type or get_content_type(path)
+
+    if len(ranges) == 1:
+        (start, end) = ranges[0]
+
+        response = StreamingHttpResponse(
+            _iter_file_parts(path, [(b"", start, end)], use_mmap=should_mmap(stat), is_async=is_async),
+            status=206,
+            content_type=content_type,
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(end - start + 1)
+
+        return response
+
+    boundary = secrets.token_hex(16)
+    parts = [
+        (
+            (
+                f"\r\n--{boundary}\r\nContent-Type: {content_type}\r\nContent-Range: bytes {start}-{end}/{size}\r\n\r\n"
+            ).encode(),
+            start,
+            end,
+        )
+        for start, end in ranges
+    ]
+    closing = f"\r\n--{boundary}--\r\n".encode()
+
+    response = StreamingHttpResponse(
+        _iter_file_parts(path, parts, closing, use_mmap=should_mmap(stat), is_async=is_async),
+        status=206,
+        content_type=f"multipart/byteranges; boundary={boundary}",
+    )
+    response["Content-Length"] = str(
+        sum(len(headers) + end - start + 1 for headers, start, end in parts) + len(closing)
+    )
+
+    return response
+
+
+def get_precompressed_encodings() -> tuple[str, ...]:
+    """
+    Returns the content codings to look for precompressed files for from the `FBV_PRECOMPRESSED_ENCODINGS`
+    setting, in order of preference. Defaults to "br", "zstd", and "gzip".
+    """
+
+    encodings = tuple(getattr(settings, "FBV_PRECOMPRESSED_ENCODINGS", DEFAULT_PRECOMPRESSED_ENCODINGS))
+
+    for encoding in encodings:
+        if encoding not in PRECOMPRESSED_EXTENSIONS:
+            raise ImproperlyConfigured(f"Unknown FBV_PRECOMPRESSED_ENCODINGS encoding: {encoding}")
+
+    return encodings
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """
+    Returns the content codings in an `Accept-Encoding` header mapped to their quality value.
+    """
+
+    accepted = {}
+
+    for coding_spec in header.split(","):
+        (coding, *params) = (part.strip() for part in coding_spec.split(";"))
+
+        if not coding:
+            continue
+
+        quality = 1.0
+
+        for param in params:
+            (name, _, value) = param.partition("=")
+
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        accepted[coding.lower()] = quality
+
+    return accepted
+
+
+# The content codings with an up-to-date precompressed version of each file path along with the `os.stat`
+# values of the original file and the settings they were checked with and when they were checked
+_precompressed_variants: dict[Path, tuple[tuple, float, tuple[str, ...]]] = {}
+
+
+def get_precompressed_variants(path: Path, stat: os.stat_result) -> tuple[str, ...]:
+    """
+    Returns the content codings that have an up-to-date precompressed version of the file (e.g. `robots.txt.br`
+    for `robots.txt`) in order of preference.
+
+    Precompressed files that were modified before the original file are ignored because they are stale. The
+    result is cached for each path until the original file changes or `FBV_FILE_CACHE_CHECK_INTERVAL` seconds
+    pass, so missing precompressed files aren't looked for on every request.
+    """
+
+    encodings = get_precompressed_encodings()
+
+    if not encodings:
+        return ()
+
+    key = (stat.st_ino, stat.st_size, stat.st_mtime_ns, encodings)
+    now = time.monotonic()
+    cached = _precompressed_variants.get(path)
+    check_interval = getattr(settings, "FBV_FILE_CACHE_CHECK_INTERVAL", DEFAULT_FILE_CACHE_CHECK_INTERVAL)
+
+    if cached is not None and cached[0] == key and now - cached[1] < check_interval:
+        return cached[2]
+
+    variants = []
+
+    for encoding in encodings:
+        try:
+            compressed_stat = stat_file(path.with_name(path.name + PRECOMPRESSED_EXTENSIONS[encoding]))
+        except OSError:
+            continue
+
+        if compressed_stat.st_mtime_ns >= stat.st_mtime_ns:
+            variants.append(encoding)
+
+    _precompressed_variants[path] = (key, now, tuple(variants))
+
+    return tuple(variants)
+
+
+def get_precompressed_file(request, path: Path, stat: os.stat_result) -> tuple[Path, os.stat_result, str] | None:
+    """
+    Returns the path, `os.stat` result, and content coding of the precompressed version of a file that
+    the request accepts (e.g. `robots.txt.br` for `robots.txt`), or `None` if there isn't one.
+
+    Only the content codings from `get_precompressed_variants` are looked for.
+    """
+
+    variants = get_precompressed_variants(path, stat)
+
+    if not variants:
+        return None
+
+    accepted = parse_accept_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+
+    if not accepted:
+        return None
+
+    qualities = {encoding: accepted.get(encoding, accepted.get("*", 0.0)) for encoding in variants}
+
+    # Prefer the highest quality value and then the order of the encodings setting
+    preferred = sorted(
+        (encoding for encoding in variants if qualities[encoding] > 0),
+        key=lambda encoding: -qualities[encoding],
+    )
+
+    for encoding in preferred:
+        compressed_path = path.with_name(path.name + PRECOMPRESSED_EXTENSIONS[encoding])
+
+        try:
+            compressed_stat = stat_file(compressed_path)
+        except OSError:
+            continue
+
+        if compressed_stat.st_mtime_ns >= stat.st_mtime_ns:
+            return (compressed_path, compressed_stat, encoding)
+
+    return None
+
+
+def _get_compressor(encoding: str) -> Callable[[bytes], bytes] | None:
+    if encoding == "gzip":
+        # `mtime=0` so compressing the same file always produces the same bytes
+        return lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+
+    if encoding == "br" and brotli is not None:
+        return lambda data: brotli.compress(data, quality=11)
+
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=19).compress
+
+    return None
+
+
+def compress_file(path: Path, encodings: tuple[str, ...] | None = None, *, force: bool = False) -> dict[str, Path]:
+    """
+    Writes the precompressed versions of a file next to it, e.g. `robots.txt.br` and `robots.txt.gz`.
+
+    Precompressed files that are up-to-date are skipped unless `force` is `True`. Encodings are also skipped
+    when the library they need isn't installed (`brotli` for "br" and `zstandard` for "zstd") or when
+    the compressed file wouldn't be smaller than the original.
+
+    Args:
+        path: The path of the file to compress.
+        encodings: The content codings to compress the file with. Defaults to `get_precompressed_encodings()`.
+        force: Compress the file even if the precompressed version is up-to-date.
+
+    Returns:
+        The content codings that were written mapped to the path of the precompressed file.
+    """
+
+    if encodings is None:
+        encodings = get_precompressed_encodings()
+
+    stat = path.stat()
+    data = None
+    written = {}
+
+    for encoding in encodings:
+        compressor = _get_compressor(encoding)
+
+        if compressor is None:
+            continue
+
+        compressed_path = path.with_name(path.name + PRECOMPRESSED_EXTENSIONS[encoding])
+
+        if not force and compressed_path.exists() and compressed_path.stat().st_mtime_ns >= stat.st_mtime_ns:
+            continue
+
+        if data is None:
+            data = path.read_bytes()
+
+        compressed = compressor(data)
+
+        if len(compressed) >= len(data):
+            continue
+
+        compressed_path.write_bytes(compressed)
+        written[encoding] = compressed_path
+
+    if written:
+        _precompressed_variants.pop(path, None)
+
+    return written
+
+
+class FileCache:
+    """
+    A least-recently-used cache of the contents of small files along with the `os.stat` results of the
+    files that get served.
+
+    `os.stat` results (including for files that don't exist) are re-checked after `check_interval` seconds.
+    A file's cached contents are dropped when its inode, size, or modified time change.
+
+    Args:
+        max_size: The maximum number of bytes of file contents to cache.
+        max_file_size: Files larger than this many bytes aren't cached.
+        check_interval: The number of seconds before `os.stat` is called again for a file. `0` calls
+            `os.stat` for every request and `None` never calls it again after the first time.
+    """
+
+    def __init__(self, max_size: int, max_file_size: int, check_interval: float | None):
+        self.max_size = max_size
+        self.max_file_size = max_file_size
+        self.check_interval = check_interval
+        self.size = 0
+
+        # The `os.stat` result (or `None` if the file doesn't exist) and when it was checked
+        self._stats: dict[Path, tuple[os.stat_result | None, float]] = {}
+
+        # The contents of each file with the `os.stat` values they were read with
+        self._contents: OrderedDict[Path, tuple[tuple[int, int, int], bytes]] = OrderedDict()
+
+        self._lock = threading.Lock()
+
+    def stat(self, path: Path) -> os.stat_result:
+        """
+        Returns the `os.stat` result for the file.
+
+        Raises:
+            FileNotFoundError: if the file doesn't exist
+        """
+
+        now = time.monotonic()
+        cached = self._stats.get(path)
+
+        if cached is not None and (self.check_interval is None or now - cached[1] < self.check_interval):
+            stat = cached[0]
+        else:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                stat = None
+
+            self._stats[path] = (stat, now)
+
+        if stat is None:
+            raise FileNotFoundError(f"No such file: '{path}'")
+
+        return stat
+
+    def read(self, path: Path, stat: os.stat_result) -> bytes | None:
+        """
+        Returns the contents of the file, or `None` if it is too large to cache.
+        """
+
+        if stat.st_size > self.max_file_size or stat.st_size > self.max_size:
+            return None
+
+        key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            cached = self._contents.get(path)
+
+            if cached is not None and cached[0] == key:
+                self._contents.move_to_end(path)
+
+                return cached[1]
+
+        data = path.read_bytes()
+
+        with self._lock:
+            previous = self._contents.pop(path, None)
+
+            if previous is not None:
+                self.size -= len(previous[1])
+
+            self._contents[path] = (key, data)
+            self.size += len(data)
+
+            while self.size > self.max_size:
+                (_, (_, evicted)) = self._contents.popitem(last=False)
+                self.size -= len(evicted)
+
+        return data
+
+    def clear(self) -> None:
+        """
+        Removes all cached `os.stat` results and file contents.
+        """
+
+        with self._lock:
+            self._stats.clear()
+            self._contents.clear()
+            self.size = 0
+
+
+@cache
+def get_file_cache() -> FileCache | None:
+    """
+    Returns the `FileCache` built from the settings, or `None` if `FBV_FILE_CACHE_MAX_SIZE` isn't set.
+
+    - `FBV_FILE_CACHE_MAX_SIZE`: the maximum number of bytes of file contents to cache
+    - `FBV_FILE_CACHE_MAX_FILE_SIZE`: files larger than this many bytes aren't cached; defaults to 64 KiB
+    - `FBV_FILE_CACHE_CHECK_INTERVAL`: the number of seconds before a file is checked for changes again;
+    defaults to 1, `None` never checks files for changes
+    """
+
+    max_size = getattr(settings, "FBV_FILE_CACHE_MAX_SIZE", 0)
+
+    if not max_size:
+        return None
+
+    return FileCache(
+        max_size=max_size,
+        max_file_size=getattr(settings, "FBV_FILE_CACHE_MAX_FILE_SIZE", DEFAULT_FILE_CACHE_MAX_FILE_SIZE),
+        check_interval=getattr(settings, "FBV_FILE_CACHE_CHECK_INTERVAL", DEFAULT_FILE_CACHE_CHECK_INTERVAL),
+    )
+
+
+@receiver(setting_changed)
+def _clear_file_cache_on_setting_changed(sender, setting, **kwargs):  # noqa: ARG001
+    if setting.startswith("FBV_FILE_CACHE_") or setting == "BASE_DIR":
+        get_file_cache.cache_clear()
+
+
+def stat_file(path: Path) -> os.stat_result:
+    """
+    Returns the `os.stat` result for the file from the `FileCache` if it is enabled.
+
+    Raises:
+        FileNotFoundError: if the file doesn't exist
+    """
+
+    file_cache = get_file_cache()
+
+    if file_cache is None:
+        return path.stat()
+
+    return file_cache.stat(path)
+
+
+def read_file(path: Path, stat: os.stat_result) -> bytes | None:
+    """
+    Returns the contents of the file from the `FileCache`, or `None` if it isn't enabled or the file is
+    too large to cache.
+    """
+
+    file_cache = get_file_cache()
+
+    if file_cache is None:
+        return None
+
+    return file_cache.read(path, stat)
+
+
+def content_response(content: bytes, content_type: str, filename: str) -> HttpResponse:
+    """
+    Returns a response for the contents of a file that are already in memory with the same headers that
+    `FileResponse` would set.
+    """
+
+    response = HttpResponse(content, content_type=content_type)
+    response["Content-Length"] = str(len(content))
+    _set_content_disposition(response, filename)
+
+    return response
+
+
+def _set_content_disposition(response: HttpResponseBase, filename: str) -> None:
+    # Follows `django.utils.http.content_disposition_header` for an inline file
+    try:
+        filename.encode("ascii")
+    except UnicodeEncodeError:
+        response["Content-Disposition"] = f"inline; filename*=utf-8''{quote(filename)}"
+    else:
+        escaped_filename = filename.replace("\\", "\\\\").replace('"', r"\"")
+        response["Content-Disposition"] = f'inline; filename="{escaped_filename}"'
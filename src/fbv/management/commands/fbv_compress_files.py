@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from fbv.files import PRECOMPRESSED_EXTENSIONS, compress_file, get_file_path
+from fbv.utils import iter_view_kwargs
+from fbv.views import favicon_file, file
+
+
+class Command(BaseCommand):
+    help = "Writes precompressed versions of every file that is served by `file` or `favicon_file`."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--encoding",
+            action="append",
+            dest="encodings",
+            choices=tuple(PRECOMPRESSED_EXTENSIONS),
+            help="The content coding to compress with; can be used multiple times. Defaults to the "
+            "FBV_PRECOMPRESSED_ENCODINGS setting.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Compress files even if their precompressed versions are up-to-date.",
+        )
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        encodings = tuple(options["encodings"]) if options["encodings"] else None
+        file_paths = {
+            kwargs["file_path"]
+            for view in (file, favicon_file)
+            for kwargs in iter_view_kwargs(view)
+            if "file_path" in kwargs
+        }
+
+        compressed_count = 0
+        missing = []
+
+        for file_path in sorted(file_paths):
+            path = get_file_path(file_path)
+
+            if not path.is_file():
+                missing.append(file_path)
+                self.stderr.write(f"Could not find {file_path}")
+                continue
+
+            written = compress_file(path, encodings, force=options["force"])
+
+            for compressed_path in written.values():
+                self.stdout.write(f"Compressed {compressed_path.name}", style_func=None)
+
+            compressed_count += len(written)
+
+        if missing:
+            raise CommandError(f"{len(missing)} file(s) could not be found.")
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {compressed_count} precompressed file(s)."))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from fbv.templates import warm_templates
+
+
+class Command(BaseCommand):
+    help = "Loads and compiles every template that is bound to a view."
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        (loaded, errors) = warm_templates()
+
+        for template_name in loaded:
+            self.stdout.write(f"Loaded {template_name}", style_func=None)
+
+        for template_name, error in errors.items():
+            self.stderr.write(f"Could not load {template_name}: {error!r}")
+
+        if errors:
+            raise CommandError(f"{len(errors)} template(s) could not be loaded.")
+
+        self.stdout.write(self.style.SUCCESS(f"Loaded {len(loaded)} template(s)."))
@@ -1,24 +1,45 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+HTTP_METHODS = ("post", "get", "patch", "head", "put", "delete", "connect", "trace", "options")
+
+# The `is_*` properties for each request method are built once so every request only does one lookup
+_NO_METHOD_FLAGS = {f"is_{method}": False for method in HTTP_METHODS}
+_METHOD_FLAGS = {method.upper(): {**_NO_METHOD_FLAGS, f"is_{method}": True} for method in HTTP_METHODS}
+
+
 class RequestMethodMiddleware:
     """
     Adds the request method as boolean properties to the request object.
 
     Example: You can check that a request is a post with `request.is_post` instead
     of using the string equality `request.method == "POST"` which is more error prone.
+
+    Supports both sync and async requests.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(self.get_response)
+
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        request.is_post = request.method == "POST"
-        request.is_get = request.method == "GET"
-        request.is_patch = request.method == "PATCH"
-        request.is_head = request.method == "HEAD"
-        request.is_put = request.method == "PUT"
-        request.is_delete = request.method == "DELETE"
-        request.is_connect = request.method == "CONNECT"
-        request.is_trace = request.method == "TRACE"
+        if self.async_mode:
+            return self.__acall__(request)
+
+        request.__dict__.update(_METHOD_FLAGS.get(request.method, _NO_METHOD_FLAGS))
 
         response = self.get_response(request)
 
         return response
+
+    async def __acall__(self, request):
+        request.__dict__.update(_METHOD_FLAGS.get(request.method, _NO_METHOD_FLAGS))
+
+        response = await self.get_response(request)
+
+        return response
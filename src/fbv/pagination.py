@@ -0,0 +1,193 @@
+import base64
+import binascii
+import datetime as dt
+import json
+from collections.abc import Callable
+
+from django.core.exceptions import BadRequest, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Q
+
+from fbv.serializers import get_values_names
+
+__all__ = [
+    "KeysetPagination",
+    "decode_cursor",
+    "default_envelope",
+    "encode_cursor",
+]
+
+
+DEFAULT_CURSOR_PARAM = "cursor"
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # `DjangoJSONEncoder` truncates times to milliseconds, which would repeat rows between pages
+        if isinstance(o, dt.datetime | dt.date | dt.time):
+            return o.isoformat()
+
+        return super().default(o)
+
+
+def encode_cursor(values: list) -> str:
+    """
+    Encodes the values of the last row of a page into an opaque cursor that can be used in a URL.
+
+    Dates and times keep their full precision.
+    """
+
+    cursor_json = json.dumps(values, cls=_CursorEncoder, separators=(",", ":"))
+
+    return base64.urlsafe_b64encode(cursor_json.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    """
+    Decodes a cursor that was created with `encode_cursor`.
+
+    Raises:
+        BadRequest: if the cursor is invalid, which Django turns into a 400 response.
+    """
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError) as e:
+        raise BadRequest("Invalid cursor") from e
+
+    if not isinstance(values, list) or len(values) != length:
+        raise BadRequest("Invalid cursor")
+
+    return values
+
+
+def default_envelope(results: list | dict, next_cursor: str | None) -> dict:
+    """
+    Returns a page of results in the form of `{"results": [...], "next": "cursor"}`.
+    """
+
+    return {"results": results, "next": next_cursor}
+
+
+class KeysetPagination:
+    """
+    Paginates a `QuerySet` by the value of an ordering field instead of an offset, i.e. `WHERE field > cursor
+    ORDER BY field LIMIT n + 1`, so every page costs the same as the first one.
+
+    The primary key is used to break ties so the field doesn't have to be unique, but it shouldn't be nullable.
+    """
+
+    def __init__(
+        self,
+        paginate_by: int,
+        cursor_field: str = "pk",
+        cursor_param: str = DEFAULT_CURSOR_PARAM,
+        envelope: Callable | None = None,
+    ):
+        if paginate_by < 1:
+            raise ValueError("paginate_by must be at least 1")
+
+        self.paginate_by = paginate_by
+        self.is_descending = cursor_field.startswith("-")
+        self.cursor_field = cursor_field.removeprefix("-")
+        self.cursor_param = cursor_param
+        self.envelope = envelope or default_envelope
+
+    def get_field_names(self, model: type[models.Model]) -> list[str]:
+        # The primary key is always the last field so the order is unique
+        if self.cursor_field in ("pk", model._meta.pk.name):  # type: ignore[union-attr]
+            return ["pk"]
+
+        return [self.cursor_field, "pk"]
+
+    def get_cursor_values(self, model: type[models.Model], field_names: list[str], cursor: str) -> list:
+        """
+        Decodes the cursor and converts its values back to the Python types of the fields.
+
+        Raises:
+            BadRequest: if the cursor is invalid, which Django turns into a 400 response.
+        """
+
+        values = decode_cursor(cursor, len(field_names))
+        fields = [model._meta.pk if name == "pk" else model._meta.get_field(name) for name in field_names]
+
+        try:
+            return [field.to_python(value) for (field, value) in zip(fields, values, strict=True)]  # type: ignore[union-attr]
+        except ValidationError as e:
+            raise BadRequest("Invalid cursor") from e
+
+    def paginate(self, request, queryset: models.QuerySet) -> models.QuerySet:
+        """
+        Returns the `QuerySet` for the page after the request's cursor with one extra row to know if there is
+        a next page.
+        """
+
+        field_names = self.get_field_names(queryset.model)
+        lookup = "lt" if self.is_descending else "gt"
+
+        queryset = queryset.order_by(*[f"-{name}" if self.is_descending else name for name in field_names])
+        cursor = request.GET.get(self.cursor_param)
+
+        if cursor:
+            values = self.get_cursor_values(queryset.model, field_names, cursor)
+            condition = Q()
+
+            # e.g. `(field > value) OR (field = value AND pk > pk_value)`
+            for idx, name in enumerate(field_names):
+                equal = dict(zip(field_names[:idx], values[:idx], strict=True))
+                condition |= Q(**equal, **{f"{name}__{lookup}": values[idx]})
+
+            queryset = queryset.filter(condition)
+
+        return queryset[: self.paginate_by + 1]  # type: ignore[no-any-return]
+
+    def get_page(self, queryset: models.QuerySet) -> tuple[list, str | None]:
+        """
+        Returns the rows of the page and the cursor for the next page, or `None` if it is the last page.
+        """
+
+        rows = list(queryset)
+
+        if len(rows) <= self.paginate_by:
+            return (rows, None)
+
+        rows = rows[: self.paginate_by]
+        last_row = rows[-1]
+
+        if isinstance(last_row, models.Model):
+            values = [self._get_model_value(last_row, name) for name in self.get_field_names(queryset.model)]
+        else:
+            values = [self._get_values_value(queryset, last_row, name) for name in self.get_field_names(queryset.model)]
+
+        return (rows, encode_cursor(values))
+
+    def _get_model_value(self, obj: models.Model, name: str):
+        if name == "pk":
+            return obj.pk
+
+        return getattr(obj, obj._meta.get_field(name).attname)  # type: ignore[union-attr]
+
+    def _get_values_value(self, queryset: models.QuerySet, row, name: str):
+        names = get_values_names(queryset)
+        meta = queryset.model._meta
+
+        # `.values()` and `.values_list()` can select the field by its name, attname, or `pk`
+        candidates = [name]
+
+        if name == "pk":
+            candidates.extend((meta.pk.name, meta.pk.attname))  # type: ignore[union-attr]
+        else:
+            candidates.append(meta.get_field(name).attname)  # type: ignore[union-attr]
+
+        for candidate in candidates:
+            if candidate in names:
+                if isinstance(row, dict):
+                    return row[candidate]
+
+                if isinstance(row, tuple):
+                    return row[names.index(candidate)]
+
+                return row
+
+        raise AssertionError(f"`{name}` must be selected in `values()` or `values_list()` to paginate by it.")
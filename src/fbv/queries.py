@@ -0,0 +1,189 @@
+import logging
+import re
+import warnings
+from collections import Counter
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+
+__all__ = [
+    "QueryBudget",
+    "QueryBudgetExceeded",
+    "QueryBudgetWarning",
+    "get_query_budget",
+    "get_query_shape",
+]
+
+
+logger = logging.getLogger(__name__)
+
+MAX_QUERIES_ACTIONS = ("log", "warn", "raise")
+DEFAULT_MAX_QUERIES_ACTION = "warn"
+
+# The number of repeated queries that get included in the report
+MAX_REPORTED_SHAPES = 3
+
+_IN_PLACEHOLDERS_RE = re.compile(r"\((?:%s, )+%s\)")
+
+# The budgets that are counting queries in the current context; `sync_to_async` copies the context into the
+# thread that runs the query, so concurrent async requests only count their own queries
+_budgets: ContextVar[tuple["QueryBudget", ...]] = ContextVar("fbv_query_budgets", default=())
+
+
+class QueryBudgetExceeded(Exception):  # noqa: N818
+    """
+    Raised when a view runs more queries than its `max_queries` budget and the action is "raise".
+    """
+
+
+class QueryBudgetWarning(UserWarning):
+    """
+    Warns when a view runs more queries than its `max_queries` budget and the action is "warn".
+    """
+
+
+def _count_query(execute, sql, params, many, context):
+    for budget in _budgets.get():
+        budget.queries.append(sql)
+
+    return execute(sql, params, many, context)
+
+
+def _install_execute_wrapper() -> None:
+    # The wrapper stays installed on the connection and only counts while a budget is active
+    for connection in connections.all():
+        if _count_query not in connection.execute_wrappers:
+            connection.execute_wrappers.append(_count_query)
+
+
+def get_query_shape(sql: str) -> str:
+    """
+    Returns the SQL with lists of placeholders collapsed (e.g. `IN (%s, %s)` becomes `IN (...)`) so queries
+    that only differ by their parameters have the same shape.
+    """
+
+    return _IN_PLACEHOLDERS_RE.sub("(...)", sql)
+
+
+class QueryBudget:
+    """
+    Counts the queries that get run on every database connection with an execute wrapper and
+    logs, warns, or raises when there are more than `max_queries`.
+
+    Can be used as a context manager or an async context manager. The budget is tracked in a context
+    variable, so queries from other requests that run at the same time in the async ORM's thread are
+    not counted.
+    """
+
+    def __init__(self, name: str, max_queries: int, action: str = DEFAULT_MAX_QUERIES_ACTION):
+        if action not in MAX_QUERIES_ACTIONS:
+            raise ValueError(f"Unknown max_queries action: {action}")
+
+        self.name = name
+        self.max_queries = max_queries
+        self.action = action
+        self.queries: list[str] = []
+        self._token: Token | None = None
+
+    def _start(self) -> None:
+        self._token = _budgets.set((*_budgets.get(), self))
+
+    def _stop(self) -> None:
+        if self._token is not None:
+            _budgets.reset(self._token)
+            self._token = None
+
+    def __enter__(self):
+        _install_execute_wrapper()
+        self._start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop()
+
+        if exc_type is None:
+            self.check()
+
+    async def __aenter__(self):
+        # The wrapper is installed on the connection of the thread that runs the async ORM's queries, but the
+        # budget is set in the caller's context so that it only applies to this task
+        await sync_to_async(_install_execute_wrapper)()
+        self._start()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.__exit__(exc_type, exc_value, traceback)
+
+    def get_repeated_shapes(self) -> list[tuple[str, int]]:
+        """
+        Returns the query shapes that were run more than once with how many times they were run, most
+        repeated first.
+        """
+
+        shapes = Counter(get_query_shape(sql) for sql in self.queries)
+
+        return [(shape, count) for (shape, count) in shapes.most_common(MAX_REPORTED_SHAPES) if count > 1]
+
+    def get_message(self) -> str:
+        message = f"{self.name} ran {len(self.queries)} queries, but max_queries is {self.max_queries}."
+
+        repeated_shapes = self.get_repeated_shapes()
+
+        if repeated_shapes:
+            message += " Repeated queries:" + "".join(f"\n{count}x {shape}" for (shape, count) in repeated_shapes)
+
+        return message
+
+    def check(self) -> None:
+        """
+        Logs, warns, or raises based on the action if more queries were run than the budget allows.
+        """
+
+        if len(self.queries) <= self.max_queries:
+            return
+
+        message = self.get_message()
+
+        if self.action == "raise":
+            raise QueryBudgetExceeded(message)
+
+        if self.action == "warn":
+            warnings.warn(message, QueryBudgetWarning, stacklevel=2)
+        else:
+            logger.warning(message)
+
+
+def get_query_budget(
+    name: str,
+    *,
+    max_queries: int | None = None,
+    action: str | None = None,
+) -> QueryBudget | nullcontext:
+    """
+    Returns a `QueryBudget` or a context manager that does nothing if there isn't a budget.
+
+    Args:
+        name: the name of what is being counted (e.g. the view) for the report
+        max_queries: the number of queries that are allowed; defaults to the `FBV_MAX_QUERIES` setting
+        action: "log", "warn", or "raise"; defaults to the `FBV_MAX_QUERIES_ACTION` setting
+    """
+
+    if max_queries is None:
+        max_queries = getattr(settings, "FBV_MAX_QUERIES", None)
+
+        if max_queries is None:
+            return nullcontext()
+
+    if action is None:
+        action = getattr(settings, "FBV_MAX_QUERIES_ACTION", DEFAULT_MAX_QUERIES_ACTION)
+
+        if action not in MAX_QUERIES_ACTIONS:
+            raise ImproperlyConfigured(f"Unknown FBV_MAX_QUERIES_ACTION: {action}")
+
+    return QueryBudget(name, max_queries, action)
@@ -0,0 +1,102 @@
+from functools import lru_cache
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf, reverse
+from django.utils.translation import get_language
+
+from fbv.utils import iter_url_patterns
+
+__all__ = [
+    "clear_reverse_cache",
+    "get_reverse_cache_info",
+    "preload_redirects",
+    "reverse_cached",
+]
+
+
+@lru_cache(maxsize=1024)
+def _reverse(
+    pattern_name: str,
+    args: tuple,
+    kwargs: frozenset,
+    urlconf: str | None,
+    *,
+    script_prefix: str,  # noqa: ARG001 (only part of the cache key because `reverse` uses it)
+    language: str | None,  # noqa: ARG001 (only part of the cache key because `i18n_patterns` use it)
+) -> str:
+    return reverse(pattern_name, urlconf=urlconf, args=args, kwargs=dict(kwargs))
+
+
+def reverse_cached(pattern_name: str, args: tuple = (), kwargs: dict | None = None) -> str:
+    """
+    Returns the URL for a named pattern like `django.urls.reverse`, but caches it for the pattern name, args,
+    kwargs, the current URLconf, the current script prefix, and the active language.
+
+    Falls back to `reverse` without caching if any of the args or kwargs can't be hashed.
+    """
+
+    kwargs = kwargs or {}
+
+    try:
+        key = (pattern_name, tuple(args), frozenset(kwargs.items()), get_urlconf())
+        hash(key)
+    except TypeError:
+        return reverse(pattern_name, args=args, kwargs=kwargs)
+
+    return _reverse(*key, script_prefix=get_script_prefix(), language=get_language())
+
+
+def get_reverse_cache_info():
+    """
+    Returns the hits, misses, and current size of the reversed URL cache as a `functools` `CacheInfo`.
+    """
+
+    return _reverse.cache_info()
+
+
+def clear_reverse_cache() -> None:
+    """
+    Removes all cached URLs.
+    """
+
+    _reverse.cache_clear()
+
+
+@receiver(setting_changed)
+def _clear_reverse_cache_on_setting_changed(sender, setting, **kwargs):  # noqa: ARG001
+    if setting == "ROOT_URLCONF":
+        clear_reverse_cache()
+
+
+def preload_redirects() -> tuple[dict[str, str], dict[str, Exception]]:
+    """
+    Reverses the target URL of every `redirect_view` in the URLconf that doesn't capture any values from
+    the request path, so the cache is warm before the first request.
+
+    Call it when a worker process starts, e.g. at the end of `wsgi.py` or `asgi.py`.
+
+    Returns:
+        A tuple of a `dictionary` of pattern names mapped to their URL and a `dictionary` of
+        pattern names that could not be reversed with the exception that was raised.
+    """
+
+    from fbv.views import redirect_view  # noqa: PLC0415
+
+    loaded: dict[str, str] = {}
+    errors: dict[str, Exception] = {}
+
+    for pattern, kwargs in iter_url_patterns():
+        # Redirects with captured values are reversed with different args for each request
+        if pattern.callback is not redirect_view or pattern.pattern.regex.groups:
+            continue
+
+        pattern_name: str = kwargs.get("pattern_name", "")
+        reverse_kwargs = {name: value for name, value in kwargs.items() if name not in ("pattern_name", "permanent")}
+
+        try:
+            loaded[pattern_name] = reverse_cached(pattern_name, kwargs=reverse_kwargs)
+        except NoReverseMatch as e:
+            errors[pattern_name] = e
+
+    return (loaded, errors)
@@ -0,0 +1,392 @@
+from collections.abc import Callable, Iterable
+from functools import cache
+
+from django.core.signals import setting_changed
+from django.db import models
+from django.db.models import Prefetch
+from django.db.models.query import FlatValuesListIterable, ModelIterable, ValuesListIterable
+from django.db.models.signals import class_prepared
+from django.dispatch import receiver
+from django.utils.encoding import is_protected_type
+
+__all__ = [
+    "FieldPlan",
+    "clear_field_plan_cache",
+    "get_field_plan",
+    "get_field_plan_cache_info",
+    "get_row_serializer",
+    "get_values_names",
+    "is_values_list_queryset",
+    "optimize_queryset",
+    "serialize_model",
+    "serialize_models",
+    "serialize_queryset",
+]
+
+
+VALUES_LIST_FORMATS = ("list", "dict", "columns")
+
+
+def _get_field_getter(field: models.Field) -> Callable:
+    """
+    Returns a function that gets the serializable value of `field` from a model instance.
+
+    Mirrors `django.core.serializers.python.Serializer._value_from_field`: protected types (i.e.
+    `None`, numbers, dates, and `Decimal`) are passed through as-is and everything else is converted
+    to a string.
+    """
+
+    attname = field.attname
+
+    if type(field).value_to_string is models.Field.value_to_string:
+        # `Field.value_to_string` is just `str(value)`, so skip the second attribute lookup
+        def str_getter(obj):
+            value = getattr(obj, attname)
+
+            return value if is_protected_type(value) else str(value)
+
+        return str_getter
+
+    def getter(obj):
+        value = getattr(obj, attname)
+
+        return value if is_protected_type(value) else field.value_to_string(obj)
+
+    return getter
+
+
+def _get_m2m_getter(field: models.ManyToManyField) -> Callable:
+    """
+    Returns a function that gets the list of related primary keys for a many-to-many `field`.
+
+    Uses the prefetched objects if they are available, otherwise only the primary keys are queried.
+    """
+
+    name = field.name
+    related_pk_getter = _get_field_getter(field.remote_field.model._meta.pk)
+
+    def getter(obj):
+        prefetched = getattr(obj, "_prefetched_objects_cache", {})
+
+        if name in prefetched:
+            related_objs = prefetched[name]
+        else:
+            related_objs = getattr(obj, name).select_related(None).only("pk")
+
+        return [related_pk_getter(related) for related in related_objs]
+
+    return getter
+
+
+class FieldPlan:
+    """
+    The fields of a model that get serialized along with a function to get each field's value.
+
+    Field selection follows `django.core.serializers.serialize` so the output matches the `pk` +
+    `fields` flattening that `render_json` has always returned.
+    """
+
+    def __init__(self, model: type[models.Model], fields: tuple[str, ...] | None = None):
+        self.model = model
+        self.fields = fields
+
+        # Use the concrete model's `_meta` to avoid `local_fields` problems for proxy models
+        meta = (model._meta.concrete_model or model)._meta
+
+        self.include_pk = fields is None or "pk" in fields
+        self.include_id = fields is not None and "id" in fields
+        self.pk_getter = _get_field_getter(meta.pk)
+
+        self.getters: list[tuple[str, Callable]] = []
+
+        # The names of the serialized concrete fields and many-to-many fields
+        self.field_names: list[str] = []
+        self.attnames: set[str] = set()
+        self.m2m_fields: list[models.ManyToManyField] = []
+
+        for field in meta.local_fields:
+            if not field.serialize:  # type: ignore[attr-defined]
+                continue
+
+            # Foreign keys are selected by name, but serialized with the related primary key
+            field_name = field.attname if field.remote_field is None else field.attname[:-3]
+
+            if fields is None or field_name in fields:
+                self.getters.append((field.name, _get_field_getter(field)))
+                self.field_names.append(field.name)
+                self.attnames.add(field.attname)
+
+        for field in meta.local_many_to_many:
+            if not field.serialize or not field.remote_field.through._meta.auto_created:  # type: ignore[attr-defined,union-attr]
+                continue
+
+            if fields is None or field.attname in fields:
+                self.getters.append((field.name, _get_m2m_getter(field)))
+                self.m2m_fields.append(field)
+
+    def requires_queries(self, obj: models.Model) -> bool:
+        """
+        Whether serializing the model instance queries the database, i.e. it has many-to-many
+        fields that were not prefetched or serialized fields that were deferred.
+        """
+
+        prefetched = getattr(obj, "_prefetched_objects_cache", {})
+
+        if any(field.name not in prefetched for field in self.m2m_fields):
+            return True
+
+        return not self.attnames.isdisjoint(obj.get_deferred_fields())
+
+    def serialize(self, obj: models.Model) -> dict:
+        """
+        Converts a model instance into a `dictionary`.
+        """
+
+        data = {}
+
+        if self.include_pk or self.include_id:
+            pk = self.pk_getter(obj)
+
+            if self.include_pk:
+                data["pk"] = pk
+
+            if self.include_id:
+                data["id"] = pk
+
+        for name, getter in self.getters:
+            data[name] = getter(obj)
+
+        return data
+
+
+@cache
+def _get_field_plan(model: type[models.Model], fields: tuple[str, ...] | None) -> FieldPlan:
+    return FieldPlan(model, fields)
+
+
+def get_field_plan(model: type[models.Model], fields: tuple[str, ...] | None = None) -> FieldPlan:
+    """
+    Returns the `FieldPlan` for a model and the selected fields.
+
+    Plans are cached for the life of the process because they only depend on the model's `_meta`.
+
+    Args:
+        model: The model class.
+        fields: Tuple of field names to include. All fields are included if `None`.
+    """
+
+    if fields is not None and not isinstance(fields, tuple):
+        fields = (fields,) if isinstance(fields, str) else tuple(fields)
+
+    return _get_field_plan(model, fields)
+
+
+def get_field_plan_cache_info():
+    """
+    Returns the hits, misses, and current size of the `FieldPlan` cache as a `functools` `CacheInfo`.
+    """
+
+    return _get_field_plan.cache_info()
+
+
+def clear_field_plan_cache() -> None:
+    """
+    Removes all cached `FieldPlan`s.
+    """
+
+    _get_field_plan.cache_clear()
+
+
+@receiver(class_prepared)
+def _clear_field_plan_cache_on_class_prepared(sender, **kwargs):  # noqa: ARG001
+    # A model class was (re-)created, so any cached plan could reference stale fields
+    clear_field_plan_cache()
+
+
+@receiver(setting_changed)
+def _clear_field_plan_cache_on_setting_changed(sender, setting, **kwargs):  # noqa: ARG001
+    if setting == "INSTALLED_APPS":
+        clear_field_plan_cache()
+
+
+def serialize_model(obj: models.Model, fields: tuple[str, ...] | None = None) -> dict:
+    """
+    Converts a Django `Model` instance into a `dictionary`.
+
+    Args:
+        obj: The model instance to serialize.
+        fields: Tuple of field names to include. All fields are included if `None`.
+    """
+
+    return get_field_plan(type(obj), fields).serialize(obj)
+
+
+def serialize_models(objs: Iterable[models.Model], fields: tuple[str, ...] | None = None) -> list[dict]:
+    """
+    Converts an iterable of Django `Model` instances (e.g. a `QuerySet`) into a `list` of `dictionaries`.
+
+    Args:
+        objs: The model instances to serialize.
+        fields: Tuple of field names to include. All fields are included if `None`.
+    """
+
+    plan = None
+    data = []
+
+    for obj in objs:
+        if plan is None or type(obj) is not plan.model:
+            plan = get_field_plan(type(obj), fields)
+
+        data.append(plan.serialize(obj))
+
+    return data
+
+
+def optimize_queryset(
+    queryset: models.QuerySet,
+    fields: tuple[str, ...] | None = None,
+    *,
+    prefetch: bool = True,
+) -> models.QuerySet:
+    """
+    Returns a `QuerySet` that only queries what gets serialized.
+
+    - `.only()` is applied for the selected `fields` so unused columns are not loaded.
+    - `.prefetch_related()` is applied for serialized many-to-many fields so their primary keys
+    are queried once for all rows instead of once per row.
+
+    Foreign keys are serialized as the related primary key, which is already a column on the row,
+    so they never need a `.select_related()`.
+
+    `QuerySet`s that were already evaluated, created with `.values()` or `.values_list()`, combined
+    with `.union()`, `.intersection()` or `.difference()`, or that already have deferred fields or
+    `.select_related()` are left alone.
+
+    Args:
+        queryset: The `QuerySet` to optimize.
+        fields: Tuple of field names that will be serialized. All fields are serialized if `None`.
+        prefetch: Whether to prefetch the serialized many-to-many fields.
+    """
+
+    if queryset._result_cache is not None or not issubclass(queryset._iterable_class, ModelIterable):  # type: ignore[attr-defined]
+        return queryset
+
+    # `.only()` and `.prefetch_related()` aren't supported after `.union()` and friends
+    if queryset.query.combinator:
+        return queryset
+
+    plan = get_field_plan(queryset.model, fields)
+    query = queryset.query
+
+    if fields is not None and not query.select_related and query.deferred_loading == (frozenset(), True):
+        queryset = queryset.only(*plan.field_names) if plan.field_names else queryset.only("pk")
+
+    prefetched_lookups = {
+        lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+        for lookup in queryset._prefetch_related_lookups  # type: ignore[attr-defined]
+    }
+    prefetches = [
+        Prefetch(field.name, queryset=field.remote_field.model._default_manager.only("pk"))
+        for field in plan.m2m_fields
+        if field.name not in prefetched_lookups
+    ]
+
+    if prefetch and prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+
+    return queryset
+
+
+def is_values_list_queryset(queryset: models.QuerySet) -> bool:
+    """
+    Whether the `QuerySet` was created with `.values_list()` (but not `flat=True`).
+    """
+
+    return issubclass(queryset._iterable_class, ValuesListIterable) and not issubclass(
+        queryset._iterable_class, FlatValuesListIterable
+    )
+
+
+def get_values_names(queryset: models.QuerySet) -> list[str]:
+    """
+    Returns the names of the columns of a `QuerySet` created with `.values()` or `.values_list()`.
+
+    Follows how `QuerySet.values_list(named=True)` names the columns.
+    """
+
+    if queryset._fields:  # type: ignore[attr-defined]
+        return list(queryset._fields)  # type: ignore[attr-defined]
+
+    query = queryset.query
+
+    return [*query.extra_select, *query.values_select, *query.annotation_select]
+
+
+def get_row_serializer(
+    queryset: models.QuerySet,
+    fields: tuple[str, ...] | None = None,
+    values_list_format: str = "list",
+) -> Callable | None:
+    """
+    Returns a function that converts one row of the `QuerySet` into something that can be encoded as
+    JSON, or `None` if the rows can be encoded as-is.
+
+    The kind of row is determined up front from the `QuerySet`'s iterable class, i.e. whether it
+    was created with `.values()`, `.values_list()`, or neither.
+
+    Args:
+        queryset: The `QuerySet` that will be iterated over.
+        fields: Tuple of field names to include. Only used for model instances.
+        values_list_format: How `.values_list()` rows get converted: "list" (or "columns") leaves
+            them as positional arrays and "dict" converts them into `dictionaries` keyed by column name.
+    """
+
+    if values_list_format not in VALUES_LIST_FORMATS:
+        raise ValueError(f"Unknown values_list format: {values_list_format}")
+
+    if issubclass(queryset._iterable_class, ModelIterable):
+        return get_field_plan(queryset.model, fields).serialize
+
+    if values_list_format == "dict" and is_values_list_queryset(queryset):
+        names = get_values_names(queryset)
+
+        return lambda row: dict(zip(names, row, strict=True))
+
+    return None
+
+
+def serialize_queryset(
+    queryset: models.QuerySet,
+    fields: tuple[str, ...] | None = None,
+    values_list_format: str = "list",
+    rows: Iterable | None = None,
+) -> list | dict:
+    """
+    Converts a `QuerySet` into a `list` that can be encoded as JSON.
+
+    `.values()` rows are returned as `dictionaries` and `.values_list()` rows are returned based on
+    `values_list_format`: "list" returns positional arrays, "dict" returns `dictionaries` keyed by
+    column name, and "columns" returns a `dictionary` in the form of `{"columns": [...], "rows": [[...]]}`.
+
+    Args:
+        queryset: The `QuerySet` to serialize.
+        fields: Tuple of field names to include. Only used for model instances.
+        values_list_format: How `.values_list()` rows are returned: "list", "dict", or "columns".
+        rows: The rows of the `QuerySet` that were already fetched (e.g. one page) to serialize instead of
+            iterating over the `QuerySet`.
+    """
+
+    if rows is None:
+        rows = queryset
+
+    row_serializer = get_row_serializer(queryset, fields=fields, values_list_format=values_list_format)
+
+    if row_serializer is None:
+        rows = list(rows)
+    else:
+        rows = [row_serializer(row) for row in rows]
+
+    if values_list_format == "columns" and is_values_list_queryset(queryset):
+        return {"columns": get_values_names(queryset), "rows": rows}
+
+    return rows
@@ -0,0 +1,11 @@
+from django.dispatch import Signal
+
+__all__ = [
+    "view_timed",
+]
+
+
+# Sent after a view decorated with `render_json`, `render_view`, or `render_html` has been timed.
+# Receivers get passed the view function as the `sender` and the `request`, `response`, and `timings`
+# (a `dictionary` of phase names to durations in milliseconds) kwargs.
+view_timed = Signal()
@@ -0,0 +1,129 @@
+from collections.abc import AsyncIterator, Iterator
+
+from asgiref.sync import sync_to_async
+from django.template.backends.django import Template as DjangoTemplate
+from django.template.base import Node, NodeList, TextNode
+from django.template.context import Context, make_context
+from django.template.loader_tags import BLOCK_CONTEXT_KEY, BlockContext, BlockNode, ExtendsNode
+
+__all__ = [
+    "astream_template",
+    "stream_template",
+]
+
+
+def _stream_extends(node: ExtendsNode, context: Context) -> Iterator[str]:
+    # Mirrors `ExtendsNode.render`, but streams the parent template instead of rendering it all at once
+    compiled_parent = node.get_parent(context)
+
+    if BLOCK_CONTEXT_KEY not in context.render_context:
+        context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
+
+    block_context = context.render_context[BLOCK_CONTEXT_KEY]
+    block_context.add_blocks(node.blocks)
+
+    # If the parent doesn't extend another template it is the root, so its blocks get added as well
+    for parent_node in compiled_parent.nodelist:
+        # The `ExtendsNode` has to be the first non-text node
+        if not isinstance(parent_node, TextNode):
+            if not isinstance(parent_node, ExtendsNode):
+                blocks = {n.name: n for n in compiled_parent.nodelist.get_nodes_by_type(BlockNode)}  # type: ignore[attr-defined]
+                block_context.add_blocks(blocks)
+
+            break
+
+    with context.render_context.push_state(compiled_parent, isolated_context=False):
+        yield from _stream_nodelist(compiled_parent.nodelist, context)
+
+
+def _stream_block(node: BlockNode, context: Context) -> Iterator[str]:
+    # Mirrors `BlockNode.render`, but streams the nodes of the block that overrides it
+    block_context = context.render_context.get(BLOCK_CONTEXT_KEY)
+
+    with context.push():
+        if block_context is None:
+            context["block"] = node
+
+            yield from _stream_nodelist(node.nodelist, context)
+
+            return
+
+        push = block = block_context.pop(node.name)
+
+        if block is None:
+            block = node
+
+        # A new block is created so the context can be stored without thread-safety issues
+        block = type(node)(block.name, block.nodelist)
+        block.context = context
+        context["block"] = block
+
+        yield from _stream_nodelist(block.nodelist, context)
+
+        if push is not None:
+            block_context.push(node.name, push)
+
+
+def _stream_nodelist(nodelist: NodeList, context: Context) -> Iterator[str]:
+    node: Node
+
+    for node in nodelist:
+        if isinstance(node, ExtendsNode):
+            yield from _stream_extends(node, context)
+        elif isinstance(node, BlockNode):
+            yield from _stream_block(node, context)
+        else:
+            chunk = node.render_annotated(context)
+
+            if chunk:
+                yield chunk  # type: ignore[misc]
+
+
+def stream_template(template, context: dict | None = None, request=None) -> Iterator[str]:
+    """
+    Renders a template one node at a time, so each top-level node and block is sent as soon as it has been
+    rendered instead of after the whole template has been rendered.
+
+    Templates from other backends than the Django template language (e.g. Jinja2) are rendered all at once.
+
+    Args:
+        template: a template returned by `django.template.loader.get_template`
+        context: the template context
+        request: the request, so that context processors run
+    """
+
+    if not isinstance(template, DjangoTemplate):
+        yield template.render(context, request)
+
+        return
+
+    engine_template = template.template
+    template_context = make_context(context, request, autoescape=template.backend.engine.autoescape)
+
+    # Mirrors `django.template.base.Template.render`
+    with template_context.render_context.push_state(engine_template):
+        if template_context.template is None:
+            with template_context.bind_template(engine_template):
+                template_context.template_name = engine_template.name
+
+                yield from _stream_nodelist(engine_template.nodelist, template_context)
+        else:
+            yield from _stream_nodelist(engine_template.nodelist, template_context)
+
+
+async def astream_template(template, context: dict | None = None, request=None) -> AsyncIterator[str]:
+    """
+    Same as `stream_template`, but each chunk is rendered in a thread so that `StreamingHttpResponse` doesn't
+    have to render the whole template before sending it under ASGI. Rendering can query the database.
+    """
+
+    chunks = stream_template(template, context, request)
+    get_next_chunk = sync_to_async(lambda: next(chunks, None))
+
+    while True:
+        chunk = await get_next_chunk()
+
+        if chunk is None:
+            break
+
+        yield chunk
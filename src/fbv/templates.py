@@ -0,0 +1,86 @@
+from collections.abc import Iterator
+
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+
+from fbv.decorators import _template_views, get_default_template_name
+from fbv.utils import iter_url_patterns, iter_view_kwargs
+
+__all__ = [
+    "get_template_names",
+    "warm_templates",
+]
+
+
+def _iter_bound_templates() -> Iterator[tuple[str, bool]]:
+    """
+    Yields the name of each template that is bound to a view and whether it was derived from the
+    view instead of being explicitly specified.
+    """
+
+    from fbv.views import html_view  # noqa: PLC0415
+
+    # Import the URLconf so that all views decorated with `render_view` are registered
+    list(iter_url_patterns())
+
+    for func, template_name in list(_template_views.items()):
+        # `html_view` always gets its template name from `urls.py`
+        if func is html_view.__wrapped__:
+            continue
+
+        if template_name is None:
+            yield (get_default_template_name(func), True)
+        else:
+            yield (template_name, False)
+
+    for kwargs in iter_view_kwargs(html_view):
+        if kwargs.get("template_name"):
+            yield (kwargs["template_name"], False)
+
+
+def get_template_names() -> list[str]:
+    """
+    Returns the names of the templates that are bound to views.
+
+    Includes the templates passed into (or derived by) `render_view` and `render_html`, and the
+    `template_name` kwargs in `urls.py` for `html_view`.
+    """
+
+    return list(dict.fromkeys(template_name for (template_name, _) in _iter_bound_templates()))
+
+
+def warm_templates() -> tuple[list[str], dict[str, Exception]]:
+    """
+    Loads and compiles every template that is bound to a view so that the template loaders'
+    caches are warm before the first request.
+
+    Call it when a worker process starts, e.g. at the end of `wsgi.py` or `asgi.py`.
+
+    Returns:
+        A tuple of the template names that were loaded and a `dictionary` of template names
+        that could not be loaded with the exception that was raised. Missing derived templates
+        are skipped because the view might always return a `TEMPLATE` key instead.
+    """
+
+    loaded: list[str] = []
+    errors: dict[str, Exception] = {}
+
+    for template_name, is_derived in _iter_bound_templates():
+        if template_name in loaded or template_name in errors:
+            continue
+
+        try:
+            get_template(template_name)
+        except TemplateDoesNotExist as e:
+            if not is_derived:
+                errors[template_name] = e
+
+            continue
+        except Exception as e:
+            errors[template_name] = e
+
+            continue
+
+        loaded.append(template_name)
+
+    return (loaded, errors)
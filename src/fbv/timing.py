@@ -0,0 +1,88 @@
+from time import perf_counter
+
+from django.conf import settings
+from django.http.response import HttpResponseBase
+
+from fbv.signals import view_timed
+
+__all__ = [
+    "NULL_TIMER",
+    "Timer",
+    "get_timer",
+]
+
+
+class Timer:
+    """
+    Records how long each phase of rendering a view takes.
+
+    Phases are consecutive: `mark` attributes all of the time since the previous mark (or since the timer was
+    created) to the phase. Marking the same phase more than once adds up the durations.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+        self._started_at = perf_counter()
+
+    def mark(self, phase: str) -> None:
+        now = perf_counter()
+
+        self.timings[phase] = self.timings.get(phase, 0) + (now - self._started_at) * 1000
+        self._started_at = now
+
+    def finish(self, view, request, response):
+        """
+        Stores the timings in `request.fbv_timings`, adds the `Server-Timing` header to the response (unless
+        the `FBV_TIMING_HEADER` setting is `False`), and sends the `fbv.signals.view_timed` signal.
+        """
+
+        request.fbv_timings = self.timings
+
+        if isinstance(response, HttpResponseBase):
+            if getattr(settings, "FBV_TIMING_HEADER", True):
+                header = ", ".join(f"{phase};dur={duration:.3f}" for phase, duration in self.timings.items())
+
+                if response.has_header("Server-Timing"):
+                    header = f"{response['Server-Timing']}, {header}"
+
+                response.headers["Server-Timing"] = header
+
+            view_timed.send(sender=view, request=request, response=response, timings=self.timings)
+
+        return response
+
+
+class _NullTimer(Timer):
+    """
+    A `Timer` that doesn't record anything so timing can be turned off without extra checks.
+    """
+
+    enabled = False
+
+    def __init__(self):
+        self.timings = {}
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def finish(self, view, request, response):  # noqa: ARG002
+        return response
+
+
+NULL_TIMER = _NullTimer()
+
+
+def get_timer(*, timing: bool | None = None) -> Timer:
+    """
+    Returns a new `Timer` if timing is turned on, otherwise `NULL_TIMER`.
+
+    Args:
+        timing: whether to time the view; defaults to the `FBV_TIMING` setting
+    """
+
+    if timing is None:
+        timing = getattr(settings, "FBV_TIMING", False)
+
+    return Timer() if timing else NULL_TIMER
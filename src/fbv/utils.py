@@ -0,0 +1,45 @@
+from collections.abc import Callable, Iterator
+
+from django.conf import settings
+from django.urls import URLPattern, URLResolver, get_resolver
+
+__all__ = [
+    "iter_url_patterns",
+    "iter_view_kwargs",
+]
+
+
+def iter_url_patterns(
+    patterns: list | None = None,
+    default_kwargs: dict | None = None,
+) -> Iterator[tuple[URLPattern, dict]]:
+    """
+    Yields every `URLPattern` in the URLconf along with its kwargs from `urls.py`, including the
+    kwargs passed into `include()`.
+
+    Importing the URLconf also imports all of the views it references.
+    """
+
+    if patterns is None:
+        if not getattr(settings, "ROOT_URLCONF", None):
+            return
+
+        patterns = get_resolver().url_patterns
+
+    default_kwargs = default_kwargs or {}
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_url_patterns(pattern.url_patterns, {**default_kwargs, **pattern.default_kwargs})
+        elif isinstance(pattern, URLPattern):
+            yield (pattern, {**default_kwargs, **pattern.default_args})
+
+
+def iter_view_kwargs(view: Callable) -> Iterator[dict]:
+    """
+    Yields the kwargs from `urls.py` for every `URLPattern` that routes to `view`.
+    """
+
+    for pattern, kwargs in iter_url_patterns():
+        if pattern.callback is view:
+            yield kwargs
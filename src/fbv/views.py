@@ -1,4 +1,7 @@
-from django.conf import settings
+import hashlib
+from functools import lru_cache
+
+from django.core.handlers.asgi import ASGIRequest
 from django.http import (
     FileResponse,
     HttpRequest,
@@ -6,11 +9,30 @@ from django.http import (
     HttpResponsePermanentRedirect,
     HttpResponseRedirect,
 )
-from django.urls import reverse
+from django.http.response import HttpResponseBase
+from django.utils.cache import patch_vary_headers
+from django.utils.http import quote_etag
 from django.views.decorators.cache import cache_control
 from django.views.decorators.http import require_GET
 
+from fbv.conditional import not_modified_response, set_validators
 from fbv.decorators import render_html
+from fbv.files import (
+    content_response,
+    get_content_type,
+    get_file_path,
+    get_file_validators,
+    get_precompressed_file,
+    get_precompressed_variants,
+    get_sendfile_backend,
+    mmap_response,
+    range_response,
+    read_file,
+    sendfile_response,
+    should_mmap,
+    stat_file,
+)
+from fbv.redirects import reverse_cached
 
 
 @render_html()
@@ -32,9 +54,11 @@ def redirect_view(request: HttpRequest, *args, pattern_name=None, permanent=Fals
     """
     Redirect to a named pattern directly from urls.py.
 
+    The URL is cached with `fbv.redirects.reverse_cached`.
+
     Based on code in https://spookylukey.github.io/django-views-the-right-way/redirects.html#additional-keyword-parameters.
     """
-    url = reverse(pattern_name, args=args, kwargs=kwargs)
+    url = reverse_cached(pattern_name, args=args, kwargs=kwargs)
 
     if permanent:
         return HttpResponsePermanentRedirect(url)
@@ -44,7 +68,7 @@ def redirect_view(request: HttpRequest, *args, pattern_name=None, permanent=Fals
 
 @require_GET
 @cache_control(max_age=60 * 60 * 24, immutable=True, public=True)
-def favicon_file(request: HttpRequest, file_path: str) -> FileResponse:
+def favicon_file(request: HttpRequest, file_path: str) -> HttpResponseBase:
     """
     Serves a favicon from the file path.
 
@@ -56,31 +80,98 @@ def favicon_file(request: HttpRequest, file_path: str) -> FileResponse:
 
 @require_GET
 @cache_control(max_age=60 * 60 * 24, immutable=True, public=True)
-def file(request: HttpRequest, file_path: str) -> FileResponse:  # noqa: ARG001
+def file(request: HttpRequest, file_path: str) -> HttpResponseBase:
     """
     Serves a file from the file path.
 
+    The response has `ETag` and `Last-Modified` headers based on `os.stat` and conditional requests
+    get a `304 Not Modified` response without opening the file. If the `FBV_SENDFILE_BACKEND` setting
+    is set, the web server is told to send the file instead. Otherwise, `Range` requests get a
+    `206 Partial Content` response with only the requested bytes and a precompressed version of the
+    file (e.g. `robots.txt.br`) is sent if the request accepts its encoding. Small files are served from
+    memory when the `FBV_FILE_CACHE_MAX_SIZE` setting is set and large files are memory-mapped when the
+    `FBV_FILE_MMAP_MIN_SIZE` setting is set.
+
     Based on code in https://adamj.eu/tech/2022/01/18/how-to-add-a-favicon-to-your-django-site/#what-the-file-type.
     """
 
-    # Don't use context manager to open the file because it will be closed automatically
-    # per https://docs.djangoproject.com/en/4.0/ref/request-response/#fileresponse-objects
-    file = (settings.BASE_DIR / file_path).open("rb")
+    path = get_file_path(file_path)
+    stat = stat_file(path)
+    filename = path.name
+    content_type = get_content_type(path)
+    content_encoding = None
+    is_async = isinstance(request, ASGIRequest)
+
+    # The web server handles content negotiation for files it sends and responses only vary on the
+    # encoding when there is a precompressed version to choose
+    is_negotiated = get_sendfile_backend() is None and bool(get_precompressed_variants(path, stat))
+
+    if is_negotiated and (precompressed := get_precompressed_file(request, path, stat)) is not None:
+        (path, stat, content_encoding) = precompressed
+
+    validators = get_file_validators(path, stat)
+
+    # Conditional requests are answered without opening the file
+    response: HttpResponseBase | None = not_modified_response(request, *validators)
+
+    if response is None:
+        response = sendfile_response(path)
+
+    if response is None:
+        response = range_response(request, path, stat, validators, content_type=content_type, is_async=is_async)
+
+    if response is None and (content := read_file(path, stat)) is not None:
+        response = content_response(content, content_type=content_type, filename=filename)
+
+    # `wsgi.file_wrapper` (e.g. `os.sendfile`) is used for a `FileResponse` when the server provides it
+    if response is None and should_mmap(stat) and "wsgi.file_wrapper" not in request.META:
+        response = mmap_response(path, stat, content_type=content_type, filename=filename, is_async=is_async)
+
+    if response is None:
+        # Don't use context manager to open the file because it will be closed automatically
+        # per https://docs.djangoproject.com/en/4.0/ref/request-response/#fileresponse-objects
+        response = FileResponse(path.open("rb"), content_type=content_type, filename=filename)
+
+    if response.status_code != 304:  # noqa: PLR2004
+        response["Accept-Ranges"] = "bytes"
 
-    return FileResponse(file)
+        if content_encoding is not None and response.status_code != 416:  # noqa: PLR2004
+            response["Content-Encoding"] = content_encoding
+
+    if is_negotiated:
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+    return set_validators(request, response, *validators)
+
+
+@lru_cache(maxsize=128)
+def _get_favicon_emoji_svg(emoji: str) -> tuple[bytes, str]:
+    # The SVG only depends on the emoji, so it is encoded and hashed once per emoji
+    svg = f"""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
+<text y=".9em" font-size="90">{emoji}</text>
+</svg>""".encode()
+
+    etag = quote_etag(hashlib.md5(svg, usedforsecurity=False).hexdigest())
+
+    return (svg, etag)
 
 
 @require_GET
 @cache_control(max_age=60 * 60 * 24, immutable=True, public=True)
-def favicon_emoji(request: HttpRequest, emoji: str) -> HttpResponse:  # noqa: ARG001
+def favicon_emoji(request: HttpRequest, emoji: str) -> HttpResponseBase:
     """
     Serves an emoji favicon.
 
+    The SVG and its `ETag` are cached for each emoji and conditional requests get a `304 Not Modified` response.
+
     Based on code in https://adamj.eu/tech/2022/01/18/how-to-add-a-favicon-to-your-django-site/#what-the-file-type.
     """
 
-    svg = f"""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
-<text y=".9em" font-size="90">{emoji}</text>
-</svg>"""
+    (svg, etag) = _get_favicon_emoji_svg(emoji)
+
+    response: HttpResponseBase | None = not_modified_response(request, etag, None)
+
+    if response is None:
+        response = HttpResponse(svg, content_type="image/svg+xml")
 
-    return HttpResponse(svg, content_type="image/svg+xml")
+    return set_validators(request, response, etag, None)
@@ -0,0 +1,59 @@
+import pytest
+from django.http import FileResponse
+
+from fbv.views import file
+
+pytestmark = pytest.mark.benchmark(group="file")
+
+
+@pytest.fixture
+def file_path(request, tmp_path, settings):
+    settings.BASE_DIR = tmp_path
+
+    path = tmp_path / f"{request.param}.bin"
+    path.write_bytes(b"x" * request.param)
+
+    return path.name
+
+
+def _get_content(response):
+    return b"".join(response.streaming_content) if response.streaming else response.content
+
+
+@pytest.mark.parametrize("file_path", (100, 1024 * 1024, 10 * 1024 * 1024), indirect=True)
+def test_file(benchmark, rf, file_path):
+    def get():
+        return _get_content(file(rf.get("/"), file_path))
+
+    assert benchmark(get)
+
+
+@pytest.mark.parametrize("file_path", (100, 1024 * 1024, 10 * 1024 * 1024), indirect=True)
+def test_file_baseline(benchmark, rf, file_path, settings):
+    def view(request):
+        return FileResponse((settings.BASE_DIR / file_path).open("rb"))
+
+    def get():
+        return _get_content(view(rf.get("/")))
+
+    assert benchmark(get)
+
+
+@pytest.mark.parametrize("file_path", (100,), indirect=True)
+def test_file_cache(benchmark, rf, file_path, settings):
+    settings.FBV_FILE_CACHE_MAX_SIZE = 1024 * 1024
+
+    def get():
+        return _get_content(file(rf.get("/"), file_path))
+
+    assert benchmark(get)
+
+
+@pytest.mark.parametrize("file_path", (10 * 1024 * 1024,), indirect=True)
+def test_file_mmap(benchmark, rf, file_path, settings):
+    settings.FBV_FILE_MMAP_MIN_SIZE = 1
+
+    def get():
+        return _get_content(file(rf.get("/"), file_path))
+
+    assert benchmark(get)
@@ -0,0 +1,153 @@
+import pytest
+from django.core import serializers
+from django.http import JsonResponse
+from tests.models import FakeModel
+
+from fbv.decorators import render_json
+
+pytestmark = pytest.mark.benchmark(group="render_json")
+
+
+def _serialize_models(objs):
+    # What a plain Django view does to return models as JSON
+    return [{"pk": obj["pk"], **obj["fields"]} for obj in serializers.serialize("python", objs)]
+
+
+@pytest.fixture
+def fake_models(request):
+    count = request.param
+    FakeModel.objects.bulk_create(FakeModel(name=f"name-{idx}", is_valid=idx % 2 == 0) for idx in range(count))
+
+    return count
+
+
+def test_dictionary(benchmark, rf):
+    data = {"name": "test", "count": 123, "items": list(range(100))}
+
+    @render_json
+    def view(request):
+        return data
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+def test_dictionary_baseline(benchmark, rf):
+    data = {"name": "test", "count": 123, "items": list(range(100))}
+
+    def view(request):
+        return JsonResponse(data)
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_model(benchmark, rf):
+    fake_model = FakeModel.objects.create(name="test")
+
+    @render_json
+    def view(request):
+        return fake_model
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_model_baseline(benchmark, rf):
+    fake_model = FakeModel.objects.create(name="test")
+
+    def view(request):
+        return JsonResponse(_serialize_models([fake_model])[0])
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("fake_models", (10, 1_000), indirect=True)
+def test_queryset(benchmark, rf, fake_models):
+    @render_json
+    def view(request):
+        return FakeModel.objects.all()
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("fake_models", (10, 1_000), indirect=True)
+def test_queryset_baseline(benchmark, rf, fake_models):
+    def view(request):
+        return JsonResponse(_serialize_models(FakeModel.objects.all()), safe=False)
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.parametrize("fake_models", (100_000,), indirect=True)
+def test_queryset_large(benchmark, rf, fake_models):
+    @render_json
+    def view(request):
+        return FakeModel.objects.all()
+
+    response = benchmark.pedantic(view, args=(rf.get("/"),), rounds=3)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.parametrize("fake_models", (100_000,), indirect=True)
+def test_queryset_large_baseline(benchmark, rf, fake_models):
+    def view(request):
+        return JsonResponse(_serialize_models(FakeModel.objects.all()), safe=False)
+
+    response = benchmark.pedantic(view, args=(rf.get("/"),), rounds=3)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("fake_models", (1_000,), indirect=True)
+def test_queryset_values(benchmark, rf, fake_models):
+    @render_json
+    def view(request):
+        return FakeModel.objects.values("id", "name")
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("fake_models", (1_000,), indirect=True)
+def test_queryset_values_baseline(benchmark, rf, fake_models):
+    def view(request):
+        return JsonResponse(list(FakeModel.objects.values("id", "name")), safe=False)
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("fake_models", (1_000,), indirect=True)
+def test_queryset_stream(benchmark, rf, fake_models):
+    @render_json(stream=True)
+    def view(request):
+        return FakeModel.objects.all()
+
+    def get():
+        return b"".join(view(rf.get("/")).streaming_content)
+
+    assert benchmark(get)
@@ -0,0 +1,54 @@
+import pytest
+from django.shortcuts import render
+
+from fbv.decorators import render_view
+
+pytestmark = pytest.mark.benchmark(group="render_view")
+
+
+def _get_rows(count):
+    return [{"name": f"name {idx}", "is_valid": idx % 2 == 0} for idx in range(count)]
+
+
+def test_small_template(benchmark, rf):
+    @render_view("benchmarks/small.html")
+    def view(request):
+        return {"title": "test"}
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+def test_small_template_baseline(benchmark, rf):
+    def view(request):
+        return render(request, "benchmarks/small.html", {"title": "test"})
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("count", (10, 1_000))
+def test_rows_template(benchmark, rf, count):
+    rows = _get_rows(count)
+
+    @render_view("benchmarks/rows.html")
+    def view(request):
+        return {"title": "test", "rows": rows}
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("count", (10, 1_000))
+def test_rows_template_baseline(benchmark, rf, count):
+    rows = _get_rows(count)
+
+    def view(request):
+        return render(request, "benchmarks/rows.html", {"title": "test", "rows": rows})
+
+    response = benchmark(view, rf.get("/"))
+
+    assert response.status_code == 200
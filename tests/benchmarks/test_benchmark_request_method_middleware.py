@@ -0,0 +1,26 @@
+import pytest
+from django.http import HttpResponse
+
+from fbv.middleware import RequestMethodMiddleware
+
+pytestmark = pytest.mark.benchmark(group="request_method_middleware")
+
+
+def get_response(request):
+    return HttpResponse()
+
+
+def test_middleware(benchmark, rf):
+    middleware = RequestMethodMiddleware(get_response)
+    request = rf.post("/")
+
+    benchmark(middleware, request)
+
+    assert request.is_post
+
+
+def test_middleware_baseline(benchmark, rf):
+    def middleware(request):
+        return get_response(request)
+
+    benchmark(middleware, rf.post("/"))
@@ -0,0 +1,64 @@
+from fbv.checks import check_render_view_templates
+from fbv.decorators import get_default_template_name, module_template_name, render_view
+from fbv.views import html_view
+
+
+def _get_messages(func):
+    return [message for message in check_render_view_templates(None) if message.obj is func]
+
+
+def test_template_exists():
+    @render_view("test/template.html")
+    def _(*args):
+        return {}
+
+    assert _get_messages(_.__wrapped__) == []
+
+
+def test_missing_template():
+    @render_view("test/missing-template.html")
+    def _(*args):
+        return {}
+
+    messages = _get_messages(_.__wrapped__)
+
+    assert len(messages) == 1
+    assert messages[0].id == "fbv.E001"
+
+
+def test_missing_default_template():
+    @render_view()
+    def view_with_missing_default_template(*args):
+        return {}
+
+    messages = _get_messages(view_with_missing_default_template.__wrapped__)
+
+    assert len(messages) == 1
+    assert messages[0].id == "fbv.W001"
+    assert "test_render_view_templates/view_with_missing_default_template.html" in messages[0].msg
+
+
+def test_html_view_is_skipped():
+    assert _get_messages(html_view.__wrapped__) == []
+
+
+def _app_template_name(func):
+    return f"test/{func.__name__.removeprefix('resolved_')}"
+
+
+def test_template_name_resolver_setting(settings, request):
+    settings.FBV_TEMPLATE_NAME_RESOLVER = "tests.checks.test_render_view_templates._app_template_name"
+
+    @render_view
+    def resolved_template(*args):
+        return {"test": 123}
+
+    assert get_default_template_name(resolved_template.__wrapped__) == "test/template.html"
+    assert _get_messages(resolved_template.__wrapped__) == []
+    assert resolved_template(request).content.decode() == "asdf 123"
+
+    settings.FBV_TEMPLATE_NAME_RESOLVER = module_template_name
+
+    template_name = get_default_template_name(resolved_template.__wrapped__)
+
+    assert template_name == "test_render_view_templates/resolved_template.html"
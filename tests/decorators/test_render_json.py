@@ -1,14 +1,27 @@
+import datetime as dt
 import json
+from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.exceptions import BadRequest
+from django.db import connection
+from django.db.models import Max
+from django.http import HttpResponse
+from django.test.utils import CaptureQueriesContext
+from django.utils.http import http_date
 from django.utils.timezone import now
-from tests.models import FakeModel
+from tests.models import FakeModel, FakeRelatedModel, FakeTag
 
 from fbv.decorators import (
     DEFAULT_JSON_SEPARATORS,
     MINIFIED_JSON_SEPARATORS,
     render_json,
 )
+from fbv.queries import QueryBudgetExceeded, QueryBudgetWarning
+from fbv.serializers import optimize_queryset
+from fbv.signals import view_timed
 
 
 def test_render_json_no_parens(request):
@@ -328,3 +341,803 @@ def test_render_json_queryset_values_list_flat(request):
 
     assert response.headers["Content-Type"] == "application/json"
     assert response.content.decode() == expected
+
+
+@pytest.mark.django_db
+def test_render_json_queryset_stream(request):
+    fake_model_one = FakeModel(name="test123", is_valid=True)
+    fake_model_one.save()
+
+    fake_model_two = FakeModel(name="test456", is_valid=False)
+    fake_model_two.save()
+
+    @render_json(stream=True, chunk_size=1)
+    def _(*args):
+        return FakeModel.objects.all()
+
+    response = _(request)
+
+    expected = json.dumps(
+        [
+            {"pk": fake_model_one.id, "name": "test123", "is_valid": True},
+            {"pk": fake_model_two.id, "name": "test456", "is_valid": False},
+        ],
+        separators=MINIFIED_JSON_SEPARATORS,
+    )
+
+    assert response.streaming
+    assert response.headers["Content-Type"] == "application/json"
+    assert b"".join(response.streaming_content).decode() == expected
+
+
+@pytest.mark.django_db
+def test_render_json_queryset_stream_empty(request):
+    @render_json(stream=True)
+    def _(*args):
+        return FakeModel.objects.all()
+
+    response = _(request)
+
+    assert b"".join(response.streaming_content).decode() == "[]"
+
+
+@pytest.mark.django_db
+def test_render_json_queryset_stream_values(request):
+    FakeModel.objects.create(name="test123", is_valid=True)
+
+    @render_json(stream=True, fields=("name",), separators=DEFAULT_JSON_SEPARATORS)
+    def _(*args):
+        return FakeModel.objects.all().values("name")
+
+    response = _(request)
+
+    assert b"".join(response.streaming_content).decode() == '[{"name": "test123"}]'
+
+
+def test_render_json_dictionary_stream(request):
+    @render_json(stream=True)
+    def _(*args):
+        return {"test": 123}
+
+    response = _(request)
+
+    assert not response.streaming
+    assert response.content.decode() == '{"test":123}'
+
+
+@pytest.mark.parametrize("encoder", ["auto", "json", "orjson"])
+def test_render_json_encoder(request, encoder):
+    test_date_time = now()
+    dt = test_date_time.isoformat()[:-9]
+
+    @render_json(encoder=encoder)
+    def _(*args):
+        return {"test_date_time": test_date_time, "test": [1, 2]}
+
+    response = _(request)
+
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.content.decode() == f'{{"test_date_time":"{dt}Z","test":[1,2]}}'
+
+
+def test_render_json_encoder_callable(request):
+    def encode(data, separators):
+        return f"{len(data)}{separators[0]}"
+
+    @render_json(encoder=encode)
+    def _(*args):
+        return {"test": 123}
+
+    response = _(request)
+
+    assert response.content.decode() == "1,"
+
+
+@pytest.mark.django_db
+def test_render_json_queryset_values_list_dict(request):
+    fake_model_one = FakeModel.objects.create(name="test123", is_valid=True)
+
+    @render_json(values_list_format="dict")
+    def _(*args):
+        return FakeModel.objects.all().values_list("id", "name")
+
+    response = _(request)
+
+    assert response.content.decode() == f'[{{"id":{fake_model_one.id},"name":"test123"}}]'
+
+
+@pytest.mark.django_db
+def test_render_json_queryset_values_list_dict_all_fields(request):
+    fake_model_one = FakeModel.objects.create(name="test123", is_valid=True)
+
+    @render_json(values_list_format="dict")
+    def _(*args):
+        return FakeModel.objects.all().values_list(named=True)
+
+    response = _(request)
+
+    assert response.content.decode() == f'[{{"id":{fake_model_one.id},"name":"test123","is_valid":true}}]'
+
+
+@pytest.mark.django_db
+def test_render_json_queryset_values_list_columns(request):
+    fake_model_one = FakeModel.objects.create(name="test123", is_valid=True)
+    fake_model_two = FakeModel.objects.create(name="test456", is_valid=False)
+
+    @render_json(values_list_format="columns")
+    def _(*args):
+        return FakeModel.objects.all().values_list("id", "name")
+
+    response = _(request)
+
+    expected = json.dumps(
+        {
+            "columns": ["id", "name"],
+            "rows": [[fake_model_one.id, "test123"], [fake_model_two.id, "test456"]],
+        },
+        separators=MINIFIED_JSON_SEPARATORS,
+    )
+
+    assert response.content.decode() == expected
+
+
+@pytest.mark.django_db
+def test_render_json_queryset_values_list_columns_stream(request):
+    fake_model_one = FakeModel.objects.create(name="test123", is_valid=True)
+    fake_model_two = FakeModel.objects.create(name="test456", is_valid=False)
+
+    @render_json(values_list_format="columns", stream=True, separators=DEFAULT_JSON_SEPARATORS)
+    def _(*args):
+        return FakeModel.objects.all().values_list("id", "name")
+
+    response = _(request)
+
+    expected = json.dumps(
+        {
+            "columns": ["id", "name"],
+            "rows": [[fake_model_one.id, "test123"], [fake_model_two.id, "test456"]],
+        },
+        separators=DEFAULT_JSON_SEPARATORS,
+    )
+
+    assert b"".join(response.streaming_content).decode() == expected
+
+
+@pytest.mark.django_db
+def test_render_json_queryset_values_list_flat_columns(request):
+    fake_model_one = FakeModel.objects.create(name="test123", is_valid=True)
+
+    @render_json(values_list_format="columns")
+    def _(*args):
+        return FakeModel.objects.all().values_list("id", flat=True)
+
+    response = _(request)
+
+    assert response.content.decode() == f"[{fake_model_one.id}]"
+
+
+@pytest.mark.django_db
+def test_render_json_queryset_values_list_invalid_format(request):
+    @render_json(values_list_format="invalid")
+    def _(*args):
+        return FakeModel.objects.all().values_list("id")
+
+    with pytest.raises(ValueError):
+        _(request)
+
+
+@pytest.fixture
+def related_models(db):
+    tag = FakeTag.objects.create(name="tag")
+
+    for _ in range(3):
+        FakeRelatedModel.objects.create().tags.add(tag)
+
+    return FakeRelatedModel.objects.all()
+
+
+def test_render_json_queryset_optimize_only(request, related_models):
+    @render_json(fields=("fake_model",))
+    def _(*args):
+        return FakeRelatedModel.objects.all()
+
+    with CaptureQueriesContext(connection) as queries:
+        response = _(request)
+
+    assert len(queries) == 1
+    assert "price" not in queries[0]["sql"]
+    assert "fake_model_id" in queries[0]["sql"]
+    assert json.loads(response.content) == [{"fake_model": None}] * 3
+
+
+def test_render_json_queryset_optimize_prefetch(request, related_models, django_assert_num_queries):
+    tag = FakeTag.objects.get()
+
+    @render_json(fields=("pk", "tags"))
+    def _(*args):
+        return FakeRelatedModel.objects.all()
+
+    with django_assert_num_queries(2):
+        response = _(request)
+
+    assert json.loads(response.content) == [{"pk": obj.pk, "tags": [tag.pk]} for obj in related_models]
+
+
+def test_render_json_queryset_optimize_prefetch_stream(request, related_models, django_assert_num_queries):
+    @render_json(fields=("tags",), stream=True, chunk_size=10)
+    def _(*args):
+        return FakeRelatedModel.objects.all()
+
+    response = _(request)
+
+    with django_assert_num_queries(2):
+        content = b"".join(response.streaming_content)
+
+    assert len(json.loads(content)) == 3
+
+
+def test_render_json_queryset_optimize_existing_prefetch(request, related_models, django_assert_num_queries):
+    @render_json(fields=("tags",))
+    def _(*args):
+        return FakeRelatedModel.objects.prefetch_related("tags")
+
+    with django_assert_num_queries(2):
+        _(request)
+
+
+def test_render_json_queryset_optimize_select_related(request, related_models):
+    @render_json(fields=("price",))
+    def _(*args):
+        return FakeRelatedModel.objects.select_related("fake_model")
+
+    response = _(request)
+
+    assert json.loads(response.content) == [{"price": None}] * 3
+
+
+@pytest.mark.parametrize("fields", (("price",), None))
+def test_render_json_queryset_optimize_union(request, related_models, fields):
+    first = FakeRelatedModel.objects.first()
+
+    @render_json(fields=fields)
+    def _(*args):
+        return FakeRelatedModel.objects.filter(pk=first.pk).union(FakeRelatedModel.objects.exclude(pk=first.pk))
+
+    response = _(request)
+
+    assert len(json.loads(response.content)) == 3
+
+
+def test_render_json_queryset_no_optimize(request, related_models, django_assert_num_queries):
+    @render_json(fields=("tags",), optimize=False)
+    def _(*args):
+        return FakeRelatedModel.objects.all()
+
+    with django_assert_num_queries(4):
+        _(request)
+
+
+def test_render_json_async(request):
+    @render_json
+    async def _(*args):
+        return {"test": 123}
+
+    assert iscoroutinefunction(_)
+
+    response = async_to_sync(_)(request)
+
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.content.decode() == '{"test":123}'
+
+
+def test_render_json_async_not_dictionary(request):
+    @render_json()
+    async def _(*args):
+        return "test123"
+
+    assert async_to_sync(_)(request) == "test123"
+
+
+@pytest.mark.django_db
+def test_render_json_async_queryset(request):
+    fake_model_one = FakeModel.objects.create(name="test123", is_valid=True)
+
+    @render_json()
+    async def _(*args):
+        return FakeModel.objects.all()
+
+    response = async_to_sync(_)(request)
+
+    assert response.content.decode() == f'[{{"pk":{fake_model_one.id},"name":"test123","is_valid":true}}]'
+
+
+@pytest.mark.django_db
+def test_render_json_async_queryset_values(request):
+    FakeModel.objects.create(name="test123", is_valid=True)
+
+    @render_json()
+    async def _(*args):
+        return FakeModel.objects.all().values("name")
+
+    response = async_to_sync(_)(request)
+
+    assert response.content.decode() == '[{"name":"test123"}]'
+
+
+@pytest.mark.django_db
+def test_render_json_async_queryset_m2m(request):
+    tag = FakeTag.objects.create(name="tag")
+    related = FakeRelatedModel.objects.create()
+    related.tags.add(tag)
+
+    @render_json(fields=("tags",))
+    async def _(*args):
+        return FakeRelatedModel.objects.all()
+
+    @render_json(fields=("tags",), optimize=False)
+    async def not_optimized(*args):
+        return FakeRelatedModel.objects.all()
+
+    assert async_to_sync(_)(request).content.decode() == f'[{{"tags":[{tag.pk}]}}]'
+    assert async_to_sync(not_optimized)(request).content.decode() == f'[{{"tags":[{tag.pk}]}}]'
+
+
+@pytest.mark.django_db
+def test_render_json_async_model(request):
+    tag = FakeTag.objects.create(name="tag")
+    related = FakeRelatedModel.objects.create()
+    related.tags.add(tag)
+
+    @render_json(fields=("tags",))
+    async def _(*args):
+        return await FakeRelatedModel.objects.aget(pk=related.pk)
+
+    assert async_to_sync(_)(request).content.decode() == f'{{"tags":[{tag.pk}]}}'
+
+
+@pytest.mark.django_db
+def test_render_json_async_queryset_stream_without_prefetch(request):
+    tag = FakeTag.objects.create(name="tag")
+    FakeRelatedModel.objects.create().tags.add(tag)
+
+    @render_json(fields=("tags",), stream=True)
+    async def _(*args):
+        return FakeRelatedModel.objects.order_by("pk")
+
+    async def consume(response):
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    # `QuerySet.aiterator()` raises for `prefetch_related()` before Django 5.0
+    with (
+        patch("django.VERSION", (4, 2, 0, "final", 0)),
+        patch("fbv.decorators.optimize_queryset", wraps=optimize_queryset) as mock_optimize_queryset,
+    ):
+        content = async_to_sync(consume)(async_to_sync(_)(request))
+
+    assert mock_optimize_queryset.call_args.kwargs["prefetch"] is False
+    assert content.decode() == f'[{{"tags":[{tag.pk}]}}]'
+
+
+@pytest.mark.django_db
+def test_render_json_async_deferred(request):
+    fake_model = FakeModel.objects.create(name="test123", is_valid=True)
+    expected = f'{{"pk":{fake_model.pk},"name":"test123","is_valid":true}}'
+
+    @render_json()
+    async def queryset(*args):
+        return FakeModel.objects.only("name")
+
+    @render_json()
+    async def model(*args):
+        return await FakeModel.objects.only("name").aget(pk=fake_model.pk)
+
+    @render_json(stream=True)
+    async def stream(*args):
+        return FakeModel.objects.only("name")
+
+    async def consume(response):
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    assert async_to_sync(queryset)(request).content.decode() == f"[{expected}]"
+    assert async_to_sync(model)(request).content.decode() == expected
+    assert async_to_sync(consume)(async_to_sync(stream)(request)).decode() == f"[{expected}]"
+
+
+@pytest.mark.django_db
+def test_render_json_async_queryset_stream(request):
+    tag = FakeTag.objects.create(name="tag")
+    FakeRelatedModel.objects.create().tags.add(tag)
+    FakeRelatedModel.objects.create()
+
+    @render_json(fields=("tags",), stream=True)
+    async def _(*args):
+        return FakeRelatedModel.objects.order_by("pk")
+
+    response = async_to_sync(_)(request)
+
+    assert response.is_async
+
+    async def consume():
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    assert async_to_sync(consume)().decode() == f'[{{"tags":[{tag.pk}]}},{{"tags":[]}}]'
+
+
+def test_render_json_etag(rf):
+    @render_json(etag=True)
+    def _(*args):
+        return {"test": 123}
+
+    response = _(rf.get("/"))
+
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('"')
+
+    not_modified_response = _(rf.get("/", headers={"If-None-Match": response.headers["ETag"]}))
+
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.content == b""
+    assert not_modified_response.headers["ETag"] == response.headers["ETag"]
+
+
+def test_render_json_etag_changed(rf):
+    @render_json(etag=True)
+    def _(*args):
+        return {"test": 123}
+
+    response = _(rf.get("/", headers={"If-None-Match": '"outdated"'}))
+
+    assert response.status_code == 200
+    assert response.content.decode() == '{"test":123}'
+
+
+def test_render_json_etag_function_skips_serialization(rf):
+    def get_etag(request, context):
+        return "v1"
+
+    @render_json(etag=get_etag)
+    def _(*args):
+        return {"test": 123}
+
+    with patch("fbv.decorators.get_json_encoder") as mock_get_json_encoder:
+        response = _(rf.get("/", headers={"If-None-Match": '"v1"'}))
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"v1"'
+    mock_get_json_encoder.assert_not_called()
+
+
+def test_render_json_etag_function_not_modified_false(rf):
+    def get_etag(request, context):
+        return "v2"
+
+    @render_json(etag=get_etag)
+    def _(*args):
+        return {"test": 123}
+
+    response = _(rf.get("/", headers={"If-None-Match": '"v1"'}))
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"v2"'
+
+
+def test_render_json_last_modified(rf):
+    updated_at = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+
+    def get_last_modified(request, context):
+        return updated_at
+
+    @render_json(last_modified=get_last_modified)
+    def _(*args):
+        return {"test": 123}
+
+    response = _(rf.get("/"))
+
+    assert response.status_code == 200
+    assert response.headers["Last-Modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    response = _(rf.get("/", headers={"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}))
+
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_render_json_last_modified_queryset_not_evaluated(rf):
+    created_at = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+    FakeRelatedModel.objects.create(price=Decimal("1.00"), created_at=created_at)
+
+    def get_last_modified(request, queryset):
+        return queryset.aggregate(Max("created_at"))["created_at__max"]
+
+    @render_json(last_modified=get_last_modified)
+    def _(*args):
+        return FakeRelatedModel.objects.all()
+
+    with CaptureQueriesContext(connection) as captured:
+        response = _(rf.get("/", headers={"If-Modified-Since": http_date(created_at.timestamp())}))
+
+    assert response.status_code == 304
+    assert len(captured.captured_queries) == 1
+
+
+def test_render_json_etag_not_dictionary(rf):
+    @render_json(etag=True)
+    def _(*args):
+        return "test123"
+
+    assert _(rf.get("/")) == "test123"
+
+
+@pytest.mark.django_db
+def test_render_json_etag_stream(rf):
+    @render_json(stream=True, etag=True)
+    def _(*args):
+        return FakeModel.objects.all()
+
+    with pytest.raises(AssertionError):
+        _(rf.get("/"))
+
+
+def test_render_json_etag_async(rf):
+    async def get_etag(request, context):
+        return "v1"
+
+    @render_json(etag=get_etag)
+    async def _(*args):
+        return {"test": 123}
+
+    response = async_to_sync(_)(rf.get("/", headers={"If-None-Match": '"v1"'}))
+
+    assert response.status_code == 304
+
+
+def test_render_json_timing(rf):
+    @render_json(timing=True)
+    def _(*args):
+        return {"test": 123}
+
+    request = rf.get("/")
+    response = _(request)
+
+    assert list(request.fbv_timings) == ["view", "serialize", "encode"]
+    assert response["Server-Timing"].count(";dur=") == 3
+
+
+def test_render_json_timing_signal(rf):
+    received = []
+
+    def receiver(sender, **kwargs):
+        received.append((sender, kwargs["timings"]))
+
+    @render_json(timing=True)
+    def _(*args):
+        return {"test": 123}
+
+    view_timed.connect(receiver)
+
+    try:
+        request = rf.get("/")
+        _(request)
+    finally:
+        view_timed.disconnect(receiver)
+
+    assert received == [(_.__wrapped__, request.fbv_timings)]
+
+
+def test_render_json_timing_existing_header(rf):
+    @render_json(timing=True)
+    def _(*args):
+        response = HttpResponse()
+        response["Server-Timing"] = "db;dur=1"
+
+        return response
+
+    response = _(rf.get("/"))
+
+    assert response["Server-Timing"].startswith("db;dur=1, view;dur=")
+
+
+def test_render_json_timing_validators(rf):
+    def get_etag(request, context):
+        return "v1"
+
+    @render_json(etag=get_etag, timing=True)
+    def _(*args):
+        return {"test": 123}
+
+    request = rf.get("/", headers={"If-None-Match": '"v1"'})
+    response = _(request)
+
+    assert response.status_code == 304
+    assert list(request.fbv_timings) == ["view", "validators"]
+
+
+@pytest.mark.django_db
+def test_render_json_timing_async(rf):
+    FakeModel.objects.create(name="test")
+
+    @render_json(timing=True)
+    async def _(*args):
+        return FakeModel.objects.all()
+
+    request = rf.get("/")
+    async_to_sync(_)(request)
+
+    assert list(request.fbv_timings) == ["view", "serialize", "encode"]
+
+
+@pytest.mark.django_db
+def test_render_json_max_queries(rf):
+    for idx in range(3):
+        FakeRelatedModel.objects.create().tags.add(FakeTag.objects.create(name=f"tag{idx}"))
+
+    @render_json(fields=("tags",), optimize=False, max_queries=2, max_queries_action="raise")
+    def _(*args):
+        return FakeRelatedModel.objects.all()
+
+    with pytest.raises(QueryBudgetExceeded) as e:
+        _(rf.get("/"))
+
+    assert "ran 4 queries" in str(e.value)
+    assert "\n3x SELECT" in str(e.value)
+
+
+@pytest.mark.django_db
+def test_render_json_max_queries_optimized(rf):
+    for idx in range(3):
+        FakeRelatedModel.objects.create().tags.add(FakeTag.objects.create(name=f"tag{idx}"))
+
+    @render_json(fields=("tags",), max_queries=2, max_queries_action="raise")
+    def _(*args):
+        return FakeRelatedModel.objects.all()
+
+    response = _(rf.get("/"))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_render_json_max_queries_setting(rf, settings):
+    settings.FBV_MAX_QUERIES = 0
+
+    @render_json
+    def _(*args):
+        return FakeModel.objects.all()
+
+    with pytest.warns(QueryBudgetWarning, match=r"test_render_json\.test_render_json_max_queries_setting"):
+        _(rf.get("/"))
+
+
+def test_render_json_max_queries_invalid_action():
+    with pytest.raises(ValueError):
+        render_json(max_queries=1, max_queries_action="explode")
+
+
+@pytest.mark.django_db
+def test_render_json_max_queries_async(rf):
+    FakeModel.objects.create(name="test")
+
+    @render_json(max_queries=0, max_queries_action="raise")
+    async def _(*args):
+        return FakeModel.objects.all()
+
+    with pytest.raises(QueryBudgetExceeded):
+        async_to_sync(_)(rf.get("/"))
+
+
+@pytest.mark.django_db
+def test_render_json_paginate_by(rf):
+    fake_models = [FakeModel.objects.create(name=f"test{idx}") for idx in range(3)]
+
+    @render_json(fields=("name",), paginate_by=2)
+    def _(*args):
+        return FakeModel.objects.all()
+
+    actual = json.loads(_(rf.get("/")).content)
+
+    assert actual["results"] == [{"name": "test0"}, {"name": "test1"}]
+
+    with CaptureQueriesContext(connection) as queries:
+        actual = json.loads(_(rf.get("/", {"cursor": actual["next"]})).content)
+
+    assert actual == {"results": [{"name": "test2"}], "next": None}
+    assert len(queries) == 1
+    assert f'"id" > {fake_models[1].pk} ORDER BY' in queries[0]["sql"]
+    assert queries[0]["sql"].endswith("LIMIT 3")
+
+
+@pytest.mark.django_db
+def test_render_json_paginate_envelope(rf):
+    FakeModel.objects.create(name="test")
+
+    def envelope(results, next_cursor):
+        return {"data": results, "links": {"next": next_cursor}}
+
+    @render_json(values_list_format="columns", paginate_by=10, paginate_envelope=envelope)
+    def _(*args):
+        return FakeModel.objects.values_list("id", "name")
+
+    actual = json.loads(_(rf.get("/")).content)
+
+    assert actual["data"]["columns"] == ["id", "name"]
+    assert actual["links"] == {"next": None}
+
+
+@pytest.mark.django_db
+def test_render_json_paginate_cursor_param(rf):
+    for idx in range(2):
+        FakeModel.objects.create(name=f"test{idx}")
+
+    @render_json(fields=("name",), paginate_by=1, cursor_field="-name", cursor_param="after")
+    def _(*args):
+        return FakeModel.objects.all()
+
+    first_page = json.loads(_(rf.get("/")).content)
+    actual = json.loads(_(rf.get("/", {"after": first_page["next"]})).content)
+
+    assert first_page["results"] == [{"name": "test1"}]
+    assert actual["results"] == [{"name": "test0"}]
+
+
+def test_render_json_paginate_invalid_cursor(rf):
+    @render_json(paginate_by=1)
+    def _(*args):
+        return FakeModel.objects.all()
+
+    with pytest.raises(BadRequest):
+        _(rf.get("/", {"cursor": "invalid!"}))
+
+
+def test_render_json_paginate_stream():
+    with pytest.raises(AssertionError):
+        render_json(paginate_by=1, stream=True)
+
+
+def test_render_json_paginate_dictionary(rf):
+    @render_json(paginate_by=1)
+    def _(*args):
+        return {"test": 123}
+
+    assert json.loads(_(rf.get("/")).content) == {"test": 123}
+
+
+@pytest.mark.django_db
+def test_render_json_paginate_async(rf):
+    tag = FakeTag.objects.create(name="tag")
+
+    for _idx in range(2):
+        FakeRelatedModel.objects.create().tags.add(tag)
+
+    @render_json(fields=("tags",), optimize=False, paginate_by=1)
+    async def _(*args):
+        return FakeRelatedModel.objects.all()
+
+    actual = json.loads(async_to_sync(_)(rf.get("/")).content)
+
+    assert actual["results"] == [{"tags": [tag.pk]}]
+    assert actual["next"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("values_list_format", "expected"),
+    (
+        ("list", [["test1"], ["test2"]]),
+        ("dict", [{"name": "test1"}, {"name": "test2"}]),
+        ("columns", {"columns": ["name"], "rows": [["test1"], ["test2"]]}),
+    ),
+)
+def test_render_json_async_queryset_values_list_stream(request, values_list_format, expected):
+    FakeModel.objects.create(name="test1")
+    FakeModel.objects.create(name="test2")
+
+    @render_json(values_list_format=values_list_format, stream=True, chunk_size=1)
+    async def _(*args):
+        return FakeModel.objects.order_by("pk").values_list("name")
+
+    response = async_to_sync(_)(request)
+
+    async def consume():
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    assert json.loads(async_to_sync(consume)()) == expected
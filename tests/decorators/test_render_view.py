@@ -1,9 +1,19 @@
+import datetime as dt
+from unittest.mock import patch
+
 import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.shortcuts import render
 from django.template.exceptions import TemplateDoesNotExist
+from django.template.loader import render_to_string
+from django.utils.translation import override
+from tests.models import FakeModel, FakeRelatedModel, FakeTag
 from tests.utils import assert_response
 from tests.views.example import three_segment_default
 
-from fbv.decorators import render_view
+from fbv.decorators import render_html, render_view
 
 
 def test(request):
@@ -107,3 +117,407 @@ def test_default_template_three_segment_module(request):
 
     # Expects template at: tests/templates/test_render_view/three_segment_default.html
     assert_response(response, content="drop-last 789")
+
+
+def test_async(request):
+    @render_view("test/template.html")
+    async def _(*args):
+        return {"test": 123}
+
+    assert iscoroutinefunction(_)
+
+    response = async_to_sync(_)(request)
+
+    assert_response(response, content="asdf 123")
+
+
+def test_async_not_dictionary(request):
+    @render_view
+    async def _(*args):
+        return "test123"
+
+    assert async_to_sync(_)(request) == "test123"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("cache_seconds", (None, 60))
+def test_async_queryset(request, clear_cache, cache_seconds):
+    FakeModel.objects.create(name="test1")
+    FakeModel.objects.create(name="test2")
+
+    @render_view("test_render_view/fake_models.html", cache=cache_seconds)
+    async def _(*args):
+        return {"fake_models": FakeModel.objects.order_by("pk")}
+
+    response = async_to_sync(_)(request)
+
+    assert_response(response, content="test1test2\n")
+
+
+@pytest.fixture
+def clear_cache():
+    cache.clear()
+
+    yield
+
+    cache.clear()
+
+
+def test_cache(request, clear_cache):
+    @render_view("test/template.html", cache=60)
+    def _(*args):
+        return {"test": 123}
+
+    with patch("fbv.decorators.render", wraps=render) as mock_render:
+        response = _(request)
+        cached_response = _(request)
+
+    assert mock_render.call_count == 1
+    assert_response(response, content="asdf 123")
+    assert_response(cached_response, content="asdf 123")
+
+
+def test_cache_different_context(request, clear_cache):
+    value = 123
+
+    @render_view("test/template.html", cache=60)
+    def _(*args):
+        return {"test": value}
+
+    assert_response(_(request), content="asdf 123")
+
+    value = 456
+
+    assert_response(_(request), content="asdf 456")
+
+
+def test_cache_model_context(request, clear_cache):
+    fake_model = FakeModel(id=1, name="test123")
+
+    @render_view("test/template.html", cache=60)
+    def _(*args):
+        return {"test": fake_model}
+
+    assert_response(_(request), content="asdf FakeModel object (1)")
+
+    with patch("fbv.decorators.render", wraps=render) as mock_render:
+        fake_model.name = "test456"
+        _(request)
+
+    assert mock_render.call_count == 1
+
+
+@pytest.mark.django_db
+def test_cache_queryset_context(request, clear_cache, django_assert_num_queries):
+    tag = FakeTag.objects.create(name="tag")
+
+    for _ in range(3):
+        FakeRelatedModel.objects.create().tags.add(tag)
+
+    @render_view("test/template.html", cache=60)
+    def _(*args):
+        return {"test": FakeRelatedModel.objects.all()}
+
+    _(request)
+
+    # The rows and the prefetched many-to-many primary keys are only queried once each for the cache key
+    with patch("fbv.decorators.render", wraps=render) as mock_render, django_assert_num_queries(2):
+        _(request)
+
+    mock_render.assert_not_called()
+
+    FakeRelatedModel.objects.first().tags.clear()
+
+    with patch("fbv.decorators.render", wraps=render) as mock_render:
+        _(request)
+
+    assert mock_render.call_count == 1
+
+
+def test_cache_custom_content_type(request, clear_cache):
+    @render_view("test/template.html", content_type="application/json", cache=60)
+    def _(*args):
+        return {"test": 123}
+
+    _(request)
+
+    assert_response(_(request), content="asdf 123", content_type="application/json")
+
+
+def test_cache_key(request, clear_cache):
+    def get_cache_key(request, template_name, context):
+        return f"{template_name}:{context['test']}"
+
+    @render_view("test/template.html", cache=60, cache_key=get_cache_key)
+    def _(*args):
+        return {"test": 123}
+
+    _(request)
+
+    assert cache.get("test/template.html:123") == (b"asdf 123", "text/html; charset=utf-8")
+
+
+def test_cache_unhashable_context(request, clear_cache):
+    @render_view("test/template.html", cache=60)
+    def _(*args):
+        return {"test": Paginator([1, 2], 10).page(1)}
+
+    with pytest.raises(AssertionError, match="cache_key"):
+        _(request)
+
+
+def test_cache_unhashable_context_cache_key(request, clear_cache):
+    def get_cache_key(request, template_name, context):
+        return f"{template_name}:{list(context['test'])}"
+
+    @render_view("test/template.html", cache=60, cache_key=get_cache_key)
+    def _(*args):
+        return {"test": Paginator([1, 2], 10).page(1)}
+
+    assert_response(_(request), content="asdf &lt;Page 1 of 1&gt;")
+
+
+def test_cache_vary_on_language(request, clear_cache):
+    @render_view("test/template.html", cache=60, cache_vary_on=("language",))
+    def _(*args):
+        return {"test": 123}
+
+    with patch("fbv.decorators.render", wraps=render) as mock_render:
+        with override("en"):
+            _(request)
+            _(request)
+
+        with override("fr"):
+            _(request)
+
+    assert mock_render.call_count == 2
+
+
+def test_cache_vary_on_invalid(request):
+    with pytest.raises(ValueError):
+
+        @render_view("test/template.html", cache=60, cache_vary_on=("invalid",))
+        def _(*args):
+            return {}
+
+
+def test_render_html_cache(request, clear_cache):
+    @render_html("test/template.html", cache=60)
+    def _(*args):
+        return {"test": 123}
+
+    with patch("fbv.decorators.render", wraps=render) as mock_render:
+        _(request)
+        _(request)
+
+    assert mock_render.call_count == 1
+
+
+def test_etag(rf):
+    @render_view("test/template.html", etag=True)
+    def _(*args):
+        return {"test": 123}
+
+    response = _(rf.get("/"))
+
+    assert_response(response, content="asdf 123")
+    assert response.headers["ETag"]
+
+    with patch("fbv.decorators.render", wraps=render) as mock_render:
+        not_modified_response = _(rf.get("/", headers={"If-None-Match": response.headers["ETag"]}))
+
+    # The template has to be rendered to compute the ETag, but the content isn't sent
+    assert mock_render.call_count == 1
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.content == b""
+
+
+def test_etag_function(rf):
+    def get_etag(request, context):
+        return f"v{context['test']}"
+
+    @render_view("test/template.html", etag=get_etag)
+    def _(*args):
+        return {"test": 123}
+
+    with patch("fbv.decorators.render", wraps=render) as mock_render:
+        response = _(rf.get("/", headers={"If-None-Match": '"v123"'}))
+
+    mock_render.assert_not_called()
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"v123"'
+
+
+def test_last_modified(rf):
+    def get_last_modified(request, context):
+        return dt.datetime(2024, 1, 1)  # noqa: DTZ001
+
+    @render_view("test/template.html", last_modified=get_last_modified)
+    def _(*args):
+        return {"test": 123}
+
+    response = _(rf.get("/"))
+
+    assert_response(response, content="asdf 123")
+    assert response.headers["Last-Modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    response = _(rf.get("/", headers={"If-Modified-Since": "Tue, 02 Jan 2024 00:00:00 GMT"}))
+
+    assert response.status_code == 304
+
+
+def test_etag_with_cache(rf, clear_cache):
+    def get_etag(request, context):
+        return "v1"
+
+    @render_view("test/template.html", cache=60, etag=get_etag)
+    def _(*args):
+        return {"test": 123}
+
+    _(rf.get("/"))
+
+    response = _(rf.get("/", headers={"If-None-Match": '"v1"'}))
+
+    assert response.status_code == 304
+
+
+def test_etag_async(rf):
+    def get_etag(request, context):
+        return "v1"
+
+    @render_view("test/template.html", etag=get_etag)
+    async def _(*args):
+        return {"test": 123}
+
+    response = async_to_sync(_)(rf.get("/", headers={"If-None-Match": '"v1"'}))
+
+    assert response.status_code == 304
+
+
+def test_timing(rf):
+    @render_view("test/template.html", timing=True)
+    def _(*args):
+        return {"test": 123}
+
+    request = rf.get("/")
+    response = _(request)
+
+    assert list(request.fbv_timings) == ["view", "template", "render"]
+    assert response["Server-Timing"].startswith("view;dur=")
+
+
+def test_timing_disabled(rf):
+    @render_view("test/template.html")
+    def _(*args):
+        return {"test": 123}
+
+    request = rf.get("/")
+    response = _(request)
+
+    assert not hasattr(request, "fbv_timings")
+    assert not response.has_header("Server-Timing")
+
+
+def test_timing_setting(rf, settings):
+    settings.FBV_TIMING = True
+
+    @render_view("test/template.html")
+    def _(*args):
+        return {"test": 123}
+
+    response = _(rf.get("/"))
+
+    assert response.has_header("Server-Timing")
+
+
+def test_timing_header_setting(rf, settings):
+    settings.FBV_TIMING_HEADER = False
+
+    @render_view("test/template.html", timing=True)
+    def _(*args):
+        return {"test": 123}
+
+    request = rf.get("/")
+    response = _(request)
+
+    assert "render" in request.fbv_timings
+    assert not response.has_header("Server-Timing")
+
+
+def test_timing_cache(rf, clear_cache):
+    @render_view("test/template.html", cache=60, timing=True)
+    def _(*args):
+        return {"test": 123}
+
+    _(rf.get("/"))
+
+    request = rf.get("/")
+    _(request)
+
+    assert list(request.fbv_timings) == ["view", "cache"]
+
+
+def test_timing_async(rf):
+    @render_view("test/template.html", timing=True)
+    async def _(*args):
+        return {"test": 123}
+
+    request = rf.get("/")
+    async_to_sync(_)(request)
+
+    assert list(request.fbv_timings) == ["view", "template", "render"]
+
+
+def test_stream(rf):
+    @render_view("stream/child.html", stream=True)
+    def _(*args):
+        return {"items": ["a", "b"]}
+
+    response = _(rf.get("/"))
+
+    assert response.streaming
+    assert b"".join(response.streaming_content) == render_to_string("stream/child.html", {"items": ["a", "b"]}).encode()
+
+
+def test_stream_missing_template(rf):
+    @render_view("missing.html", stream=True)
+    def _(*args):
+        return {}
+
+    with pytest.raises(TemplateDoesNotExist):
+        _(rf.get("/"))
+
+
+def test_stream_last_modified(rf):
+    def get_last_modified(request, context):
+        return dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+
+    @render_view("stream/child.html", stream=True, last_modified=get_last_modified)
+    def _(*args):
+        return {"items": []}
+
+    response = _(rf.get("/"))
+
+    assert response.streaming
+    assert response["Last-Modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+@pytest.mark.parametrize("kwargs", ({"cache": 60}, {"etag": True}))
+def test_stream_invalid(kwargs):
+    with pytest.raises(AssertionError):
+        render_view("stream/child.html", stream=True, **kwargs)
+
+
+def test_stream_async(rf):
+    @render_view("stream/child.html", stream=True)
+    async def _(*args):
+        return {"items": ["a"]}
+
+    response = async_to_sync(_)(rf.get("/"))
+
+    assert response.is_async
+
+    async def get_content():
+        return b"".join([chunk async for chunk in response])
+
+    assert async_to_sync(get_content)() == render_to_string("stream/child.html", {"items": ["a"]}).encode()
@@ -0,0 +1,69 @@
+import datetime as dt
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from django.utils.timezone import now
+from django.utils.translation import gettext_lazy
+
+from fbv.encoders import (
+    DEFAULT_JSON_SEPARATORS,
+    encode_json,
+    encode_orjson,
+    get_json_encoder,
+)
+
+orjson = pytest.importorskip("orjson")
+
+
+def _decode(content):
+    return content.decode() if isinstance(content, bytes) else content
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"test": 123, "list": [1, 2.5, None, True], "tuple": (1, 2)},
+        {"datetime": now()},
+        {"naive_datetime": dt.datetime(2024, 1, 2, 3, 4, 5, 678901)},  # noqa: DTZ001
+        {"date": dt.date(2024, 1, 2), "time": dt.time(3, 4, 5, 678901)},
+        {"timedelta": dt.timedelta(days=1, seconds=5)},
+        {"decimal": Decimal("1.50")},
+        {"uuid": UUID("a8098c1a-f86e-11da-bd1a-00112444be1e")},
+        {"lazy": gettext_lazy("test")},
+        {1: "int key"},
+        {"big_int": 2**70},
+    ],
+)
+def test_encode_orjson_matches_encode_json(data):
+    assert _decode(encode_orjson(data)) == encode_json(data)
+
+
+def test_encode_orjson_separators():
+    assert encode_orjson({"test": 123, "test1": 456}, DEFAULT_JSON_SEPARATORS) == '{"test": 123, "test1": 456}'
+
+
+def test_get_json_encoder_auto():
+    assert get_json_encoder("auto") is encode_orjson
+
+
+def test_get_json_encoder_json():
+    assert get_json_encoder("json") is encode_json
+
+
+def test_get_json_encoder_callable():
+    def _(data, separators):
+        return "custom"
+
+    assert get_json_encoder(_) is _
+
+
+def test_get_json_encoder_setting(settings):
+    settings.FBV_JSON_ENCODER = "json"
+
+    assert get_json_encoder() is encode_json
+
+
+def test_get_json_encoder_unknown():
+    with pytest.raises(ValueError):
+        get_json_encoder("unknown")
@@ -0,0 +1,123 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from fbv.files import FileCache, get_file_cache
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "robots.txt"
+    path.write_bytes(b"User-agent: *\n")
+
+    return path
+
+
+def test_read(text_file):
+    file_cache = FileCache(max_size=1024, max_file_size=1024, check_interval=0)
+
+    content = file_cache.read(text_file, text_file.stat())
+
+    assert content == b"User-agent: *\n"
+    assert file_cache.size == 14
+
+    with patch("pathlib.Path.read_bytes") as mock_read_bytes:
+        assert file_cache.read(text_file, text_file.stat()) is content
+
+    mock_read_bytes.assert_not_called()
+
+
+def test_read_too_large(text_file):
+    file_cache = FileCache(max_size=1024, max_file_size=10, check_interval=0)
+
+    assert file_cache.read(text_file, text_file.stat()) is None
+    assert file_cache.size == 0
+
+
+def test_read_modified(text_file):
+    file_cache = FileCache(max_size=1024, max_file_size=1024, check_interval=0)
+    file_cache.read(text_file, text_file.stat())
+
+    text_file.write_bytes(b"User-agent: *\nDisallow: /\n")
+
+    assert file_cache.read(text_file, text_file.stat()) == b"User-agent: *\nDisallow: /\n"
+    assert file_cache.size == 26
+
+
+def test_read_evicts_least_recently_used(tmp_path):
+    file_cache = FileCache(max_size=25, max_file_size=10, check_interval=0)
+    paths = []
+
+    for name in ("a", "b", "c"):
+        path = tmp_path / name
+        path.write_bytes(b"0123456789")
+        paths.append(path)
+
+    file_cache.read(paths[0], paths[0].stat())
+    file_cache.read(paths[1], paths[1].stat())
+    file_cache.read(paths[0], paths[0].stat())
+    file_cache.read(paths[2], paths[2].stat())
+
+    assert file_cache.size == 20
+    assert list(file_cache._contents) == [paths[0], paths[2]]
+
+
+def test_stat_check_interval(text_file):
+    file_cache = FileCache(max_size=1024, max_file_size=1024, check_interval=60)
+    stat = file_cache.stat(text_file)
+
+    os.utime(text_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert file_cache.stat(text_file) is stat
+
+    with patch("fbv.files.time.monotonic", return_value=10**9):
+        assert file_cache.stat(text_file).st_mtime_ns == stat.st_mtime_ns + 1_000_000_000
+
+
+def test_stat_no_check_interval(text_file):
+    file_cache = FileCache(max_size=1024, max_file_size=1024, check_interval=None)
+    stat = file_cache.stat(text_file)
+
+    text_file.write_bytes(b"changed")
+
+    with patch("fbv.files.time.monotonic", return_value=10**9):
+        assert file_cache.stat(text_file) is stat
+
+
+def test_stat_missing(tmp_path):
+    file_cache = FileCache(max_size=1024, max_file_size=1024, check_interval=60)
+
+    with pytest.raises(FileNotFoundError):
+        file_cache.stat(tmp_path / "missing")
+
+    (tmp_path / "missing").write_bytes(b"")
+
+    # Missing files are also only checked again after the interval
+    with pytest.raises(FileNotFoundError):
+        file_cache.stat(tmp_path / "missing")
+
+
+def test_clear(text_file):
+    file_cache = FileCache(max_size=1024, max_file_size=1024, check_interval=0)
+    file_cache.read(text_file, file_cache.stat(text_file))
+
+    file_cache.clear()
+
+    assert file_cache.size == 0
+    assert not file_cache._contents
+    assert not file_cache._stats
+
+
+def test_get_file_cache(settings):
+    assert get_file_cache() is None
+
+    settings.FBV_FILE_CACHE_MAX_SIZE = 1024
+    settings.FBV_FILE_CACHE_CHECK_INTERVAL = None
+
+    file_cache = get_file_cache()
+
+    assert file_cache.max_size == 1024
+    assert file_cache.max_file_size == 64 * 1024
+    assert file_cache.check_interval is None
+    assert get_file_cache() is file_cache
@@ -0,0 +1,48 @@
+import os
+
+from fbv.files import clear_file_validators_cache, get_file_validators
+
+
+def test_get_file_validators(tmp_path):
+    path = tmp_path / "test.txt"
+    path.write_text("test")
+    stat = path.stat()
+
+    (etag, last_modified) = get_file_validators(path, stat)
+
+    assert etag == f'"{stat.st_ino:x}-{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+    assert last_modified == int(stat.st_mtime)
+
+
+def test_get_file_validators_cached(tmp_path):
+    path = tmp_path / "test.txt"
+    path.write_text("test")
+
+    validators = get_file_validators(path, path.stat())
+
+    assert get_file_validators(path, path.stat()) is validators
+
+
+def test_get_file_validators_modified(tmp_path):
+    path = tmp_path / "test.txt"
+    path.write_text("test")
+    stat = path.stat()
+
+    (etag, _) = get_file_validators(path, stat)
+
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    (modified_etag, last_modified) = get_file_validators(path, path.stat())
+
+    assert modified_etag != etag
+    assert last_modified == int(stat.st_mtime) + 1
+
+
+def test_clear_file_validators_cache(tmp_path):
+    path = tmp_path / "test.txt"
+    path.write_text("test")
+
+    validators = get_file_validators(path, path.stat())
+    clear_file_validators_cache()
+
+    assert get_file_validators(path, path.stat()) is not validators
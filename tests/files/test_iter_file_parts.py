@@ -0,0 +1,56 @@
+import pytest
+
+from fbv.files import iter_file_parts
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def binary_file(tmp_path):
+    path = tmp_path / "test.bin"
+    path.write_bytes(CONTENT)
+
+    return path
+
+
+@pytest.mark.parametrize("use_mmap", (False, True))
+def test_iter_file_parts(binary_file, settings, use_mmap):
+    settings.FBV_FILE_BLOCK_SIZE = 100
+
+    chunks = list(iter_file_parts(binary_file, [(b"", 0, len(CONTENT) - 1)], use_mmap=use_mmap))
+
+    assert len(chunks) == 11
+    assert max(len(chunk) for chunk in chunks) == 100
+    assert b"".join(chunks) == CONTENT
+
+
+@pytest.mark.parametrize("use_mmap", (False, True))
+def test_iter_file_parts_ranges(binary_file, use_mmap):
+    chunks = list(
+        iter_file_parts(binary_file, [(b"a", 10, 19), (b"b", 500, 500)], b"c", use_mmap=use_mmap),
+    )
+
+    assert b"".join(chunks) == b"a" + CONTENT[10:20] + b"b" + CONTENT[500:501] + b"c"
+
+
+def test_iter_file_parts_mmap_memoryview(binary_file):
+    chunks = iter_file_parts(binary_file, [(b"", 0, 9)], use_mmap=True)
+    chunk = next(chunks)
+
+    assert isinstance(chunk, memoryview)
+    assert chunk == CONTENT[:10]
+
+    del chunk
+    chunks.close()
+
+
+def test_iter_file_parts_mmap_closed_early(binary_file, settings):
+    settings.FBV_FILE_BLOCK_SIZE = 10
+
+    chunks = iter_file_parts(binary_file, [(b"", 0, len(CONTENT) - 1)], use_mmap=True)
+    chunk = next(chunks)
+
+    # The slice is still referenced, so the map can't be closed yet
+    chunks.close()
+
+    assert bytes(chunk) == CONTENT[:10]
@@ -0,0 +1,46 @@
+import pytest
+
+from fbv.files import parse_range_header
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    (
+        ("bytes=0-9", [(0, 9)]),
+        ("bytes=5-", [(5, 99)]),
+        ("bytes=-10", [(90, 99)]),
+        ("bytes=-1000", [(0, 99)]),
+        ("bytes=90-1000", [(90, 99)]),
+        ("bytes=0-9, 20-29", [(0, 9), (20, 29)]),
+        ("bytes=20-29,0-9", [(0, 9), (20, 29)]),
+        ("bytes=0-9,5-19,20-24", [(0, 24)]),
+        ("BYTES=0-0", [(0, 0)]),
+    ),
+)
+def test_parse_range_header(header, expected):
+    assert parse_range_header(header, 100) == expected
+
+
+@pytest.mark.parametrize(
+    "header",
+    (
+        "items=0-9",
+        "bytes=",
+        "bytes=9-0",
+        "bytes=a-9",
+        "bytes=0-9,x",
+        "bytes=-",
+        ",".join(["bytes=0-0"] + [f"{i * 2}-{i * 2}" for i in range(1, 101)]),
+    ),
+)
+def test_parse_range_header_invalid(header):
+    assert parse_range_header(header, 100) is None
+
+
+@pytest.mark.parametrize("header", ("bytes=100-", "bytes=200-300", "bytes=-0"))
+def test_parse_range_header_unsatisfiable(header):
+    assert parse_range_header(header, 100) == []
+
+
+def test_parse_range_header_empty_file():
+    assert parse_range_header("bytes=-10", 0) == []
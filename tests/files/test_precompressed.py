@@ -0,0 +1,175 @@
+import gzip
+import os
+from unittest.mock import patch
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from fbv.files import (
+    compress_file,
+    get_precompressed_file,
+    get_precompressed_variants,
+    parse_accept_encoding,
+    stat_file,
+)
+
+CONTENT = b"User-agent: *\nDisallow: /admin/\n" * 100
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "robots.txt"
+    path.write_bytes(CONTENT)
+
+    return path
+
+
+def _set_mtime_ns(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip, deflate, br;q=0.9, zstd;q=0, *;q=0.1") == {
+        "gzip": 1.0,
+        "deflate": 1.0,
+        "br": 0.9,
+        "zstd": 0.0,
+        "*": 0.1,
+    }
+
+
+def test_parse_accept_encoding_empty():
+    assert parse_accept_encoding("") == {}
+
+
+def test_get_precompressed_file(rf, text_file):
+    compress_file(text_file, ("gzip",))
+
+    (path, stat, encoding) = get_precompressed_file(
+        rf.get("/", headers={"Accept-Encoding": "gzip"}), text_file, text_file.stat()
+    )
+
+    assert path == text_file.with_name("robots.txt.gz")
+    assert stat.st_size == path.stat().st_size
+    assert encoding == "gzip"
+
+
+def test_get_precompressed_file_preference(rf, text_file):
+    pytest.importorskip("brotli")
+    compress_file(text_file, ("br", "gzip"))
+
+    request = rf.get("/", headers={"Accept-Encoding": "gzip, br"})
+
+    assert get_precompressed_file(request, text_file, text_file.stat())[2] == "br"
+
+    request = rf.get("/", headers={"Accept-Encoding": "gzip, br;q=0.5"})
+
+    assert get_precompressed_file(request, text_file, text_file.stat())[2] == "gzip"
+
+
+def test_get_precompressed_file_not_accepted(rf, text_file):
+    compress_file(text_file, ("gzip",))
+
+    for accept_encoding in ("", "br", "gzip;q=0", "*;q=0"):
+        request = rf.get("/", headers={"Accept-Encoding": accept_encoding})
+
+        assert get_precompressed_file(request, text_file, text_file.stat()) is None
+
+
+def test_get_precompressed_file_wildcard(rf, text_file):
+    compress_file(text_file, ("gzip",))
+
+    request = rf.get("/", headers={"Accept-Encoding": "*"})
+
+    assert get_precompressed_file(request, text_file, text_file.stat())[2] == "gzip"
+
+
+def test_get_precompressed_file_stale(rf, text_file):
+    compress_file(text_file, ("gzip",))
+    _set_mtime_ns(text_file, text_file.with_name("robots.txt.gz").stat().st_mtime_ns + 1_000_000_000)
+
+    request = rf.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert get_precompressed_file(request, text_file, text_file.stat()) is None
+
+
+def test_get_precompressed_file_disabled(rf, text_file, settings):
+    settings.FBV_PRECOMPRESSED_ENCODINGS = ()
+    compress_file(text_file, ("gzip",))
+
+    request = rf.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert get_precompressed_file(request, text_file, text_file.stat()) is None
+
+
+def test_get_precompressed_file_invalid_setting(rf, text_file, settings):
+    settings.FBV_PRECOMPRESSED_ENCODINGS = ("deflate",)
+
+    with pytest.raises(ImproperlyConfigured):
+        get_precompressed_file(rf.get("/"), text_file, text_file.stat())
+
+
+def test_get_precompressed_variants(text_file):
+    assert get_precompressed_variants(text_file, text_file.stat()) == ()
+
+    compress_file(text_file, ("gzip",))
+
+    assert get_precompressed_variants(text_file, text_file.stat()) == ("gzip",)
+
+
+def test_get_precompressed_variants_cached(text_file, settings):
+    settings.FBV_FILE_CACHE_CHECK_INTERVAL = 60
+
+    get_precompressed_variants(text_file, text_file.stat())
+
+    with patch("fbv.files.stat_file", wraps=stat_file) as mock_stat_file:
+        assert get_precompressed_variants(text_file, text_file.stat()) == ()
+
+    mock_stat_file.assert_not_called()
+
+    # Precompressed files written by another process are found after the check interval
+    text_file.with_name("robots.txt.gz").write_bytes(gzip.compress(CONTENT))
+
+    assert get_precompressed_variants(text_file, text_file.stat()) == ()
+
+    settings.FBV_FILE_CACHE_CHECK_INTERVAL = 0
+
+    assert get_precompressed_variants(text_file, text_file.stat()) == ("gzip",)
+
+
+def test_compress_file(text_file):
+    written = compress_file(text_file, ("gzip",))
+
+    assert written == {"gzip": text_file.with_name("robots.txt.gz")}
+    assert gzip.decompress(written["gzip"].read_bytes()) == CONTENT
+
+
+def test_compress_file_brotli(text_file):
+    brotli = pytest.importorskip("brotli")
+
+    written = compress_file(text_file, ("br",))
+
+    assert brotli.decompress(written["br"].read_bytes()) == CONTENT
+
+
+def test_compress_file_zstd(text_file):
+    zstandard = pytest.importorskip("zstandard")
+
+    written = compress_file(text_file, ("zstd",))
+
+    assert zstandard.ZstdDecompressor().decompress(written["zstd"].read_bytes()) == CONTENT
+
+
+def test_compress_file_up_to_date(text_file):
+    compress_file(text_file, ("gzip",))
+
+    assert compress_file(text_file, ("gzip",)) == {}
+    assert compress_file(text_file, ("gzip",), force=True) == {"gzip": text_file.with_name("robots.txt.gz")}
+
+
+def test_compress_file_not_smaller(tmp_path):
+    path = tmp_path / "tiny.txt"
+    path.write_bytes(b"a")
+
+    assert compress_file(path, ("gzip",)) == {}
+    assert not path.with_name("tiny.txt.gz").exists()
@@ -0,0 +1,48 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+
+@pytest.fixture
+def base_dir(tmp_path, settings):
+    settings.BASE_DIR = tmp_path
+
+    (tmp_path / "robots.txt").write_bytes(b"User-agent: *\nDisallow: /admin/\n" * 100)
+    (tmp_path / "static" / "img").mkdir(parents=True)
+    (tmp_path / "static" / "img" / "github.png").write_bytes(b"\x89PNG" + b"\x00" * 1000)
+
+    return tmp_path
+
+
+def test_command(base_dir):
+    stdout = StringIO()
+
+    call_command("fbv_compress_files", "--encoding", "gzip", stdout=stdout)
+
+    # Both `file` and `favicon_file` paths in `tests/urls.py` are compressed
+    assert "Compressed robots.txt.gz" in stdout.getvalue()
+    assert "Compressed github.png.gz" in stdout.getvalue()
+    assert (base_dir / "robots.txt.gz").exists()
+    assert (base_dir / "static" / "img" / "github.png.gz").exists()
+
+
+def test_command_up_to_date(base_dir):
+    call_command("fbv_compress_files", "--encoding", "gzip", stdout=StringIO())
+
+    stdout = StringIO()
+    call_command("fbv_compress_files", "--encoding", "gzip", stdout=stdout)
+
+    assert "Wrote 0 precompressed file(s)." in stdout.getvalue()
+
+    stdout = StringIO()
+    call_command("fbv_compress_files", "--encoding", "gzip", "--force", stdout=stdout)
+
+    assert "Wrote 2 precompressed file(s)." in stdout.getvalue()
+
+
+def test_command_missing_file(tmp_path, settings):
+    settings.BASE_DIR = tmp_path
+
+    with pytest.raises(CommandError):
+        call_command("fbv_compress_files", stdout=StringIO(), stderr=StringIO())
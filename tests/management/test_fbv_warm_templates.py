@@ -0,0 +1,71 @@
+import gc
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from fbv.decorators import render_view
+from fbv.templates import get_template_names, warm_templates
+
+
+@pytest.fixture(autouse=True)
+def collect_views():
+    # Views that other tests defined with missing templates are only dropped from the weakly-referenced
+    # bound templates once they are garbage collected
+    gc.collect()
+
+
+def test_get_template_names():
+    template_names = get_template_names()
+
+    # `test_view` and `html_view` kwargs in `tests/urls.py`
+    assert "test/template.html" in template_names
+    assert "fbv/html_view.html" not in template_names
+    assert len(template_names) == len(set(template_names))
+
+
+def test_warm_templates():
+    (loaded, errors) = warm_templates()
+
+    assert "test/template.html" in loaded
+    assert errors == {}
+
+
+def test_warm_templates_missing_template():
+    @render_view("test/missing-template.html")
+    def _(*args):
+        return {}
+
+    @render_view()
+    def view_with_missing_default_template(*args):
+        return {}
+
+    (_, errors) = warm_templates()
+
+    assert "test/missing-template.html" in errors
+    assert "test_fbv_warm_templates/view_with_missing_default_template.html" not in errors
+
+
+@patch("fbv.templates.get_template")
+def test_warm_templates_uses_get_template(get_template):
+    warm_templates()
+
+    get_template.assert_any_call("test/template.html")
+
+
+def test_command():
+    stdout = StringIO()
+
+    call_command("fbv_warm_templates", stdout=stdout)
+
+    assert "Loaded test/template.html" in stdout.getvalue()
+
+
+def test_command_missing_template():
+    @render_view("test/missing-template.html")
+    def _(*args):
+        return {}
+
+    with pytest.raises(CommandError):
+        call_command("fbv_warm_templates", stdout=StringIO(), stderr=StringIO())
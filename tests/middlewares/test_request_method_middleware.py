@@ -1,6 +1,7 @@
 from unittest.mock import Mock
 
 import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
 from django.http import HttpResponse
 
 from fbv.middleware import RequestMethodMiddleware
@@ -13,7 +14,7 @@ def response():
     return res
 
 
-http_methods = ["get", "post", "patch", "head", "put", "delete", "connect", "trace"]
+http_methods = ["get", "post", "patch", "head", "put", "delete", "connect", "trace", "options"]
 
 
 @pytest.mark.parametrize("http_method", http_methods)
@@ -36,3 +37,34 @@ def test_request_method_middleware_with_client(client):
     response = client.get("/test-view")
     request = response.wsgi_request
     assert request.is_get
+
+
+def test_request_method_middleware_unknown_method(request, response):
+    request.method = "PROPFIND"
+    middleware = RequestMethodMiddleware(response)
+    middleware(request)
+
+    for method in http_methods:
+        assert getattr(request, f"is_{method}") is False
+
+
+@pytest.mark.parametrize("http_method", http_methods)
+def test_request_method_middleware_async(request, http_method: str):
+    async def get_response(request):
+        return HttpResponse()
+
+    request.method = http_method.upper()
+    middleware = RequestMethodMiddleware(get_response)
+
+    assert iscoroutinefunction(middleware)
+
+    async_to_sync(middleware)(request)
+
+    for method in http_methods:
+        assert getattr(request, f"is_{method}") is (method == http_method)
+
+
+def test_request_method_middleware_sync(response):
+    middleware = RequestMethodMiddleware(response)
+
+    assert not iscoroutinefunction(middleware)
@@ -4,3 +4,15 @@ from django.db import models
 class FakeModel(models.Model):
     name: models.CharField = models.CharField(max_length=255)
     is_valid: models.BooleanField = models.BooleanField(default=False)
+
+
+class FakeTag(models.Model):
+    name: models.CharField = models.CharField(max_length=255)
+
+
+class FakeRelatedModel(models.Model):
+    uuid: models.UUIDField = models.UUIDField(null=True)
+    price: models.DecimalField = models.DecimalField(max_digits=10, decimal_places=2, null=True)
+    created_at: models.DateTimeField = models.DateTimeField(null=True)
+    fake_model: models.ForeignKey = models.ForeignKey(FakeModel, on_delete=models.CASCADE, null=True)
+    tags: models.ManyToManyField = models.ManyToManyField(FakeTag)
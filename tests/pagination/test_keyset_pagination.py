@@ -0,0 +1,139 @@
+import datetime as dt
+
+import pytest
+from django.core.exceptions import BadRequest
+from tests.models import FakeModel, FakeRelatedModel
+
+from fbv.pagination import KeysetPagination, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def fake_models():
+    return [FakeModel.objects.create(name=name) for name in ("b", "a", "b", "c", "a")]
+
+
+def test_encode_cursor():
+    cursor = encode_cursor(["a", 1])
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 2) == ["a", 1]
+
+
+@pytest.mark.parametrize("cursor", ("not base64!", "bm90IGpzb24", encode_cursor({"a": 1}), encode_cursor([1, 2])))
+def test_decode_cursor_invalid(cursor):
+    with pytest.raises(BadRequest):
+        decode_cursor(cursor, 1)
+
+
+def test_encode_cursor_datetime():
+    value = dt.datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=dt.timezone.utc)
+
+    assert decode_cursor(encode_cursor([value]), 1) == ["2024-01-01T00:00:00.123456+00:00"]
+
+
+def test_paginate_by_invalid():
+    with pytest.raises(ValueError):
+        KeysetPagination(0)
+
+
+@pytest.mark.django_db
+def test_pages(rf, fake_models):
+    pagination = KeysetPagination(2)
+
+    (rows, cursor) = pagination.get_page(pagination.paginate(rf.get("/"), FakeModel.objects.all()))
+
+    assert rows == fake_models[:2]
+
+    (rows, cursor) = pagination.get_page(pagination.paginate(rf.get("/", {"cursor": cursor}), FakeModel.objects.all()))
+
+    assert rows == fake_models[2:4]
+
+    (rows, cursor) = pagination.get_page(pagination.paginate(rf.get("/", {"cursor": cursor}), FakeModel.objects.all()))
+
+    assert rows == fake_models[4:]
+    assert cursor is None
+
+
+@pytest.mark.django_db
+def test_non_unique_field(rf, fake_models):
+    pagination = KeysetPagination(1, cursor_field="name")
+    cursor = None
+    names = []
+
+    for _ in fake_models:
+        request = rf.get("/", {"cursor": cursor} if cursor else {})
+        (rows, cursor) = pagination.get_page(pagination.paginate(request, FakeModel.objects.all()))
+        names.extend(row.name for row in rows)
+
+    assert names == ["a", "a", "b", "b", "c"]
+    assert cursor is None
+
+
+@pytest.mark.django_db
+def test_descending(rf, fake_models):
+    pagination = KeysetPagination(3, cursor_field="-name")
+
+    (rows, cursor) = pagination.get_page(pagination.paginate(rf.get("/"), FakeModel.objects.all()))
+
+    assert [row.name for row in rows] == ["c", "b", "b"]
+
+    (rows, cursor) = pagination.get_page(pagination.paginate(rf.get("/", {"cursor": cursor}), FakeModel.objects.all()))
+
+    assert [row.name for row in rows] == ["a", "a"]
+    assert rows[0].pk > rows[1].pk
+
+
+@pytest.mark.django_db
+def test_values(rf, fake_models):
+    pagination = KeysetPagination(2, cursor_field="name")
+    queryset = FakeModel.objects.values("id", "name")
+
+    (rows, cursor) = pagination.get_page(pagination.paginate(rf.get("/"), queryset))
+
+    assert decode_cursor(cursor, 2) == ["a", rows[-1]["id"]]
+
+
+@pytest.mark.django_db
+def test_values_list(rf, fake_models):
+    pagination = KeysetPagination(2)
+    queryset = FakeModel.objects.values_list("name", "id")
+
+    (_, cursor) = pagination.get_page(pagination.paginate(rf.get("/"), queryset))
+
+    assert decode_cursor(cursor, 1) == [fake_models[1].pk]
+
+
+@pytest.mark.django_db
+def test_values_missing_field(rf, fake_models):
+    pagination = KeysetPagination(2, cursor_field="name")
+
+    with pytest.raises(AssertionError):
+        pagination.get_page(pagination.paginate(rf.get("/"), FakeModel.objects.values("id")))
+
+
+@pytest.mark.django_db
+def test_datetime_microseconds(rf):
+    created_at = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+    fake_related_models = [
+        FakeRelatedModel.objects.create(created_at=created_at + dt.timedelta(microseconds=microseconds))
+        for microseconds in (100, 200, 300, 400)
+    ]
+    pagination = KeysetPagination(2, cursor_field="created_at")
+
+    (rows, cursor) = pagination.get_page(pagination.paginate(rf.get("/"), FakeRelatedModel.objects.all()))
+
+    assert rows == fake_related_models[:2]
+
+    request = rf.get("/", {"cursor": cursor})
+    (rows, cursor) = pagination.get_page(pagination.paginate(request, FakeRelatedModel.objects.all()))
+
+    assert rows == fake_related_models[2:]
+    assert cursor is None
+
+
+@pytest.mark.django_db
+def test_invalid_cursor_value(rf):
+    pagination = KeysetPagination(1, cursor_field="created_at")
+
+    with pytest.raises(BadRequest):
+        pagination.paginate(rf.get("/", {"cursor": encode_cursor(["not a date", 1])}), FakeRelatedModel.objects.all())
@@ -0,0 +1,138 @@
+import asyncio
+import logging
+from contextlib import nullcontext
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
+from tests.models import FakeModel
+
+from fbv.queries import (
+    QueryBudget,
+    QueryBudgetExceeded,
+    QueryBudgetWarning,
+    get_query_budget,
+    get_query_shape,
+)
+
+
+def test_get_query_shape():
+    actual = get_query_shape("SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = %s")
+
+    assert actual == "SELECT * FROM t WHERE id IN (...) AND name = %s"
+
+
+@pytest.mark.django_db
+def test_within_budget():
+    with QueryBudget("test", 1, "raise") as budget:
+        list(FakeModel.objects.all())
+
+    assert len(budget.queries) == 1
+
+
+@pytest.mark.django_db
+def test_raise():
+    FakeModel.objects.create(name="test")
+
+    with pytest.raises(QueryBudgetExceeded) as e, QueryBudget("test", 2, "raise"):
+        for _ in range(3):
+            FakeModel.objects.get(name="test")
+
+    assert str(e.value).startswith("test ran 3 queries, but max_queries is 2. Repeated queries:\n3x SELECT")
+
+
+@pytest.mark.django_db
+def test_warn():
+    with pytest.warns(QueryBudgetWarning), QueryBudget("test", 0, "warn"):
+        list(FakeModel.objects.all())
+
+
+@pytest.mark.django_db
+def test_log(caplog):
+    with caplog.at_level(logging.WARNING, logger="fbv.queries"), QueryBudget("test", 0, "log"):
+        list(FakeModel.objects.all())
+
+    assert caplog.messages == ["test ran 1 queries, but max_queries is 0."]
+
+
+@pytest.mark.django_db
+def test_exception_in_block():
+    with pytest.raises(ZeroDivisionError), QueryBudget("test", 0, "raise"):
+        list(FakeModel.objects.all())
+        1 / 0  # noqa: B018
+
+
+@pytest.mark.django_db
+def test_async():
+    async def count():
+        async with QueryBudget("test", 1, "raise") as budget:
+            [obj async for obj in FakeModel.objects.all()]
+
+        return budget
+
+    assert len(async_to_sync(count)().queries) == 1
+
+
+@pytest.mark.django_db
+def test_async_concurrent():
+    queried = asyncio.Event()
+
+    async def busy():
+        async with QueryBudget("busy", 2, "raise") as budget:
+            await FakeModel.objects.acount()
+            await FakeModel.objects.acount()
+            queried.set()
+
+        return budget
+
+    async def idle():
+        async with QueryBudget("idle", 0, "raise") as budget:
+            await queried.wait()
+
+        return budget
+
+    async def count():
+        return await asyncio.gather(idle(), busy())
+
+    (idle_budget, busy_budget) = async_to_sync(count)()
+
+    assert len(idle_budget.queries) == 0
+    assert len(busy_budget.queries) == 2
+
+
+@pytest.mark.django_db
+def test_nested():
+    with QueryBudget("outer", 2, "raise") as outer:
+        list(FakeModel.objects.all())
+
+        with QueryBudget("inner", 1, "raise") as inner:
+            list(FakeModel.objects.all())
+
+    assert len(outer.queries) == 2
+    assert len(inner.queries) == 1
+
+
+def test_unknown_action():
+    with pytest.raises(ValueError):
+        QueryBudget("test", 1, "explode")
+
+
+def test_get_query_budget_disabled():
+    assert isinstance(get_query_budget("test"), nullcontext)
+
+
+def test_get_query_budget_settings(settings):
+    settings.FBV_MAX_QUERIES = 5
+    settings.FBV_MAX_QUERIES_ACTION = "raise"
+
+    budget = get_query_budget("test")
+
+    assert budget.max_queries == 5
+    assert budget.action == "raise"
+
+
+def test_get_query_budget_invalid_setting(settings):
+    settings.FBV_MAX_QUERIES_ACTION = "explode"
+
+    with pytest.raises(ImproperlyConfigured):
+        get_query_budget("test", max_queries=1)
@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+import pytest
+from django.urls import NoReverseMatch, reverse, set_script_prefix
+from django.utils.translation import override
+
+from fbv.redirects import clear_reverse_cache, get_reverse_cache_info, preload_redirects, reverse_cached
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_reverse_cache()
+
+    yield
+
+    clear_reverse_cache()
+
+
+def test_reverse_cached():
+    assert reverse_cached("test_decorator") == "/test-decorator"
+
+    with patch("fbv.redirects.reverse", wraps=reverse) as mock_reverse:
+        assert reverse_cached("test_decorator") == "/test-decorator"
+
+    mock_reverse.assert_not_called()
+    assert get_reverse_cache_info().hits == 1
+
+
+def test_reverse_cached_args():
+    assert reverse_cached("test_decorator_pk", args=(1,)) == "/test-decorator/1"
+    assert reverse_cached("test_decorator_pk", kwargs={"pk": 2}) == "/test-decorator/2"
+    assert get_reverse_cache_info().currsize == 2
+
+
+def test_reverse_cached_unhashable():
+    class UnhashablePk(int):
+        __hash__ = None
+
+    assert reverse_cached("test_decorator_pk", kwargs={"pk": UnhashablePk(3)}) == "/test-decorator/3"
+    assert get_reverse_cache_info().currsize == 0
+
+
+def test_reverse_cached_script_prefix():
+    reverse_cached("test_decorator")
+
+    set_script_prefix("/prefix/")
+
+    try:
+        assert reverse_cached("test_decorator") == "/prefix/test-decorator"
+    finally:
+        set_script_prefix("/")
+
+
+def test_reverse_cached_language(settings):
+    settings.ROOT_URLCONF = "tests.urls_i18n"
+
+    with override("en"):
+        assert reverse_cached("test_decorator") == "/en/test-decorator"
+
+    with override("fr"):
+        assert reverse_cached("test_decorator") == "/fr/test-decorator"
+
+
+def test_reverse_cached_no_match():
+    with pytest.raises(NoReverseMatch):
+        reverse_cached("missing")
+
+
+def test_reverse_cached_cleared_on_root_urlconf_change(settings):
+    reverse_cached("test_decorator")
+
+    settings.ROOT_URLCONF = "tests.urls"
+
+    assert get_reverse_cache_info().currsize == 0
+
+
+def test_preload_redirects():
+    (loaded, errors) = preload_redirects()
+
+    assert loaded == {"test_decorator": "/test-decorator"}
+    assert errors == {}
+    assert get_reverse_cache_info().currsize == 1
+
+
+def test_redirect_view_dynamic(client):
+    response = client.get("/test-redirect-dynamic/5")
+
+    assert response.status_code == 302
+    assert response.url == "/test-decorator/5"
@@ -0,0 +1,132 @@
+import json
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from django.core import serializers
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.timezone import now
+from tests.models import FakeModel, FakeRelatedModel, FakeTag
+
+from fbv.serializers import (
+    clear_field_plan_cache,
+    get_field_plan,
+    get_field_plan_cache_info,
+    serialize_model,
+    serialize_models,
+)
+
+
+def _django_serialize(objs, fields=None):
+    """
+    The output of `django.core.serializers` flattened the way `render_json` used to do it.
+    """
+
+    data = []
+
+    for obj in json.loads(serializers.serialize("json", objs, fields=fields)):
+        model_data = {}
+
+        if fields is None or "pk" in fields:
+            model_data["pk"] = obj["pk"]
+
+        if fields is not None and "id" in fields:
+            model_data["id"] = obj["pk"]
+
+        model_data.update(obj["fields"])
+        data.append(model_data)
+
+    return data
+
+
+def _dumps(data):
+    return json.dumps(data, cls=DjangoJSONEncoder)
+
+
+@pytest.fixture
+def related_models(db):
+    fake_model = FakeModel.objects.create(name="test123")
+    tag_one = FakeTag.objects.create(name="one")
+    tag_two = FakeTag.objects.create(name="two")
+
+    related_one = FakeRelatedModel.objects.create(
+        uuid=UUID("a8098c1a-f86e-11da-bd1a-00112444be1e"),
+        price=Decimal("1.50"),
+        created_at=now(),
+        fake_model=fake_model,
+    )
+    related_one.tags.add(tag_one, tag_two)
+
+    related_two = FakeRelatedModel.objects.create()
+
+    return [related_one, related_two]
+
+
+def test_serialize_model():
+    fake_model = FakeModel(id=456, name="test789")
+
+    assert serialize_model(fake_model) == {"pk": 456, "name": "test789", "is_valid": False}
+
+
+def test_serialize_model_unsaved():
+    fake_model = FakeModel(name="test789")
+
+    assert serialize_model(fake_model) == {"pk": None, "name": "test789", "is_valid": False}
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [None, (), ("pk",), ("id",), ("id", "name"), ("name", "pk", "is_valid")],
+)
+@pytest.mark.django_db
+def test_serialize_models_matches_django_serializer(fields):
+    FakeModel.objects.create(name="test123", is_valid=True)
+    FakeModel.objects.create(name="test456")
+
+    queryset = FakeModel.objects.all()
+
+    assert _dumps(serialize_models(queryset, fields=fields)) == _dumps(_django_serialize(queryset, fields=fields))
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [None, ("fake_model",), ("tags",), ("uuid", "price", "created_at")],
+)
+def test_serialize_models_related_matches_django_serializer(related_models, fields):
+    queryset = FakeRelatedModel.objects.all()
+
+    assert _dumps(serialize_models(queryset, fields=fields)) == _dumps(_django_serialize(queryset, fields=fields))
+
+
+def test_serialize_models_prefetched_m2m(related_models, django_assert_num_queries):
+    queryset = FakeRelatedModel.objects.prefetch_related("tags")
+
+    with django_assert_num_queries(2):
+        data = serialize_models(queryset, fields=("tags",))
+
+    assert data == [{"tags": [tag.pk for tag in FakeTag.objects.all()]}, {"tags": []}]
+
+
+def test_get_field_plan_is_cached():
+    clear_field_plan_cache()
+
+    plan = get_field_plan(FakeModel, ("name",))
+
+    assert get_field_plan(FakeModel, ("name",)) is plan
+    assert get_field_plan(FakeModel, ["name"]) is plan
+    assert get_field_plan(FakeModel, "name") is plan
+
+    cache_info = get_field_plan_cache_info()
+
+    assert cache_info.hits == 3
+    assert cache_info.currsize == 1
+
+
+def test_get_field_plan_cache_cleared_when_installed_apps_change(settings):
+    get_field_plan(FakeModel)
+
+    assert get_field_plan_cache_info().currsize > 0
+
+    settings.INSTALLED_APPS = [*settings.INSTALLED_APPS, "django.contrib.contenttypes"]
+
+    assert get_field_plan_cache_info().currsize == 0
@@ -0,0 +1,63 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.template import engines
+from django.template.loader import get_template, render_to_string
+
+from fbv.streaming import astream_template, stream_template
+
+
+@pytest.mark.parametrize("template_name", ("test/template.html", "stream/base.html", "stream/child.html"))
+def test_same_as_render(rf, template_name):
+    context = {"test": 123, "items": ["a", "<b>"]}
+    request = rf.get("/")
+
+    actual = "".join(stream_template(get_template(template_name), context, request))
+
+    assert actual == render_to_string(template_name, context, request)
+
+
+def test_chunks(rf):
+    chunks = list(stream_template(get_template("stream/child.html"), {"items": ["a", "b"]}, rf.get("/")))
+
+    assert chunks[0] == "<head>"
+    assert chunks[1] == "<title>base</title>"
+    assert chunks[2] == '<link rel="stylesheet">'
+    assert "<p>a</p><p>b</p>" in chunks
+
+
+def test_lazy(rf):
+    def get_items():
+        raise ZeroDivisionError
+
+    chunks = stream_template(get_template("stream/child.html"), {"items": get_items}, rf.get("/"))
+
+    assert next(chunks) == "<head>"
+
+    with pytest.raises(ZeroDivisionError):
+        list(chunks)
+
+
+def test_context_processors(rf):
+    request = rf.get("/")
+    template = engines["django"].from_string("{{ request.path }}")
+
+    assert list(stream_template(template, {}, request)) == ["/"]
+
+
+def test_other_backend():
+    class Template:
+        def render(self, context=None, request=None):  # noqa: ARG002
+            return "rendered"
+
+    assert list(stream_template(Template(), {})) == ["rendered"]
+
+
+def test_async(rf):
+    async def get_chunks():
+        template = get_template("stream/child.html")
+
+        return [chunk async for chunk in astream_template(template, {"items": ["a"]}, rf.get("/"))]
+
+    actual = "".join(async_to_sync(get_chunks)())
+
+    assert actual == render_to_string("stream/child.html", {"items": ["a"]})
@@ -11,11 +11,13 @@ def test_view(request):
 
 urlpatterns = (
     path("test-decorator", test_view, name="test_decorator"),
+    path("test-decorator/<int:pk>", test_view, name="test_decorator_pk"),
     path("test-view", html_view, {"template_name": "test/template.html"}),
     path("robots.txt", file, {"file_path": "robots.txt"}),
     path("favicon-file.ico", favicon_file, {"file_path": "static/img/github.png"}),
     path("favicon-emoji.ico", favicon_emoji, {"emoji": "✨"}),
     path("test-redirect-302", redirect_view, {"pattern_name": "test_decorator"}),
+    path("test-redirect-dynamic/<int:pk>", redirect_view, {"pattern_name": "test_decorator_pk"}),
     path(
         "test-redirect-301",
         redirect_view,
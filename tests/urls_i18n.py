@@ -0,0 +1,8 @@
+from django.conf.urls.i18n import i18n_patterns
+from django.urls import path
+
+from tests.urls import test_view
+
+urlpatterns = i18n_patterns(
+    path("test-decorator", test_view, name="test_decorator"),
+)
@@ -1,3 +1,6 @@
+from fbv.views import _get_favicon_emoji_svg, favicon_emoji
+
+
 def test(client):
     expected = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
 <text y=".9em" font-size="90">✨</text>
@@ -9,3 +12,30 @@ def test(client):
     assert actual["Cache-Control"] == "max-age=86400, immutable, public"
     assert actual.headers["Content-Type"] == "image/svg+xml"
     assert expected == actual.content.decode()
+
+
+def test_etag(client):
+    etag = client.get("/favicon-emoji.ico").headers["ETag"]
+
+    actual = client.get("/favicon-emoji.ico", headers={"If-None-Match": etag})
+
+    assert actual.status_code == 304
+    assert actual.headers["ETag"] == etag
+    assert actual.content == b""
+
+
+def test_etag_different_emoji(rf):
+    request = rf.get("/")
+
+    assert favicon_emoji(request, "✨").headers["ETag"] != favicon_emoji(request, "🎉").headers["ETag"]
+
+
+def test_cached(rf):
+    request = rf.get("/")
+    _get_favicon_emoji_svg.cache_clear()
+
+    favicon_emoji(request, "✨")
+    favicon_emoji(request, "✨")
+
+    assert _get_favicon_emoji_svg.cache_info().hits == 1
+    assert _get_favicon_emoji_svg.cache_info().misses == 1
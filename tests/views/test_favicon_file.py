@@ -20,3 +20,11 @@ def test_missing(request):
 
     with pytest.raises(FileNotFoundError):
         favicon_file(request, "bad-file-path")
+
+
+def test_if_none_match(client):
+    etag = client.get("/favicon-file.ico").headers["ETag"]
+
+    actual = client.get("/favicon-file.ico", headers={"If-None-Match": etag})
+
+    assert actual.status_code == 304
@@ -1,5 +1,14 @@
+import mmap
+from unittest.mock import patch
+
 import pytest
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
+from django.http import FileResponse
+from django.utils.http import http_date
+from tests.utils import assert_response
 
+from fbv.files import compress_file
 from fbv.views import file
 
 
@@ -20,3 +29,339 @@ def test_missing(request):
 
     with pytest.raises(FileNotFoundError):
         file(request, "bad-file-path")
+
+
+def test_sendfile_nginx(client, settings):
+    settings.FBV_SENDFILE_BACKEND = "nginx"
+    settings.FBV_SENDFILE_ROOT = "/internal/"
+
+    actual = client.get("/robots.txt")
+
+    assert actual.status_code == 200
+    assert actual.headers["X-Accel-Redirect"] == "/internal/robots.txt"
+    assert actual.headers["Content-Type"] == "text/plain"
+    assert actual.content == b""
+
+
+def test_sendfile_nginx_missing_root(client, settings):
+    settings.FBV_SENDFILE_BACKEND = "nginx"
+
+    with pytest.raises(ImproperlyConfigured):
+        client.get("/robots.txt")
+
+
+def test_sendfile_apache(client, settings):
+    settings.FBV_SENDFILE_BACKEND = "apache"
+
+    actual = client.get("/robots.txt")
+
+    assert actual.headers["X-Sendfile"] == str((settings.BASE_DIR / "robots.txt").absolute())
+    assert actual.content == b""
+
+
+def test_sendfile_lighttpd_root(client, settings):
+    settings.FBV_SENDFILE_BACKEND = "lighttpd"
+    settings.FBV_SENDFILE_ROOT = "/srv/app"
+
+    actual = client.get("/robots.txt")
+
+    assert actual.headers["X-Lighttpd-Send-File"] == "/srv/app/robots.txt"
+
+
+def test_sendfile_unknown_backend(client, settings):
+    settings.FBV_SENDFILE_BACKEND = "invalid"
+
+    with pytest.raises(ImproperlyConfigured):
+        client.get("/robots.txt")
+
+
+def test_sendfile_missing(request, settings):
+    settings.FBV_SENDFILE_BACKEND = "apache"
+    request.method = "GET"
+    request.META = {}
+
+    with pytest.raises(FileNotFoundError):
+        file(request, "bad-file-path")
+
+
+def test_accept_ranges(client):
+    actual = client.get("/robots.txt")
+
+    assert actual.headers["Accept-Ranges"] == "bytes"
+
+
+def test_range(client):
+    actual = client.get("/robots.txt", headers={"Range": "bytes=0-9"})
+
+    assert actual.status_code == 206
+    assert actual.headers["Content-Range"] == "bytes 0-9/14"
+    assert actual.headers["Content-Length"] == "10"
+    assert actual.headers["Content-Type"] == "text/plain"
+    assert b"".join(actual.streaming_content) == b"User-agent"
+
+
+def test_range_suffix(client):
+    actual = client.get("/robots.txt", headers={"Range": "bytes=-3"})
+
+    assert actual.status_code == 206
+    assert actual.headers["Content-Range"] == "bytes 11-13/14"
+    assert b"".join(actual.streaming_content) == b" *\n"
+
+
+def test_range_multiple(client):
+    actual = client.get("/robots.txt", headers={"Range": "bytes=0-3,11-13"})
+
+    assert actual.status_code == 206
+    assert actual.headers["Content-Type"].startswith("multipart/byteranges; boundary=")
+
+    boundary = actual.headers["Content-Type"].split("boundary=")[1]
+    content = b"".join(actual.streaming_content)
+
+    assert int(actual.headers["Content-Length"]) == len(content)
+    assert (
+        content
+        == (
+            f"\r\n--{boundary}\r\nContent-Type: text/plain\r\nContent-Range: bytes 0-3/14\r\n\r\nUser"
+            f"\r\n--{boundary}\r\nContent-Type: text/plain\r\nContent-Range: bytes 11-13/14\r\n\r\n *\n"
+            f"\r\n--{boundary}--\r\n"
+        ).encode()
+    )
+
+
+def test_range_unsatisfiable(client):
+    actual = client.get("/robots.txt", headers={"Range": "bytes=100-"})
+
+    assert actual.status_code == 416
+    assert actual.headers["Content-Range"] == "bytes */14"
+
+
+def test_range_invalid(client):
+    actual = client.get("/robots.txt", headers={"Range": "bytes=9-0"})
+
+    assert actual.status_code == 200
+    assert len(b"".join(actual.streaming_content)) == 14
+
+
+def test_if_range_matches(client, settings):
+    last_modified = http_date((settings.BASE_DIR / "robots.txt").stat().st_mtime)
+
+    actual = client.get("/robots.txt", headers={"Range": "bytes=0-3", "If-Range": last_modified})
+
+    assert actual.status_code == 206
+
+
+def test_if_range_changed(client):
+    actual = client.get(
+        "/robots.txt",
+        headers={"Range": "bytes=0-3", "If-Range": "Mon, 01 Jan 2024 00:00:00 GMT"},
+    )
+
+    assert actual.status_code == 200
+
+
+def test_validators(client):
+    actual = client.get("/robots.txt")
+
+    assert actual.headers["ETag"].startswith('"')
+    assert actual.headers["Last-Modified"]
+
+
+def test_if_none_match(client):
+    etag = client.get("/robots.txt").headers["ETag"]
+
+    with patch("pathlib.Path.open") as mock_open:
+        actual = client.get("/robots.txt", headers={"If-None-Match": etag})
+
+    mock_open.assert_not_called()
+    assert actual.status_code == 304
+    assert actual.headers["ETag"] == etag
+    assert actual.content == b""
+
+
+def test_if_modified_since(client):
+    last_modified = client.get("/robots.txt").headers["Last-Modified"]
+
+    actual = client.get("/robots.txt", headers={"If-Modified-Since": last_modified})
+
+    assert actual.status_code == 304
+
+
+def test_if_none_match_changed(client):
+    actual = client.get("/robots.txt", headers={"If-None-Match": '"outdated"'})
+
+    assert actual.status_code == 200
+    assert len(b"".join(actual.streaming_content)) == 14
+
+
+def test_if_range_etag(client):
+    etag = client.get("/robots.txt").headers["ETag"]
+
+    actual = client.get("/robots.txt", headers={"Range": "bytes=0-3", "If-Range": etag})
+
+    assert actual.status_code == 206
+
+
+def test_if_range_weak_etag(client):
+    etag = client.get("/robots.txt").headers["ETag"]
+
+    actual = client.get("/robots.txt", headers={"Range": "bytes=0-3", "If-Range": f"W/{etag}"})
+
+    assert actual.status_code == 200
+
+
+@pytest.fixture
+def precompressed_base_dir(tmp_path, settings):
+    settings.BASE_DIR = tmp_path
+
+    path = tmp_path / "robots.txt"
+    path.write_bytes(b"User-agent: *\nDisallow: /admin/\n" * 100)
+    compress_file(path, ("gzip",))
+
+    return tmp_path
+
+
+def test_precompressed(client, precompressed_base_dir):
+    actual = client.get("/robots.txt", headers={"Accept-Encoding": "gzip, deflate"})
+
+    assert actual.status_code == 200
+    assert actual.headers["Content-Encoding"] == "gzip"
+    assert actual.headers["Content-Type"] == "text/plain"
+    assert actual.headers["Vary"] == "Accept-Encoding"
+    assert actual.headers["Content-Disposition"] == 'inline; filename="robots.txt"'
+    assert b"".join(actual.streaming_content) == (precompressed_base_dir / "robots.txt.gz").read_bytes()
+
+
+def test_precompressed_not_accepted(client, precompressed_base_dir):
+    actual = client.get("/robots.txt")
+
+    assert "Content-Encoding" not in actual.headers
+    assert actual.headers["Vary"] == "Accept-Encoding"
+    assert b"".join(actual.streaming_content) == (precompressed_base_dir / "robots.txt").read_bytes()
+
+
+def test_precompressed_missing(client):
+    actual = client.get("/robots.txt", headers={"Accept-Encoding": "gzip, br"})
+
+    assert "Content-Encoding" not in actual.headers
+    assert "Vary" not in actual.headers
+
+
+def test_precompressed_etag(client, precompressed_base_dir):
+    etag = client.get("/robots.txt").headers["ETag"]
+    compressed_etag = client.get("/robots.txt", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+
+    assert etag != compressed_etag
+
+    actual = client.get("/robots.txt", headers={"Accept-Encoding": "gzip", "If-None-Match": compressed_etag})
+
+    assert actual.status_code == 304
+    assert actual.headers["Vary"] == "Accept-Encoding"
+
+
+def test_precompressed_range(client, precompressed_base_dir):
+    actual = client.get("/robots.txt", headers={"Accept-Encoding": "gzip", "Range": "bytes=0-1"})
+
+    assert actual.status_code == 206
+    assert actual.headers["Content-Encoding"] == "gzip"
+    assert actual.headers["Content-Type"] == "text/plain"
+    assert b"".join(actual.streaming_content) == b"\x1f\x8b"
+
+
+def test_precompressed_sendfile(client, precompressed_base_dir, settings):
+    settings.FBV_SENDFILE_BACKEND = "apache"
+
+    actual = client.get("/robots.txt", headers={"Accept-Encoding": "gzip"})
+
+    assert actual.headers["X-Sendfile"].endswith("robots.txt")
+    assert "Content-Encoding" not in actual.headers
+
+
+def test_file_cache(client, settings):
+    settings.FBV_FILE_CACHE_MAX_SIZE = 1024
+
+    client.get("/robots.txt")
+
+    with patch("pathlib.Path.open") as mock_open, patch("pathlib.Path.read_bytes") as mock_read_bytes:
+        actual = client.get("/robots.txt")
+
+    mock_open.assert_not_called()
+    mock_read_bytes.assert_not_called()
+    assert_response(actual, content="User-agent: *\n", content_type="text/plain")
+    assert actual.headers["Content-Length"] == "14"
+    assert actual.headers["Content-Disposition"] == 'inline; filename="robots.txt"'
+    assert actual.headers["ETag"]
+
+
+def test_file_cache_too_large(client, settings):
+    settings.FBV_FILE_CACHE_MAX_SIZE = 1024
+    settings.FBV_FILE_CACHE_MAX_FILE_SIZE = 10
+
+    actual = client.get("/robots.txt")
+
+    assert actual.streaming
+
+
+def test_mmap(client, settings):
+    settings.FBV_FILE_MMAP_MIN_SIZE = 1
+
+    with patch("fbv.files.mmap.mmap", wraps=mmap.mmap) as mock_mmap:
+        actual = client.get("/robots.txt")
+        content = b"".join(actual.streaming_content)
+
+    assert mock_mmap.call_count == 1
+    assert content == b"User-agent: *\n"
+    assert actual.headers["Content-Length"] == "14"
+    assert actual.headers["Content-Type"] == "text/plain"
+    assert actual.headers["Content-Disposition"] == 'inline; filename="robots.txt"'
+
+
+def test_mmap_range(client, settings):
+    settings.FBV_FILE_MMAP_MIN_SIZE = 1
+
+    with patch("fbv.files.mmap.mmap", wraps=mmap.mmap) as mock_mmap:
+        actual = client.get("/robots.txt", headers={"Range": "bytes=0-3,11-13"})
+        content = b"".join(actual.streaming_content)
+
+    assert mock_mmap.call_count == 1
+    assert actual.status_code == 206
+    assert b"\r\n\r\nUser\r\n" in content
+
+
+def test_mmap_asgi(async_client, settings):
+    settings.FBV_FILE_MMAP_MIN_SIZE = 1
+
+    async def get_content(headers):
+        response = await async_client.get("/robots.txt", headers=headers)
+
+        return (response, b"".join([chunk async for chunk in response.streaming_content]))
+
+    (actual, content) = async_to_sync(get_content)({})
+
+    assert actual.is_async
+    assert content == b"User-agent: *\n"
+
+    (actual, content) = async_to_sync(get_content)({"Range": "bytes=0-3"})
+
+    assert actual.is_async
+    assert actual.status_code == 206
+    assert content == b"User"
+
+
+def test_mmap_too_small(client, settings):
+    settings.FBV_FILE_MMAP_MIN_SIZE = 1024
+
+    with patch("fbv.files.mmap.mmap") as mock_mmap:
+        b"".join(client.get("/robots.txt").streaming_content)
+
+    mock_mmap.assert_not_called()
+
+
+def test_mmap_wsgi_file_wrapper(rf, settings):
+    settings.FBV_FILE_MMAP_MIN_SIZE = 1
+
+    request = rf.get("/robots.txt")
+    request.META["wsgi.file_wrapper"] = object()
+
+    actual = file(request, "robots.txt")
+
+    assert isinstance(actual, FileResponse)